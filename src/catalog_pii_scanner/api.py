@@ -1,13 +1,32 @@
 from __future__ import annotations
 
-from fastapi import FastAPI
+from typing import TYPE_CHECKING, Any
 
 from . import __version__
 
-app = FastAPI(title="Catalog PII Scanner API", version=__version__)
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from fastapi import FastAPI
+
+    app: FastAPI
 
 
-@app.get("/healthz")
 def healthz() -> dict[str, str]:
     """Simple health check endpoint."""
     return {"status": "ok", "version": __version__}
+
+
+def create_app() -> FastAPI:
+    """Build the API application. FastAPI/Starlette are only imported here."""
+    from fastapi import FastAPI
+
+    application = FastAPI(title="Catalog PII Scanner API", version=__version__)
+    application.get("/healthz")(healthz)
+    return application
+
+
+def __getattr__(name: str) -> Any:
+    # `catalog_pii_scanner.api:app` keeps working for uvicorn/tests; built on first access
+    if name == "app":
+        value = globals()["app"] = create_app()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,32 +1,82 @@
 from __future__ import annotations
 
+import importlib
 import json
+import sys
+import threading
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, cast
 
 import typer
-import uvicorn
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional fast path
+    orjson = None  # type: ignore
 
 from . import __version__
-from .config import validate_config_file
-from .connectors.glue import GlueCatalogClient
-from .connectors.hms import HiveMetastoreClient
-from .connectors.unity import UnityCatalogClient
-from .datasets import generate_synthetic, load_jsonl, save_jsonl
-from .db import (
-    Column as DBColumn,
-)
-from .db import (
-    Finding,
-    add_finding,
-    init_db,
-    session_scope,
-    upsert_column,
-)
-from .embeddings import EmbedModel
-from .ensemble import Calibrator, Ensemble
-from .eval import calibrate_on_dataset, run_eval
-from .pii_types import PIIType
-from .rules import propose_candidates
+from .pii_types import ALL_PII_TYPES
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from sqlalchemy.orm import Session, sessionmaker
+
+    from .ensemble import Ensemble
+
+# Heavy dependencies (boto3, Thrift, SQLAlchemy, sklearn, uvicorn) are imported inside
+# the commands that need them so `cps --help` / `cps --version` stay fast. Connector
+# clients resolve lazily through module __getattr__ so `cli.<Client>` remains patchable.
+_LAZY_ATTRS = {
+    "GlueCatalogClient": ".connectors.glue",
+    "GlueColumn": ".connectors.glue",
+    "UnityCatalogClient": ".connectors.unity",
+    "UnityColumn": ".connectors.unity",
+    "HiveMetastoreClient": ".connectors.hms",
+    "HMSColumn": ".connectors.hms",
+}
+
+
+def __getattr__(name: str) -> Any:
+    mod = _LAZY_ATTRS.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(mod, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _new_client(name: str) -> Any:
+    return getattr(sys.modules[__name__], name)()
+
+
+def _json_dumps(obj: Any, *, indent: bool = False) -> bytes:
+    if orjson is not None:
+        opt = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return cast(bytes, orjson.dumps(obj, option=opt))
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _stdout_writer() -> Callable[[bytes], Any]:
+    """Return a bytes writer for stdout, bypassing the text layer when possible."""
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is None:  # pragma: no cover - exotic stdout replacements
+        return lambda data: sys.stdout.write(data.decode("utf-8"))
+    sys.stdout.flush()  # keep ordering with anything already echoed
+    return cast(Callable[[bytes], Any], buf.write)
+
+
+def _emit_json(obj: Any, *, indent: bool = False) -> None:
+    _stdout_writer()(_json_dumps(obj, indent=indent) + b"\n")
+
+
+def _json_loads(raw: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 app = typer.Typer(help="Catalog PII Scanner CLI")
 config_app = typer.Typer(help="Config utilities")
@@ -34,6 +84,58 @@ config_app = typer.Typer(help="Config utilities")
 # Define option defaults at module scope to satisfy Ruff B008
 TYPE_OPT = typer.Option([], "--type", help="Detected PII type(s), e.g., EMAIL. Can repeat.")
 
+# Order of the per-type ``probs`` list emitted by scan-text / scan-texts
+_TYPE_ORDER = tuple(t.value for t in ALL_PII_TYPES)
+
+_T = TypeVar("_T")
+
+
+def _apply_tags_parallel(
+    apply_batch: Callable[[list[_T]], object],
+    items: Iterable[_T],
+    *,
+    table_key: Callable[[_T], Hashable],
+    max_in_flight: int = 8,
+) -> None:
+    """Apply catalog write-backs on a bounded thread pool.
+
+    Tag updates are read-modify-write on the owning table, so each run of a table's
+    columns is handed to ``apply_batch`` as one list while different tables proceed
+    concurrently. Batches of the same table never overlap: a listing without a row-order
+    guarantee (e.g. information_schema) may split a table into several runs, and those
+    are serialized on a per-table lock. ``items`` is consumed lazily, so a streaming
+    producer overlaps with tagging; at most ``2 * max_in_flight`` table batches are
+    queued ahead of the workers. ``max_in_flight=1`` applies every batch on the calling
+    thread instead.
+    """
+    workers = max(1, max_in_flight)
+    if workers == 1:
+        # Everything on the calling thread, for clients that must not be shared
+        for _, grp in groupby(items, key=table_key):
+            apply_batch(list(grp))
+        return
+    slots = threading.BoundedSemaphore(2 * workers)
+    # Only this thread adds entries; workers get their lock passed in
+    table_locks: dict[Hashable, threading.Lock] = {}
+
+    def _run(lock: threading.Lock, group: list[_T]) -> None:
+        try:
+            with lock:
+                apply_batch(group)
+        finally:
+            slots.release()
+
+    futures = []
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for key, grp in groupby(items, key=table_key):
+            batch = list(grp)
+            lock = table_locks.setdefault(key, threading.Lock())
+            slots.acquire()
+            futures.append(ex.submit(_run, lock, batch))
+    for fut in futures:
+        # Surface the first failure after all submitted work has settled
+        fut.result()
+
 
 def version_callback(value: bool) -> None:
     if value:
@@ -54,6 +156,290 @@ def main_callback(
     """Top-level callback for global options (e.g., --version)."""
 
 
+@lru_cache(maxsize=8)
+def _cached_init_db(db_url: str) -> sessionmaker[Session]:
+    """Per-process ``init_db``: schema setup and the engine pool are built once per URL."""
+    from .db import init_db
+
+    return init_db(db_url)
+
+
+def _persist_target_findings(
+    db: str,
+    rows: Iterable[tuple[str, str, str, str, str | None]],
+    *,
+    types: list[str],
+    confidence: float,
+    hit_rate: float,
+    model_version: str,
+    source: str,
+) -> None:
+    """Write one finding per enumerated column in a single batched transaction."""
+    from .db import add_findings_bulk, session_scope
+
+    Session = _cached_init_db(db)
+    with session_scope(Session) as s:
+        n = add_findings_bulk(
+            s,
+            rows,
+            types=types,
+            confidence=confidence,
+            hit_rate=hit_rate,
+            model_version=model_version,
+            source=source,
+        )
+    # stderr keeps stdout a single JSON document
+    typer.echo(f"Persisted {n} findings to {db}", err=True)
+
+
+def _glue_to_dict(gc: Any) -> dict[str, Any]:
+    return {
+        "ref": gc.ref,
+        "database": gc.database,
+        "table": gc.table,
+        "column": gc.name,
+        "type": gc.type,
+        "comment": gc.comment,
+        "parameters": gc.parameters,
+    }
+
+
+def _unity_to_dict(uc: Any) -> dict[str, Any]:
+    return {
+        "ref": uc.ref,
+        "catalog": uc.catalog,
+        "schema": uc.schema,
+        "table": uc.table,
+        "column": uc.name,
+        "type": uc.type,
+        "comment": uc.comment,
+        "properties": dict(uc.properties),
+    }
+
+
+def _hms_to_dict(hc: Any) -> dict[str, Any]:
+    return {
+        "ref": hc.ref,
+        "database": hc.database,
+        "table": hc.table,
+        "column": hc.name,
+        "type": hc.type,
+        "comment": hc.comment,
+        "properties": dict(hc.properties),
+    }
+
+
+class _Connector(NamedTuple):
+    client: str  # lazily resolved attribute of this module
+    column: str  # column dataclass, used to rehydrate cached listings
+    pattern_args: tuple[str, ...]  # iter_columns keyword per URI path segment
+    location: tuple[str, ...]  # column attributes identifying the owning table
+    to_dict: Callable[[Any], dict[str, Any]]
+    endpoint_env: tuple[str, ...]  # env vars selecting the remote catalog (cache key)
+
+
+_CONNECTORS: dict[str, _Connector] = {
+    "glue": _Connector(
+        "GlueCatalogClient",
+        "GlueColumn",
+        ("db_patterns", "table_patterns"),
+        ("database", "table"),
+        _glue_to_dict,
+        ("AWS_REGION", "AWS_ENDPOINT_URL", "GLUE_ENDPOINT_URL"),
+    ),
+    "unity": _Connector(
+        "UnityCatalogClient",
+        "UnityColumn",
+        ("catalog_patterns", "schema_patterns", "table_patterns"),
+        ("catalog", "schema", "table"),
+        _unity_to_dict,
+        ("DATABRICKS_HOST", "DATABRICKS_HTTP_PATH", "DATABRICKS_WAREHOUSE_ID"),
+    ),
+    "hms": _Connector(
+        "HiveMetastoreClient",
+        "HMSColumn",
+        ("db_patterns", "table_patterns"),
+        ("database", "table"),
+        _hms_to_dict,
+        ("HMS_HOST", "HMS_PORT"),
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_target(rest: str, depth: int) -> tuple[tuple[str, ...], ...]:
+    """Split the path of a target URI into ``depth`` pattern tuples (missing/``*`` -> ``*``)."""
+    parts = [p for p in rest.strip().split("/") if p]
+    return tuple(
+        (parts[i],) if i < len(parts) and parts[i] != "*" else ("*",) for i in range(depth)
+    )
+
+
+def _cached_iter(
+    scheme: str,
+    conn: _Connector,
+    client: Callable[[], Any],
+    patterns: dict[str, list[str]],
+    *,
+    ttl: float,
+    cache_dir: str | None,
+) -> Iterator[Any]:
+    """Stream columns, serving repeat listings from a TTL'd on-disk JSON index.
+
+    The cache key covers the scheme, the patterns and the endpoint env vars so
+    different catalogs never share entries. ``ttl <= 0`` disables the cache. A fresh
+    listing is only published once it has been consumed completely.
+    """
+    if ttl <= 0:
+        yield from client().iter_columns(**patterns)
+        return
+    import dataclasses
+    import hashlib
+    import os
+    import tempfile
+    import time
+
+    endpoint = [os.getenv(k, "") for k in conn.endpoint_env]
+    key = hashlib.sha1(
+        json.dumps([scheme, patterns, endpoint], sort_keys=True).encode("utf-8"),
+        usedforsecurity=False,
+    ).hexdigest()
+    root = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "cps"
+    path = root / f"{key}.json"
+    col_cls = getattr(sys.modules[__name__], conn.column)
+    cached = None
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            cached = [col_cls(**d) for d in _json_loads(path.read_bytes())]
+    except (OSError, ValueError, TypeError):
+        pass  # missing, unreadable or stale-format entry: re-enumerate
+    if cached is not None:
+        yield from cached
+        return
+
+    rows = []
+    fields = dataclasses.fields(col_cls)
+    for c in client().iter_columns(**patterns):
+        # Shallow per-field copy: asdict would deep-copy, and cannot copy read-only
+        # MappingProxyType properties at all
+        row = {f.name: getattr(c, f.name) for f in fields}
+        for k, v in row.items():
+            if isinstance(v, Mapping):
+                row[k] = dict(v)
+        rows.append(row)
+        yield c
+    root.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=root, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(_json_dumps(rows))
+        os.replace(tmp, path)  # atomic publish for concurrent scans
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _enumerate_and_maybe_apply(
+    scheme: str,
+    conn: _Connector,
+    rest: str,
+    *,
+    apply: bool,
+    dry_run: bool,
+    db: str,
+    pii_types: list[str],
+    append_comment: str | None,
+    confidence: float,
+    hit_rate: float,
+    model_version: str,
+    source: str,
+    cache_ttl: float = 0,
+    cache_dir: str | None = None,
+) -> None:
+    patterns = {
+        arg: list(pats)
+        for arg, pats in zip(
+            conn.pattern_args, _parse_target(rest, len(conn.pattern_args)), strict=True
+        )
+    }
+    clients: list[Any] = []
+
+    def _client() -> Any:
+        # Only connect when the listing is not cached or tags must be written
+        if not clients:
+            clients.append(_new_client(conn.client))
+        return clients[0]
+
+    cols = _cached_iter(scheme, conn, _client, patterns, ttl=cache_ttl, cache_dir=cache_dir)
+
+    def _table_of(c: Any) -> tuple[str, ...]:
+        return tuple(getattr(c, f) for f in conn.location)
+
+    # Two-level catalogs (Glue/HMS) use the scheme as the catalog name
+    prefix = (scheme,) if len(conn.location) == 2 else ()
+    rows: list[tuple[str, str, str, str, str | None]] = []
+
+    def _stream() -> Iterator[Any]:
+        # Emit the summary JSON incrementally: output starts with the first column and
+        # memory stays flat unless --dry-run needs the rows afterwards.
+        write = _stdout_writer()
+        count = 0
+        write(b'{"columns": [')
+        for c in cols:
+            write(b",\n  " if count else b"\n  ")
+            write(_json_dumps(conn.to_dict(c)))
+            count += 1
+            if dry_run:
+                rows.append((*prefix, *_table_of(c), c.name, c.type))
+            yield c
+        write(b"\n" if count else b"")
+        write(b'], "count": %d}\n' % count)
+
+    if apply:
+        client = _client()
+        batch_update = getattr(client, "update_column_tags_batch", None)
+
+        def _apply_table(group: list[Any]) -> None:
+            loc = dict(zip(conn.location, _table_of(group[0]), strict=True))
+            if batch_update is not None:
+                # One read-modify-write of the table for all of its columns
+                batch_update(
+                    **loc, updates={c.name: (True, pii_types, append_comment) for c in group}
+                )
+                return
+            for c in group:
+                client.update_column_tags(
+                    **loc,
+                    column=c.name,
+                    pii=True,
+                    pii_types=pii_types,
+                    append_comment=append_comment,
+                )
+
+        # Idempotent tag back, fanned out across tables while listing continues. A client
+        # holding a single Thrift socket or DB-API connection finishes listing first and
+        # then writes from this thread only, so no call lands mid-listing.
+        if getattr(client, "concurrent_writes", False):
+            _apply_tags_parallel(_apply_table, _stream(), table_key=_table_of)
+        else:
+            _apply_tags_parallel(
+                _apply_table, list(_stream()), table_key=_table_of, max_in_flight=1
+            )
+    else:
+        for _ in _stream():
+            pass
+    if dry_run:
+        _persist_target_findings(
+            db,
+            rows,
+            types=pii_types,
+            confidence=confidence,
+            hit_rate=hit_rate,
+            model_version=model_version,
+            source=source,
+        )
+
+
 @app.command()
 def scan(
     path: str | None = typer.Argument(None, help="Path to scan for PII (placeholder)"),
@@ -79,136 +465,36 @@ def scan(
     append_comment: str | None = typer.Option(
         None, "--append-comment", help="Optional comment to append to column description"
     ),
+    cache_ttl: float = typer.Option(
+        0, "--cache-ttl", help="Reuse catalog listings cached within SECONDS (0 disables)"
+    ),
+    cache_dir: str | None = typer.Option(
+        None, "--cache-dir", help="Listing cache directory (default ~/.cache/cps)"
+    ),
 ) -> None:
     """Scan and persist results. With --dry-run, writes to SQLite/Postgres only."""
-    # New: Targeted connector route
-    if target and target.startswith("glue://"):
-        # Enumerate AWS Glue Data Catalog
-        pat = target[len("glue://") :].strip()
-        parts = [p for p in pat.split("/") if p]
-        db_pats = ["*"]
-        tbl_pats = ["*"]
-        if len(parts) >= 1 and parts[0] not in {"*", ""}:
-            db_pats = [parts[0]]
-        if len(parts) >= 2 and parts[1] not in {"*", ""}:
-            tbl_pats = [parts[1]]
-
-        glue_client = GlueCatalogClient()
-        glue_cols = list(glue_client.iter_columns(db_patterns=db_pats, table_patterns=tbl_pats))
-        # Print summary JSON to stdout
-        out = [
-            {
-                "ref": gc.ref,
-                "database": gc.database,
-                "table": gc.table,
-                "column": gc.name,
-                "type": gc.type,
-                "comment": gc.comment,
-                "parameters": gc.parameters,
-            }
-            for gc in glue_cols
-        ]
-        typer.echo(json.dumps({"count": len(out), "columns": out}, indent=2))
-
-        if apply:
-            # Idempotent tag back per column
-            for gc in glue_cols:
-                glue_client.update_column_tags(
-                    database=gc.database,
-                    table=gc.table,
-                    column=gc.name,
-                    pii=True,
-                    pii_types=type_ or ["PII"],
-                    append_comment=append_comment,
-                )
-        return
-
-    if target and target.startswith("unity://"):
-        # Enumerate Databricks Unity Catalog
-        pat = target[len("unity://") :].strip()
-        parts = [p for p in pat.split("/") if p]
-        cat_pats = ["*"]
-        sch_pats = ["*"]
-        tbl_pats = ["*"]
-        if len(parts) >= 1 and parts[0] not in {"*", ""}:
-            cat_pats = [parts[0]]
-        if len(parts) >= 2 and parts[1] not in {"*", ""}:
-            sch_pats = [parts[1]]
-        if len(parts) >= 3 and parts[2] not in {"*", ""}:
-            tbl_pats = [parts[2]]
-
-        unity_client = UnityCatalogClient()
-        unity_cols = list(
-            unity_client.iter_columns(
-                catalog_patterns=cat_pats, schema_patterns=sch_pats, table_patterns=tbl_pats
+    # Targeted connector route: glue://db/table, unity://catalog/schema/table, hms://db/table
+    if target:
+        scheme, _, rest = target.partition("://")
+        conn = _CONNECTORS.get(scheme)
+        if conn is not None:
+            _enumerate_and_maybe_apply(
+                scheme,
+                conn,
+                rest,
+                apply=apply,
+                dry_run=dry_run,
+                db=db,
+                pii_types=type_ or ["PII"],
+                append_comment=append_comment,
+                confidence=confidence,
+                hit_rate=hit_rate,
+                model_version=model_version,
+                source=source,
+                cache_ttl=cache_ttl,
+                cache_dir=cache_dir,
             )
-        )
-        out = [
-            {
-                "ref": uc.ref,
-                "catalog": uc.catalog,
-                "schema": uc.schema,
-                "table": uc.table,
-                "column": uc.name,
-                "type": uc.type,
-                "comment": uc.comment,
-                "properties": uc.properties,
-            }
-            for uc in unity_cols
-        ]
-        typer.echo(json.dumps({"count": len(out), "columns": out}, indent=2))
-
-        if apply:
-            for uc in unity_cols:
-                unity_client.update_column_tags(
-                    catalog=uc.catalog,
-                    schema=uc.schema,
-                    table=uc.table,
-                    column=uc.name,
-                    pii=True,
-                    pii_types=type_ or ["PII"],
-                    append_comment=append_comment,
-                )
-        return
-
-    if target and target.startswith("hms://"):
-        # Enumerate Hive Metastore via Thrift
-        pat = target[len("hms://") :].strip()
-        parts = [p for p in pat.split("/") if p]
-        db_pats = ["*"]
-        tbl_pats = ["*"]
-        if len(parts) >= 1 and parts[0] not in {"*", ""}:
-            db_pats = [parts[0]]
-        if len(parts) >= 2 and parts[1] not in {"*", ""}:
-            tbl_pats = [parts[1]]
-
-        hms_client = HiveMetastoreClient()
-        hms_cols = list(hms_client.iter_columns(db_patterns=db_pats, table_patterns=tbl_pats))
-        out = [
-            {
-                "ref": hc.ref,
-                "database": hc.database,
-                "table": hc.table,
-                "column": hc.name,
-                "type": hc.type,
-                "comment": hc.comment,
-                "properties": hc.properties,
-            }
-            for hc in hms_cols
-        ]
-        typer.echo(json.dumps({"count": len(out), "columns": out}, indent=2))
-
-        if apply:
-            for hc in hms_cols:
-                hms_client.update_column_tags(
-                    database=hc.database,
-                    table=hc.table,
-                    column=hc.name,
-                    pii=True,
-                    pii_types=type_ or ["PII"],
-                    append_comment=append_comment,
-                )
-        return
+            return
 
     if path:
         typer.echo(f"Scanning path: {path}")
@@ -216,10 +502,12 @@ def scan(
         # For now, only dry-run writes results in this skeleton
         typer.echo("Hint: use --dry-run to write findings to the DB")
         return
+    from .db import add_finding, session_scope, upsert_column
+
     # Initialize DB and persist a single finding for the provided target
-    Session = init_db(db)
+    Session = _cached_init_db(db)
     with session_scope(Session) as s:
-        col: DBColumn = upsert_column(s, catalog=catalog, schema=schema, table=table, column=column)
+        col = upsert_column(s, catalog=catalog, schema=schema, table=table, column=column)
         types = type_ or ["EMAIL"]
         f = add_finding(
             s,
@@ -230,46 +518,102 @@ def scan(
             model_version=model_version,
             source=source,
         )
-        typer.echo(
-            json.dumps(
-                {
-                    "id": f.id,
-                    "column_ref": f.column_ref,
-                    "types": f.types,
-                    "confidence": f.confidence,
-                    "hit_rate": f.hit_rate,
-                    "model_version": f.model_version,
-                    "scanned_at": f.scanned_at.isoformat(),
-                    "source": f.source,
-                }
-            )
-        )
+        _emit_json(_finding_row(f))
 
 
-@app.command()
-def scan_text(
-    text: str = typer.Argument(..., help="Raw text to scan"),
-    model_dir: str | None = typer.Option(None, "--model-dir", help="Directory for models"),
-) -> None:
-    """Scan a single text and output JSON with per-type probabilities per span."""
+def _model_path(model_dir: str | None, stem: str) -> str:
+    """``<stem>.npz`` in the model dir, or a legacy ``<stem>.joblib`` if only that exists."""
+    base = Path(model_dir or ".models")
+    npz = base / f"{stem}.npz"
+    legacy = base / f"{stem}.joblib"
+    return str(legacy if not npz.exists() and legacy.exists() else npz)
+
+
+def _load_ensemble(model_dir: str | None) -> Ensemble:
+    from .embeddings import EmbedModel
+    from .ensemble import Calibrator, Ensemble
+
     # Build ensemble with identity calibrator if none saved
-    embed = EmbedModel(clf_path=str(Path(model_dir or ".models") / "embed.joblib"))
-    calib_path = str(Path(model_dir or ".models") / "calibrator.joblib")
+    embed = EmbedModel(clf_path=_model_path(model_dir, "embed"))
+    calib_path = _model_path(model_dir, "calibrator")
     calibrator = Calibrator.load(calib_path)
-    ens = Ensemble(embed=embed, calibrator=calibrator)
-    cands = propose_candidates(text)
-    preds = ens.predict(text, cands)
-    out = []
-    for p in preds:
-        out.append(
+    return Ensemble(embed=embed, calibrator=calibrator)
+
+
+def _scan_with(ens: Ensemble, text: str, *, minimal: bool = False) -> list[dict[str, Any]]:
+    from .rules import propose_candidates
+
+    preds = ens.predict(text, propose_candidates(text))
+    if minimal:
+        return [
             {
                 "span": {"start": p.span.start, "end": p.span.end, "text": p.span.text},
                 "label": p.label.value if p.label else None,
                 "score": p.score,
-                "probs": {t.value: float(v) for t, v in p.probs.items()},
             }
-        )
-    typer.echo(json.dumps(out, indent=2))
+            for p in preds
+        ]
+    # Ensemble emits probs in ALL_PII_TYPES order, i.e. aligned with _TYPE_ORDER
+    return [
+        {
+            "span": {"start": p.span.start, "end": p.span.end, "text": p.span.text},
+            "label": p.label.value if p.label else None,
+            "score": p.score,
+            "probs": list(p.probs.values()),
+        }
+        for p in preds
+    ]
+
+
+def scan_text_impl(
+    text: str, model_dir: str | None = None, *, minimal: bool = False
+) -> list[dict[str, Any]]:
+    """Scan a single text and return the per-span payload printed by ``scan-text``.
+
+    Plain-function entry point for benchmarks and embedding callers; bypasses Typer parsing.
+    """
+    return _scan_with(_load_ensemble(model_dir), text, minimal=minimal)
+
+
+MINIMAL_OPT = typer.Option(False, "--minimal", help="Omit per-type probabilities")
+
+
+@app.command()
+def scan_text(
+    text: str = typer.Argument(..., help="Raw text to scan"),
+    model_dir: str | None = typer.Option(None, "--model-dir", help="Directory for models"),
+    minimal: bool = MINIMAL_OPT,
+) -> None:
+    """Scan a single text and output JSON with per-type probabilities per span.
+
+    ``probs`` is a list aligned with the PII type order: EMAIL, PHONE_NUMBER, CREDIT_CARD,
+    SSN, IP_ADDRESS, MAC_ADDRESS, AADHAAR, PAN, PERSON, ADDRESS, DATE.
+    """
+    _emit_json(scan_text_impl(text, model_dir, minimal=minimal), indent=True)
+
+
+@app.command()
+def scan_texts(
+    input_path: str = typer.Argument("-", help="NDJSON file of {\"text\": ...} rows, or '-'"),
+    model_dir: str | None = typer.Option(None, "--model-dir", help="Directory for models"),
+    minimal: bool = MINIMAL_OPT,
+) -> None:
+    """Scan many texts with one loaded ensemble; emits one JSON line per input row."""
+    ens = _load_ensemble(model_dir)
+    fh = sys.stdin if input_path == "-" else open(input_path, encoding="utf-8")
+    write = _stdout_writer()
+    try:
+        for line in fh:
+            if not line.strip():
+                continue
+            row = _json_loads(line)
+            out: dict[str, Any] = {"predictions": _scan_with(ens, row["text"], minimal=minimal)}
+            if "id" in row:
+                out = {"id": row["id"], **out}
+            write(_json_dumps(out) + b"\n")
+    finally:
+        if fh is not sys.stdin:
+            fh.close()
 
 
 @app.command()
@@ -277,14 +621,33 @@ def serve(
     host: str = typer.Option("127.0.0.1", "--host", help="Host to bind"),
     port: int = typer.Option(8000, "--port", help="Port to listen on"),
     reload: bool = typer.Option(False, "--reload", help="Enable auto-reload (dev)"),
+    workers: int | None = typer.Option(
+        None, "--workers", help="Worker processes (default: CPU count; 1 with --reload)"
+    ),
 ) -> None:
     """Run the FastAPI server."""
-    # Import path keeps reload working reliably
+    import importlib.util
+    import os
+
+    import uvicorn
+
+    # Prefer uvloop/httptools when installed (not available on Windows)
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+    http = "httptools" if importlib.util.find_spec("httptools") else "auto"
+    if reload:
+        workers = None
+    elif workers is None:
+        workers = os.cpu_count() or 1
+    # Import path keeps reload working reliably; the factory builds the app in the server
     uvicorn.run(
-        "catalog_pii_scanner.api:app",
+        "catalog_pii_scanner.api:create_app",
+        factory=True,
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
+        loop=loop,
+        http=http,
     )
 
 
@@ -295,6 +658,8 @@ def gen_synth(
     seed: int = typer.Option(1234, "--seed", help="Random seed"),
 ) -> None:
     """Generate a synthetic labeled dataset."""
+    from .datasets import generate_synthetic, save_jsonl
+
     data = generate_synthetic(n=n, seed=seed)
     save_jsonl(out_path, data)
     typer.echo(f"Wrote {n} examples to {out_path}")
@@ -306,28 +671,38 @@ def train_embed(
     model_dir: str = typer.Option(".models", "--model-dir", help="Directory to save models"),
 ) -> None:
     """Train the embeddings classifier on sanitized contexts only (no raw PII)."""
-    ds = load_jsonl(data_path)
+    from .datasets import iter_jsonl
+    from .embeddings import EmbedModel
+    from .pii_types import PIIType
+
+    ds = iter_jsonl(data_path)
     embed = EmbedModel()
     texts: list[str] = []
     labels: list[PIIType] = []
+    masks: dict[int, str] = {}
     for ex in ds:
+        text = ex.text
         # build candidate contexts from gold spans (supervised training)
         for span, lbl in ex.labels:
-            start = max(0, span.start - 48)
-            end = min(len(ex.text), span.end + 48)
-            ctx = ex.text[start:end]
-            # sanitize: replace the PII span with shape-preserving mask
-            masked_ctx = (
-                ctx[: span.start - start]
-                + ("0" * (span.end - span.start))
-                + ctx[span.end - start :]
+            k = span.end - span.start
+            mask = masks.get(k)
+            if mask is None:
+                mask = masks[k] = "0" * k
+            # sanitize: slice around the PII span and splice in a shape-preserving mask
+            texts.append(
+                "".join(
+                    (
+                        text[max(0, span.start - 48) : span.start],
+                        mask,
+                        text[span.end : span.end + 48],
+                    )
+                )
             )
-            texts.append(masked_ctx)
             labels.append(lbl)
     embed.fit(texts, labels)
     out_dir = Path(model_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
-    embed_path = str(out_dir / "embed.joblib")
+    embed_path = str(out_dir / "embed.npz")
     embed.save(embed_path)
     typer.echo(f"Saved embeddings classifier to {embed_path}")
 
@@ -338,51 +713,49 @@ def calibrate(
     model_dir: str = typer.Option(".models", "--model-dir", help="Directory to save models"),
 ) -> None:
     """Fit calibration (Platt scaling) for ensemble outputs."""
+    from .datasets import load_jsonl
+    from .embeddings import EmbedModel
+    from .eval import calibrate_on_dataset
+
     ds = load_jsonl(data_path)
-    embed = EmbedModel(clf_path=str(Path(model_dir) / "embed.joblib"))
+    embed = EmbedModel(clf_path=_model_path(model_dir, "embed"))
     calib = calibrate_on_dataset(ds, embed)
     out_dir = Path(model_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
-    calib_path = str(out_dir / "calibrator.joblib")
+    calib_path = str(out_dir / "calibrator.npz")
     calib.save(calib_path)
     typer.echo(f"Saved calibrator to {calib_path}")
 
 
+_FMT = "  {t:12s} precision={precision:.3f} recall={recall:.3f} f1={f1:.3f}"
+_FMT_AVG = "{t}: precision={precision:.3f} recall={recall:.3f} f1={f1:.3f}"
+
+
 @app.command()
 def eval(
     data_path: str = typer.Argument(..., help="JSONL dataset path"),
     model_dir: str = typer.Option(".models", "--model-dir", help="Directory of models"),
+    jobs: int = typer.Option(1, "--jobs", help="Worker processes (-1: one per CPU core)"),
 ) -> None:
     """Run evaluation and print precision/recall/F1 per type and micro/macro."""
-    ds = load_jsonl(data_path)
-    embed = EmbedModel(clf_path=str(Path(model_dir) / "embed.joblib"))
-    calibrator = Calibrator.load(str(Path(model_dir) / "calibrator.joblib"))
+    from .datasets import iter_jsonl
+    from .embeddings import EmbedModel
+    from .ensemble import Calibrator, Ensemble
+    from .eval import run_eval
+
+    ds = iter_jsonl(data_path)
+    embed = EmbedModel(clf_path=_model_path(model_dir, "embed"))
+    calibrator = Calibrator.load(_model_path(model_dir, "calibrator"))
     ens = Ensemble(embed=embed, calibrator=calibrator)
-    rep = run_eval(ds, ens)
-    # Render report
-    lines = []
-    lines.append("Per-type metrics:")
-    for t, m in rep.per_type.items():
-        lines.append(
-            "  "
-            f"{t.value:12s} "
-            f"precision={m['precision']:.3f} "
-            f"recall={m['recall']:.3f} "
-            f"f1={m['f1']:.3f}"
-        )
-    lines.append(
-        "Micro: "
-        f"precision={rep.micro['precision']:.3f} "
-        f"recall={rep.micro['recall']:.3f} "
-        f"f1={rep.micro['f1']:.3f}"
-    )
-    lines.append(
-        "Macro: "
-        f"precision={rep.macro['precision']:.3f} "
-        f"recall={rep.macro['recall']:.3f} "
-        f"f1={rep.macro['f1']:.3f}"
-    )
-    typer.echo("\n".join(lines))
+    rep = run_eval(ds, ens, n_jobs=jobs)
+    # Render the whole report and write it once
+    lines = [
+        "Per-type metrics:",
+        *(_FMT.format_map(m | {"t": t.value}) for t, m in rep.per_type.items()),
+        _FMT_AVG.format_map(rep.micro | {"t": "Micro"}),
+        _FMT_AVG.format_map(rep.macro | {"t": "Macro"}),
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 @config_app.command("validate")
@@ -391,6 +764,8 @@ def config_validate(
     env_prefix: str = typer.Option("CPS_", "--env-prefix", help="ENV override prefix"),
 ) -> None:
     """Validate a configuration file, applying env overrides if present."""
+    from .config import validate_config_file
+
     cfg, errors = validate_config_file(file, env_prefix=env_prefix)
     if errors:
         typer.echo("Config invalid:")
@@ -410,76 +785,108 @@ def export(
     fmt = format.lower()
     if fmt not in {"json", "csv"}:
         raise typer.BadParameter("--format must be 'json' or 'csv'")
-    Session = init_db(db)
-    from sqlalchemy import select
+    from .db import iter_findings_flat, session_scope
+
+    Session = _cached_init_db(db)
+
+    headers = [
+        "id",
+        "column_ref",
+        "types",
+        "confidence",
+        "hit_rate",
+        "model_version",
+        "scanned_at",
+        "source",
+    ]
+    to_stdout = out == "-"
+    if to_stdout:
+        fh: Any = sys.stdout
+    elif fmt == "json":
+        fh = open(out, "wb")
+    else:
+        fh = open(out, "w", newline="", encoding="utf-8")
+    count = 0
+    try:
+        with session_scope(Session) as s:
+            # Stream flat rows in chunks; no ORM objects, nothing buffered beyond one batch
+            findings = iter_findings_flat(s)
+            if fmt == "json":
+                write = _stdout_writer() if to_stdout else fh.write
+                write(b"[")
+                for f in findings:
+                    write(b",\n  " if count else b"\n  ")
+                    write(_json_dumps(_finding_row(f)))
+                    count += 1
+                write(b"\n]\n" if count else b"]\n")
+            else:
+                import csv
+
+                # Positional writer: one tuple per row, no intermediate dict
+                w = csv.writer(fh)
+                w.writerow(headers)
+                for f in findings:
+                    types = f.types
+                    w.writerow(
+                        (
+                            f.id,
+                            f.column_ref,
+                            ",".join(types) if isinstance(types, list) else types,
+                            f.confidence,
+                            f.hit_rate,
+                            f.model_version,
+                            f.scanned_at.isoformat(),
+                            f.source,
+                        )
+                    )
+                    count += 1
+    finally:
+        if not to_stdout:
+            fh.close()
+    if not to_stdout:
+        typer.echo(f"Wrote {count} findings to {out}")
+
+
+def _finding_row(f: Any) -> dict:
+    return {
+        "id": f.id,
+        "column_ref": f.column_ref,
+        "types": f.types,
+        "confidence": f.confidence,
+        "hit_rate": f.hit_rate,
+        "model_version": f.model_version,
+        "scanned_at": f.scanned_at.isoformat(),
+        "source": f.source,
+    }
 
-    rows: list[dict] = []
-    with session_scope(Session) as s:
-        res = s.execute(select(Finding))
-        for f in res.scalars():
-            rows.append(
-                {
-                    "id": f.id,
-                    "column_ref": f.column_ref,
-                    "types": f.types,
-                    "confidence": f.confidence,
-                    "hit_rate": f.hit_rate,
-                    "model_version": f.model_version,
-                    "scanned_at": f.scanned_at.isoformat(),
-                    "source": f.source,
-                }
-            )
 
-    if fmt == "json":
-        data = json.dumps(rows, indent=2)
-        if out == "-":
-            typer.echo(data)
-        else:
-            Path(out).write_text(data, encoding="utf-8")
-            typer.echo(f"Wrote {len(rows)} findings to {out}")
-    else:
-        # CSV
-        import csv
-
-        headers = [
-            "id",
-            "column_ref",
-            "types",
-            "confidence",
-            "hit_rate",
-            "model_version",
-            "scanned_at",
-            "source",
-        ]
-        if out == "-":
-            # write to stdout
-            import sys
-
-            w = csv.DictWriter(sys.stdout, fieldnames=headers)
-            w.writeheader()
-            for r in rows:
-                r = {
-                    **r,
-                    "types": (
-                        ",".join(r["types"]) if isinstance(r.get("types"), list) else r.get("types")
-                    ),
-                }
-                w.writerow(r)
-        else:
-            with open(out, "w", newline="", encoding="utf-8") as fh:
-                w = csv.DictWriter(fh, fieldnames=headers)
-                w.writeheader()
-                for r in rows:
-                    r = {
-                        **r,
-                        "types": (
-                            ",".join(r["types"])
-                            if isinstance(r.get("types"), list)
-                            else r.get("types")
-                        ),
-                    }
-                    w.writerow(r)
-            typer.echo(f"Wrote {len(rows)} findings to {out}")
+@app.command()
+def repl() -> None:
+    """Run cps commands read line by line from stdin in one long-lived process.
+
+    DB session factories and imported modules stay warm between commands, so scripted
+    sequences skip per-process startup. Blank lines and ``#`` comments are ignored;
+    ``exit``/``quit`` or EOF ends the session.
+    """
+    import shlex
+
+    import click
+
+    cmd = typer.main.get_command(app)
+    for line in sys.stdin:
+        argv = shlex.split(line, comments=True)
+        if not argv:
+            continue
+        if argv[0] in {"exit", "quit"}:
+            break
+        try:
+            cmd.main(args=argv, prog_name="cps", standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+        except Exception as e:  # keep the session alive after a failing command
+            typer.echo(f"Error: {e}", err=True)
+        finally:
+            sys.stdout.flush()
 
 
 app.add_typer(config_app, name="config")
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import os
+import re
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, cast
 
 import yaml  # type: ignore[import-untyped]
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
+# libyaml-backed loader when PyYAML was built with it
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class NERConfig(BaseModel):
     model_config = {
@@ -28,6 +34,9 @@ class EmbeddingsFeaturesConfig(BaseModel):
     from_samples: bool = True
 
 
+_DEFAULT_FEATURES = EmbeddingsFeaturesConfig(from_metadata=True, from_samples=True)
+
+
 class EmbeddingsConfig(BaseModel):
     model_config = {
         "extra": "forbid",
@@ -35,7 +44,9 @@ class EmbeddingsConfig(BaseModel):
     enabled: bool = True
     model: str = "sentence-transformers/all-MiniLM-L6-v2"
     device: Literal["cpu", "cuda"] = "cpu"
-    features: EmbeddingsFeaturesConfig = Field(default_factory=lambda: EmbeddingsFeaturesConfig())
+    features: EmbeddingsFeaturesConfig = Field(
+        default_factory=lambda: _DEFAULT_FEATURES.model_copy(deep=True)
+    )
 
 
 class EnsembleWeights(BaseModel):
@@ -54,13 +65,14 @@ class EnsembleWeights(BaseModel):
         return float(v)
 
 
+_DEFAULT_WEIGHTS = EnsembleWeights(rules=0.4, ner=0.3, embed=0.3)
+
+
 class EnsembleConfig(BaseModel):
     model_config = {
         "extra": "forbid",
     }
-    weights: EnsembleWeights = Field(
-        default_factory=lambda: EnsembleWeights(rules=0.4, ner=0.3, embed=0.3)
-    )
+    weights: EnsembleWeights = Field(default_factory=lambda: _DEFAULT_WEIGHTS.model_copy(deep=True))
     decision_threshold: float = Field(0.55, ge=0.0, le=1.0)
 
 
@@ -78,39 +90,40 @@ class LLMConfig(BaseModel):
     cache_ttl_minutes: int = Field(1440, ge=0)
 
 
+# Validated once at import; factories hand out copies, which skip re-validation
+_DEFAULT_NER = NERConfig(enabled=True, provider="presidio", confidence_min=0.60)
+_DEFAULT_EMBEDDINGS = EmbeddingsConfig(
+    enabled=True,
+    model="sentence-transformers/all-MiniLM-L6-v2",
+    device="cpu",
+    features=_DEFAULT_FEATURES,
+)
+_DEFAULT_ENSEMBLE = EnsembleConfig(weights=_DEFAULT_WEIGHTS, decision_threshold=0.55)
+_DEFAULT_LLM = LLMConfig(
+    enabled=False,
+    provider="local",
+    model="llama3-8b-instruct",
+    max_tokens=256,
+    temperature=0.0,
+    redact=True,
+    cost_cap_usd_per_scan=0.50,
+    cache_ttl_minutes=1440,
+)
+
+
 class AIConfig(BaseModel):
     model_config = {
         "extra": "forbid",
     }
     mode: Literal["rules", "ensemble", "ensemble+llm"] = "ensemble"
-    ner: NERConfig = Field(
-        default_factory=lambda: NERConfig(enabled=True, provider="presidio", confidence_min=0.60)
-    )
+    ner: NERConfig = Field(default_factory=lambda: _DEFAULT_NER.model_copy(deep=True))
     embeddings: EmbeddingsConfig = Field(
-        default_factory=lambda: EmbeddingsConfig(
-            enabled=True,
-            model="sentence-transformers/all-MiniLM-L6-v2",
-            device="cpu",
-            features=EmbeddingsFeaturesConfig(from_metadata=True, from_samples=True),
-        )
+        default_factory=lambda: _DEFAULT_EMBEDDINGS.model_copy(deep=True)
     )
     ensemble: EnsembleConfig = Field(
-        default_factory=lambda: EnsembleConfig(
-            weights=EnsembleWeights(rules=0.4, ner=0.3, embed=0.3), decision_threshold=0.55
-        )
-    )
-    llm: LLMConfig = Field(
-        default_factory=lambda: LLMConfig(
-            enabled=False,
-            provider="local",
-            model="llama3-8b-instruct",
-            max_tokens=256,
-            temperature=0.0,
-            redact=True,
-            cost_cap_usd_per_scan=0.50,
-            cache_ttl_minutes=1440,
-        )
+        default_factory=lambda: _DEFAULT_ENSEMBLE.model_copy(deep=True)
     )
+    llm: LLMConfig = Field(default_factory=lambda: _DEFAULT_LLM.model_copy(deep=True))
 
 
 class AppConfig(BaseModel):
@@ -121,47 +134,66 @@ class AppConfig(BaseModel):
 
 
 def _deep_update(dst: dict[str, Any], src: dict[str, Any]) -> dict[str, Any]:
-    for k, v in src.items():
-        if isinstance(v, dict) and isinstance(dst.get(k), dict):
-            dst[k] = _deep_update(dst.get(k, {}), v)
-        else:
-            dst[k] = v
+    # Iterative merge; YAML and env overrides only ever produce plain dicts
+    stack = [(dst, src)]
+    while stack:
+        d, s = stack.pop()
+        for k, v in s.items():
+            dv = d.get(k)
+            if type(v) is dict and type(dv) is dict:
+                stack.append((dv, v))
+            else:
+                d[k] = v
     return dst
 
 
-def _parse_env_overrides(prefix: str = "CPS_") -> dict[str, Any]:
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on"})
+_BOOL_FALSE = frozenset({"false", "0", "no", "off"})
+_NUM_RE = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)")
+
+
+def _prefixed_env(prefix: str) -> tuple[tuple[str, str], ...]:
+    # Snapshot the key list, then screen on the key alone so values of unrelated
+    # variables are never decoded; a variable unset meanwhile is simply dropped.
+    environ = os.environ
+    keys = [k for k in list(environ) if k.startswith(prefix)]
+    pairs = ((k, environ.get(k)) for k in keys)
+    return tuple(sorted((k, v) for k, v in pairs if v is not None))
+
+
+def _parse_env_overrides(
+    prefix: str = "CPS_", environ: Iterable[tuple[str, str]] | None = None
+) -> dict[str, Any]:
     """Parse environment variables into a nested dict using double underscore as a separator.
 
     Example:
       CPS_AI__NER__ENABLED=false -> {"ai": {"ner": {"enabled": False}}}
+
+    ``environ`` defaults to the prefixed variables of ``os.environ``.
     """
     out: dict[str, Any] = {}
     plen = len(prefix)
-    for key, raw in os.environ.items():
+    for key, raw in _prefixed_env(prefix) if environ is None else environ:
         if not key.startswith(prefix):
             continue
         path = key[plen:]
         if "__" not in path:
             # Only consider nested keys for config overrides
             continue
-        parts = [p.strip().lower() for p in path.split("__") if p.strip()]
+        parts = [p for p in path.lower().split("__") if p]
         if not parts:
             continue
         # best-effort parse of primitive types
         val: Any
         low = raw.strip().lower()
-        if low in {"true", "1", "yes", "on"}:
+        if low in _BOOL_TRUE:
             val = True
-        elif low in {"false", "0", "no", "off"}:
+        elif low in _BOOL_FALSE:
             val = False
+        elif _NUM_RE.fullmatch(low):
+            val = float(low) if "." in low else int(low)
         else:
-            try:
-                if "." in raw:
-                    val = float(raw)
-                else:
-                    val = int(raw)
-            except Exception:
-                val = raw
+            val = raw
         node = out
         for p in parts[:-1]:
             node = node.setdefault(p, {})
@@ -172,19 +204,33 @@ def _parse_env_overrides(prefix: str = "CPS_") -> dict[str, Any]:
 def load_config_from_file(path: str | Path | None, env_prefix: str = "CPS_") -> AppConfig:
     """Load config from YAML file and apply environment overrides.
 
+    Results are cached on the file's path and mtime plus the matching environment
+    variables, so the returned instance is shared: ``model_copy()`` it before mutating.
+
     Raises ValidationError on invalid configuration.
     """
-    data: dict[str, Any] = {}
+    key: tuple[str, int] | None = None
     if path:
-        p = Path(path)
-        if not p.exists():
-            raise FileNotFoundError(f"Config file not found: {p}")
-        with p.open("r", encoding="utf-8") as f:
-            loaded = yaml.safe_load(f) or {}
+        p = Path(path).resolve()
+        try:
+            key = (str(p), p.stat().st_mtime_ns)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {Path(path)}") from None
+    return _load_config_cached(key, env_prefix, _prefixed_env(env_prefix))
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(
+    key: tuple[str, int] | None, env_prefix: str, env: tuple[tuple[str, str], ...]
+) -> AppConfig:
+    data: dict[str, Any] = {}
+    if key is not None:
+        with open(key[0], encoding="utf-8") as f:
+            loaded = yaml.load(f, Loader=_LOADER) or {}
             if not isinstance(loaded, dict):
                 raise ValueError("Top-level YAML must be a mapping/object")
             data = loaded
-    overrides = _parse_env_overrides(prefix=env_prefix)
+    overrides = _parse_env_overrides(prefix=env_prefix, environ=env)
     if overrides:
         data = _deep_update(data, overrides)
     # pydantic typing for model_validate may be Any in some environments; cast for mypy
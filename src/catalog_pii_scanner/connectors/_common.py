@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import fnmatch
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, TypeVar, cast
+
+try:
+    import boto3  # type: ignore
+except Exception:  # pragma: no cover - optional dependency in some envs
+    boto3 = None  # type: ignore
+
+
+_V = TypeVar("_V")
+
+
+# --------- Name patterns ---------
+
+
+def compile_patterns(patterns: Iterable[str] | None) -> Callable[[str], Any] | None:
+    """Fold fnmatch patterns into one regex matcher; None when everything matches."""
+    pats = list(patterns or ["*"])
+    if "*" in pats:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in pats)).match
+
+
+# --------- Shared boto3 clients ---------
+
+_CLIENT_CACHE: dict[tuple[str, str | None, str | None], Any] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def cached_boto3_client(
+    service: str, *, region_name: str | None = None, endpoint_url: str | None = None
+) -> Any:
+    """Return a process-wide boto3 client for ``(service, region, endpoint)``.
+
+    Building a client loads the service model from disk, which dominates sampler and
+    connector setup; clients are thread-safe, so one per key is shared. Creation is
+    serialized because the default boto3 session is not.
+    """
+    if boto3 is None:
+        raise RuntimeError(f"boto3 is required for the {service} client but is not installed")
+    key = (service, region_name, endpoint_url)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = boto3.client(service, region_name=region_name, endpoint_url=endpoint_url)
+                _CLIENT_CACHE[key] = client
+    return client
+
+
+# --------- Metadata cache ---------
+
+
+class TTLCache:
+    """Small thread-safe TTL + LRU cache for catalog metadata responses.
+
+    ``ttl <= 0`` disables caching. Values are returned as stored, so callers must copy
+    before mutating them.
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 4096) -> None:
+        self.ttl = float(ttl)
+        self.maxsize = max(1, int(maxsize))
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the live value for ``key``, or None on a miss."""
+        if self.ttl <= 0:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None and hit[0] > now:
+                self._data.move_to_end(key)
+                return hit[1]
+        return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], _V]) -> _V:
+        hit = self.get(key)
+        if hit is not None:
+            return cast(_V, hit)
+        # Fetch outside the lock; concurrent misses may both fetch, last write wins
+        value = factory()
+        self.put(key, value)
+        return value
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
@@ -3,13 +3,21 @@ from __future__ import annotations
 import random
 import time
 import uuid
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass
+from itertools import islice
+from operator import itemgetter
 from typing import Any
 
-import boto3
 from botocore.client import BaseClient
 from botocore.exceptions import BotoCoreError, ClientError
 
+from ._common import cached_boto3_client
+
+_VARCHAR = itemgetter("VarCharValue")
+
 
 @dataclass
 class AthenaConfig:
@@ -23,6 +31,9 @@ class AthenaConfig:
     initial_backoff: float = 0.5
     max_backoff: float = 5.0
     max_retries: int = 3
+    # Bernoulli pre-sample percentage for sample_column; None sorts the whole table instead
+    sample_percent: float | None = 1.0
+    oversample_factor: int = 4
     # Optional temp DB (not required for simple SELECT sampling)
     create_temp_database: bool = False
     temp_db_prefix: str = "cps_tmp"
@@ -50,8 +61,10 @@ class AthenaSampler:
         if not config.s3_output or not config.s3_output.startswith("s3://"):
             raise ValueError("config.s3_output must be an s3:// URL")
         self.cfg = config
-        self._athena: BaseClient = athena_client or boto3.client("athena", region_name=region_name)
-        self._glue: BaseClient = glue_client or boto3.client("glue", region_name=region_name)
+        self._athena: BaseClient = athena_client or cached_boto3_client(
+            "athena", region_name=region_name
+        )
+        self._glue: BaseClient = glue_client or cached_boto3_client("glue", region_name=region_name)
         self._wg_name: str | None = None
         self._wg_created: bool = False
         self._temp_db: str | None = None
@@ -112,28 +125,49 @@ class AthenaSampler:
         if parts:
             where_clause = " WHERE " + " AND ".join(parts)
 
-        # Order randomly to get samples; LIMIT caps the output size
-        sql = f"SELECT {column} FROM {table}{where_clause} ORDER BY rand() LIMIT {n}"
-        qid = self._start_query(sql, database)
-        self._wait(qid)
-        rows = self._collect_results(qid, max_rows=n)
-
         values: list[str] = []
         seen: set[str] = set()
-        for r in rows:
-            if not r:
-                continue
-            v = r[0]
-            if v is None:
-                continue
-            if v in seen:
-                continue
-            values.append(v)
-            seen.add(v)
-            if len(values) >= n:
-                break
+        sampled_rows = 0
+        if self.cfg.sample_percent:
+            # Pre-sample with BERNOULLI so only ~n*k rows are shuffled instead of the table
+            k = max(1, int(self.cfg.oversample_factor))
+            pct = float(self.cfg.sample_percent)
+            sql = (
+                f"SELECT {column} FROM (SELECT {column} FROM {table} TABLESAMPLE BERNOULLI({pct:g})"
+                f"{where_clause} LIMIT {n * k}) ORDER BY rand() LIMIT {n}"
+            )
+            sampled_rows = self._run_sample(sql, database, n, values, seen)
+        if sampled_rows < n:
+            # Small or sparse tables: the sample returned fewer than n rows, fall back to a
+            # full shuffle. Few distinct values alone (status, flags) do not warrant it.
+            sql = f"SELECT {column} FROM {table}{where_clause} ORDER BY rand() LIMIT {n}"
+            self._run_sample(sql, database, n, values, seen)
         return values
 
+    def _run_sample(
+        self, sql: str, database: str, n: int, values: list[str], seen: set[str]
+    ) -> int:
+        """Append distinct values from ``sql`` and return the number of non-null rows read."""
+        qid = self._start_query(sql, database)
+        self._wait(qid)
+        rows = self._iter_results(qid)
+        n_rows = 0
+        with closing(rows):
+            for r in rows:
+                if not r:
+                    continue
+                v = r[0]
+                if v is None:
+                    continue
+                n_rows += 1
+                if v in seen:
+                    continue
+                values.append(v)
+                seen.add(v)
+                if len(values) >= n:
+                    break
+        return n_rows
+
     # -------------------- Internals --------------------
     def _create_temp_workgroup(self) -> str:
         name = f"cps_tmp_{uuid.uuid4().hex[:8]}"
@@ -214,16 +248,13 @@ class AthenaSampler:
             self._sleep(delay)
             delay = min(self.cfg.max_backoff, delay * 1.7 + random.uniform(0, 0.2))
 
-    def _collect_results(self, qid: str, *, max_rows: int | None = None) -> list[list[str | None]]:
-        out: list[list[str | None]] = []
-        token: str | None = None
-        header_skipped = False
+    def _get_results_page(self, qid: str, token: str | None) -> dict[str, Any]:
         while True:
             try:
                 params = {"QueryExecutionId": qid}
                 if token:
                     params["NextToken"] = token
-                res = self._athena.get_query_results(**params)  # type: ignore[arg-type]
+                return self._athena.get_query_results(**params)  # type: ignore[arg-type,no-any-return]
             except ClientError as e:
                 code = e.response.get("Error", {}).get("Code")
                 # Handle eventual consistency: results may not be immediately readable
@@ -236,22 +267,42 @@ class AthenaSampler:
                     continue
                 raise
 
-            rs = res.get("ResultSet", {})
-            rows = rs.get("Rows") or []
-            for row in rows:
-                data = row.get("Data") or []
-                vals = [cell.get("VarCharValue") for cell in data]
-                # Skip header line once: heuristic — if first page and first row
-                if not header_skipped:
-                    header_skipped = True
-                    continue
-                out.append(vals)
-                if max_rows is not None and len(out) >= max_rows:
-                    return out
-            token = res.get("NextToken")
-            if not token:
-                break
-        return out
+    def _iter_results(self, qid: str) -> Generator[list[str | None], None, None]:
+        """Yield result rows (header skipped) as pages arrive.
+
+        Closing the generator early stops pagination; one page is prefetched in the
+        background while the current one is decoded, so round-trips overlap with
+        row processing.
+        """
+        header_skipped = False
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            res = self._get_results_page(qid, None)
+            while True:
+                token = res.get("NextToken")
+                pending = pool.submit(self._get_results_page, qid, token) if token else None
+                rows = (res.get("ResultSet") or {}).get("Rows") or []
+                for row in rows:
+                    data = row.get("Data") or []
+                    try:
+                        vals = list(map(_VARCHAR, data))
+                    except KeyError:  # NULL cells omit VarCharValue
+                        vals = [cell.get("VarCharValue") for cell in data]
+                    # Skip header line once: heuristic — if first page and first row
+                    if not header_skipped:
+                        header_skipped = True
+                        continue
+                    yield vals
+                if pending is None:
+                    return
+                res = pending.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _collect_results(self, qid: str, *, max_rows: int | None = None) -> list[list[str | None]]:
+        rows = self._iter_results(qid)
+        with closing(rows):
+            return list(rows if max_rows is None else islice(rows, max_rows))
 
     # -------------------- Utilities --------------------
     @staticmethod
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-import copy
+import hashlib
+import json
 import os
 import random
 import time
-from collections.abc import Callable, Iterable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, cast
 
@@ -15,6 +18,7 @@ except Exception:  # pragma: no cover - optional dependency in some envs
     boto3 = None  # type: ignore
     ClientError = Exception  # type: ignore
 
+from ._common import cached_boto3_client, compile_patterns
 
 # --------- Retry / backoff helpers ---------
 
@@ -33,12 +37,18 @@ def _is_throttle_error(err: Exception) -> bool:
     return False
 
 
-def _with_retries(fn: Callable[[], Any], *, max_retries: int = 5, base_delay: float = 0.5) -> Any:
-    """Call `fn` with exponential backoff on throttling-like errors."""
+def _with_retries(
+    fn: Callable[..., Any],
+    *args: Any,
+    max_retries: int = 5,
+    base_delay: float = 0.5,
+    **kwargs: Any,
+) -> Any:
+    """Call ``fn(*args, **kwargs)`` with exponential backoff on throttling-like errors."""
     attempt = 0
     while True:
         try:
-            return fn()
+            return fn(*args, **kwargs)
         except Exception as e:  # noqa: BLE001
             if attempt >= max_retries or not _is_throttle_error(e):
                 raise
@@ -51,7 +61,7 @@ def _with_retries(fn: Callable[[], Any], *, max_retries: int = 5, base_delay: fl
 # --------- Data structures ---------
 
 
-@dataclass
+@dataclass(slots=True)
 class GlueColumn:
     database: str
     table: str
@@ -71,6 +81,9 @@ class GlueColumn:
 class GlueCatalogClient:
     """Thin wrapper over boto3 Glue client with safe defaults and retries."""
 
+    # boto3 clients may be shared across threads, so write-backs can fan out
+    concurrent_writes = True
+
     def __init__(
         self,
         *,
@@ -79,6 +92,7 @@ class GlueCatalogClient:
         boto3_client: Any | None = None,
         max_retries: int = 5,
         base_delay: float = 0.5,
+        skip_archive: bool = True,
     ) -> None:
         if boto3_client is not None:
             self._client = boto3_client
@@ -90,96 +104,131 @@ class GlueCatalogClient:
             endpoint_url = (
                 endpoint_url or os.getenv("AWS_ENDPOINT_URL") or os.getenv("GLUE_ENDPOINT_URL")
             )
-            self._client = boto3.client("glue", region_name=region_name, endpoint_url=endpoint_url)
+            self._client = cached_boto3_client(
+                "glue", region_name=region_name, endpoint_url=endpoint_url
+            )
 
         self._max_retries = max_retries
         self._base_delay = base_delay
+        # Tag write-backs do not need Glue to archive a table version per update
+        self._skip_archive = skip_archive
 
-    # ----- Enumeration -----
+    def _call(self, fn: Callable[..., Any], **kwargs: Any) -> dict[str, Any]:
+        return cast(
+            dict[str, Any],
+            _with_retries(fn, max_retries=self._max_retries, base_delay=self._base_delay, **kwargs),
+        )
 
-    def list_databases(self) -> list[str]:
-        next_token: str | None = None
-        names: list[str] = []
-        while True:
+    # ----- Enumeration -----
 
-            def _call(token: str | None = next_token) -> dict[str, Any]:  # bind loop var
-                if token:
-                    return cast(dict[str, Any], self._client.get_databases(NextToken=token))
-                return cast(dict[str, Any], self._client.get_databases())
+    def iter_databases(self) -> Iterator[str]:
+        """Yield database names page by page.
 
-            resp = cast(
-                dict[str, Any],
-                _with_retries(_call, max_retries=self._max_retries, base_delay=self._base_delay),
-            )
+        Pagination is driven by hand rather than through ``get_paginator`` so that
+        each page request keeps its own throttle backoff; callers can stop early
+        without fetching the remaining pages.
+        """
+        page: dict[str, str] = {}
+        while True:
+            resp = self._call(self._client.get_databases, **page)
             for db in resp.get("DatabaseList", []) or []:
                 if db.get("Name"):
-                    names.append(db["Name"])  # type: ignore[index]
+                    yield db["Name"]
             next_token = resp.get("NextToken")
             if not next_token:
-                break
-        return names
+                return
+            page = {"NextToken": next_token}
 
-    def list_tables(self, database: str) -> list[dict[str, Any]]:
-        next_token: str | None = None
-        out: list[dict[str, Any]] = []
+    def iter_tables(self, database: str) -> Iterator[dict[str, Any]]:
+        """Yield raw Glue table dicts for ``database`` page by page."""
+        page: dict[str, str] = {}
         while True:
-
-            def _call(token: str | None = next_token) -> dict[str, Any]:  # bind loop var
-                if token:
-                    return cast(
-                        dict[str, Any],
-                        self._client.get_tables(DatabaseName=database, NextToken=token),
-                    )
-                return cast(dict[str, Any], self._client.get_tables(DatabaseName=database))
-
-            resp = _with_retries(_call, max_retries=self._max_retries, base_delay=self._base_delay)
-            out.extend(resp.get("TableList", []) or [])
+            resp = self._call(self._client.get_tables, DatabaseName=database, **page)
+            yield from resp.get("TableList", []) or []
             next_token = resp.get("NextToken")
             if not next_token:
-                break
-        return out
+                return
+            page = {"NextToken": next_token}
+
+    def list_databases(self) -> list[str]:
+        return list(self.iter_databases())
+
+    def list_tables(self, database: str) -> list[dict[str, Any]]:
+        return list(self.iter_tables(database))
 
     def iter_columns(
         self,
         db_patterns: Iterable[str] | None = None,
         table_patterns: Iterable[str] | None = None,
     ) -> Iterable[GlueColumn]:
-        import fnmatch
+        db_match = compile_patterns(db_patterns)
+        tbl_match = compile_patterns(table_patterns)
 
-        db_pats = list(db_patterns or ["*"])
-        tbl_pats = list(table_patterns or ["*"])
+        for db in self.iter_databases():
+            if db_match is not None and not db_match(db):
+                continue
+            yield from self._database_columns(db, tbl_match)
 
-        for db in self.list_databases():
-            if not any(fnmatch.fnmatch(db, p) for p in db_pats):
+    def iter_columns_concurrent(
+        self,
+        db_patterns: Iterable[str] | None = None,
+        table_patterns: Iterable[str] | None = None,
+        *,
+        workers: int = 8,
+    ) -> Iterator[GlueColumn]:
+        """Like :meth:`iter_columns`, but list up to ``workers`` databases concurrently.
+
+        Output order matches :meth:`iter_columns`. Each database is materialized by its
+        worker, and at most ``workers`` of them are buffered ahead of the consumer.
+        Keep ``workers`` small: every worker issues throttled Glue calls.
+        """
+        db_match = compile_patterns(db_patterns)
+        tbl_match = compile_patterns(table_patterns)
+        workers = max(1, min(workers, 8))
+
+        def _list(db: str) -> list[GlueColumn]:
+            return list(self._database_columns(db, tbl_match))
+
+        pending: deque[Future[list[GlueColumn]]] = deque()
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            try:
+                for db in self.iter_databases():
+                    if db_match is not None and not db_match(db):
+                        continue
+                    pending.append(ex.submit(_list, db))
+                    if len(pending) >= workers:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for fut in pending:
+                    fut.cancel()
+
+    def _database_columns(
+        self, db: str, tbl_match: Callable[[str], Any] | None
+    ) -> Iterator[GlueColumn]:
+        for tbl in self.iter_tables(db):
+            name = tbl.get("Name")
+            if not name:
                 continue
-            for tbl in self.list_tables(db):
-                name = tbl.get("Name")
-                if not name:
-                    continue
-                if not any(fnmatch.fnmatch(name, p) for p in tbl_pats):
-                    continue
-                sd = tbl.get("StorageDescriptor") or {}
-                cols = sd.get("Columns") or []
-                for c in cols:
-                    yield GlueColumn(
-                        database=db,
-                        table=name,  # type: ignore[arg-type]
-                        name=c.get("Name"),  # type: ignore[arg-type]
-                        type=c.get("Type"),  # type: ignore[arg-type]
-                        comment=c.get("Comment"),  # type: ignore[arg-type]
-                        parameters=c.get("Parameters") or {},
-                    )
+            if tbl_match is not None and not tbl_match(name):
+                continue
+            sd = tbl.get("StorageDescriptor") or {}
+            cols = sd.get("Columns") or []
+            for c in cols:
+                yield GlueColumn(
+                    database=db,
+                    table=name,
+                    name=c.get("Name"),
+                    type=c.get("Type"),
+                    comment=c.get("Comment"),
+                    parameters=c.get("Parameters") or {},
+                )
 
     # ----- Writeback (idempotent) -----
 
     def get_table(self, database: str, table: str) -> dict[str, Any]:
-        def _call() -> dict[str, Any]:
-            return cast(dict[str, Any], self._client.get_table(DatabaseName=database, Name=table))
-
-        return cast(
-            dict[str, Any],
-            _with_retries(_call, max_retries=self._max_retries, base_delay=self._base_delay),
-        )
+        return self._call(self._client.get_table, DatabaseName=database, Name=table)
 
     def update_column_tags(
         self,
@@ -195,56 +244,90 @@ class GlueCatalogClient:
 
         Returns True if an update was applied; False if no changes needed.
         """
+        changed = self.update_column_tags_batch(
+            database=database, table=table, updates={column: (pii, pii_types, append_comment)}
+        )
+        return bool(changed)
+
+    def update_column_tags_batch(
+        self,
+        *,
+        database: str,
+        table: str,
+        updates: dict[str, tuple[bool, list[str] | None, str | None]],
+    ) -> list[str]:
+        """Apply ``{column: (pii, pii_types, append_comment)}`` with one Get/UpdateTable.
+
+        Returns the names of the columns that changed; no update is issued if none did.
+        """
         tbl: dict[str, Any] = self.get_table(database, table).get("Table", {})
         tbl_input = _table_to_input(tbl)
+        before = _digest(tbl_input)
 
         sd = tbl_input.get("StorageDescriptor") or {}
         cols = sd.get("Columns") or []
-        changed = False
-        for c in cols:
-            if c.get("Name") != column:
+        idx = {c.get("Name"): i for i, c in enumerate(cols)}
+        changed: list[str] = []
+        # Target values per distinct (pii, pii_types); batches normally share a single one
+        targets: dict[tuple[bool, tuple[str, ...] | None], tuple[str, str | None]] = {}
+        for column, (pii, pii_types, append_comment) in updates.items():
+            i = idx.get(column)
+            if i is None:
                 continue
+            c = cols[i]
+            touched = False
+            tkey = (bool(pii), None if pii_types is None else tuple(pii_types))
+            target = targets.get(tkey)
+            if target is None:
+                desired = None
+                if pii_types is not None:
+                    desired = ",".join(sorted(t.strip() for t in pii_types if t.strip()))
+                target = targets[tkey] = ("true" if pii else "false", desired)
+            pii_str, desired = target
             params = c.get("Parameters") or {}
-            new_params = dict(params)
-            # idempotent parameter updates
-            if str(new_params.get("pii")).lower() != str(bool(pii)).lower():
-                new_params["pii"] = str(bool(pii)).lower()
-            if pii_types is not None:
-                desired_list = [t.strip() for t in pii_types if t.strip()]
-                desired = ",".join(sorted(desired_list))
-                if new_params.get("pii_types") != desired:
+            # idempotent parameter updates; only copy the dict on a real change
+            pii_stale = str(params.get("pii")).lower() != pii_str
+            types_stale = desired is not None and params.get("pii_types") != desired
+            if pii_stale or types_stale:
+                new_params = dict(params)
+                if pii_stale:
+                    new_params["pii"] = pii_str
+                if types_stale:
                     new_params["pii_types"] = desired
-            if new_params != params:
                 c["Parameters"] = new_params
-                changed = True
+                touched = True
 
             if append_comment:
                 existing: str = c.get("Comment") or ""
                 if append_comment not in (existing or ""):
                     c["Comment"] = (existing + (" " if existing else "") + append_comment)[:255]
-                    changed = True
-            break
+                    touched = True
+            if touched:
+                changed.append(column)
 
         if not changed:
-            return False
+            return changed
+        # Edits can cancel out (e.g. a comment already at the 255-char cap); skip the
+        # round-trip when the payload is byte-for-byte what Glue already has.
+        if _digest(tbl_input) == before:
+            return []
 
-        def _call() -> Any:
-            return self._client.update_table(DatabaseName=database, TableInput=tbl_input)
-
-        _with_retries(_call, max_retries=self._max_retries, base_delay=self._base_delay)
-        return True
+        extra = {"SkipArchive": True} if self._skip_archive else {}
+        self._call(self._client.update_table, DatabaseName=database, TableInput=tbl_input, **extra)
+        return changed
 
 
 # --------- Helpers ---------
 
 
-def _table_to_input(tbl: dict[str, Any]) -> dict[str, Any]:
-    """Convert Glue GetTable output to a valid TableInput for UpdateTable.
+def _digest(tbl_input: dict[str, Any]) -> bytes:
+    payload = json.dumps(tbl_input, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
 
-    Strictly whitelist allowed TableInput fields and sanitize nested shapes to
-    avoid InvalidInputException from read-only/unknown fields in GetTable output.
-    """
-    allowed_table_keys = {
+
+# TableInput whitelists (UpdateTable rejects read-only/unknown GetTable fields)
+_TABLE_KEYS = frozenset(
+    {
         # Required
         "Name",
         # Optional
@@ -259,88 +342,95 @@ def _table_to_input(tbl: dict[str, Any]) -> dict[str, Any]:
         "Parameters",
         "TargetTable",
     }
+)
+_COLUMN_KEYS = frozenset({"Name", "Type", "Comment", "Parameters"})
+_SERDE_KEYS = frozenset({"Name", "SerializationLibrary", "Parameters"})
+_ORDER_KEYS = frozenset({"Column", "SortOrder"})
+_SKEWED_KEYS = frozenset(
+    {"SkewedColumnNames", "SkewedColumnValues", "SkewedColumnValueLocationMaps"}
+)
+_SCHEMA_REF_KEYS = frozenset({"SchemaId", "SchemaVersionId", "SchemaVersionNumber"})
+_SCHEMA_ID_KEYS = frozenset({"SchemaArn", "SchemaName", "RegistryName"})
+_STORAGE_KEYS = frozenset(
+    {
+        "Columns",
+        "Location",
+        "AdditionalLocations",
+        "InputFormat",
+        "OutputFormat",
+        "Compressed",
+        "NumberOfBuckets",
+        "SerdeInfo",
+        "BucketColumns",
+        "SortColumns",
+        "Parameters",
+        "SkewedInfo",
+        "StoredAsSubDirectories",
+        "SchemaReference",
+    }
+)
+_TARGET_TABLE_KEYS = frozenset({"CatalogId", "DatabaseName", "Name"})
+
+
+def _pick(d: dict[str, Any], keys: frozenset[str]) -> dict[str, Any]:
+    return {k: d[k] for k in keys if k in d}
+
+
+def _sanitize_column(col: dict[str, Any]) -> dict[str, Any]:
+    out = _pick(col, _COLUMN_KEYS)
+    # Column parameters are the only nested values callers mutate; give them a fresh dict
+    if isinstance(out.get("Parameters"), dict):
+        out["Parameters"] = dict(out["Parameters"])
+    return out
+
+
+def _sanitize_schema_ref(ref: dict[str, Any]) -> dict[str, Any]:
+    out = _pick(ref, _SCHEMA_REF_KEYS)
+    if "SchemaId" in out and isinstance(out["SchemaId"], dict):
+        out["SchemaId"] = _pick(out["SchemaId"], _SCHEMA_ID_KEYS)
+    return out
+
 
-    def _sanitize_column(col: dict[str, Any]) -> dict[str, Any]:
-        allowed = {"Name", "Type", "Comment", "Parameters"}
-        return {k: v for k, v in col.items() if k in allowed}
-
-    def _sanitize_serde(info: dict[str, Any]) -> dict[str, Any]:
-        allowed = {"Name", "SerializationLibrary", "Parameters"}
-        return {k: v for k, v in info.items() if k in allowed}
-
-    def _sanitize_order(ord_: dict[str, Any]) -> dict[str, Any]:
-        allowed = {"Column", "SortOrder"}
-        return {k: v for k, v in ord_.items() if k in allowed}
-
-    def _sanitize_skewed(info: dict[str, Any]) -> dict[str, Any]:
-        allowed = {
-            "SkewedColumnNames",
-            "SkewedColumnValues",
-            "SkewedColumnValueLocationMaps",
-        }
-        return {k: v for k, v in info.items() if k in allowed}
-
-    def _sanitize_schema_ref(ref: dict[str, Any]) -> dict[str, Any]:
-        allowed = {"SchemaId", "SchemaVersionId", "SchemaVersionNumber"}
-        out = {k: v for k, v in ref.items() if k in allowed}
-        if "SchemaId" in out and isinstance(out["SchemaId"], dict):
-            sid_allowed = {"SchemaArn", "SchemaName", "RegistryName"}
-            out["SchemaId"] = {k: v for k, v in out["SchemaId"].items() if k in sid_allowed}
-        return out
-
-    def _sanitize_storage_descriptor(sd: dict[str, Any]) -> dict[str, Any]:
-        allowed = {
-            "Columns",
-            "Location",
-            "AdditionalLocations",
-            "InputFormat",
-            "OutputFormat",
-            "Compressed",
-            "NumberOfBuckets",
-            "SerdeInfo",
-            "BucketColumns",
-            "SortColumns",
-            "Parameters",
-            "SkewedInfo",
-            "StoredAsSubDirectories",
-            "SchemaReference",
-        }
-        sdo = {k: v for k, v in sd.items() if k in allowed}
-        if "Columns" in sdo and isinstance(sdo["Columns"], list):
-            sdo["Columns"] = [_sanitize_column(c) for c in sdo["Columns"] if isinstance(c, dict)]
-        if "SerdeInfo" in sdo and isinstance(sdo["SerdeInfo"], dict):
-            sdo["SerdeInfo"] = _sanitize_serde(sdo["SerdeInfo"])  # type: ignore[assignment]
-        if "SortColumns" in sdo and isinstance(sdo["SortColumns"], list):
-            sdo["SortColumns"] = [
-                _sanitize_order(o) for o in sdo["SortColumns"] if isinstance(o, dict)
-            ]
-        if "SkewedInfo" in sdo and isinstance(sdo["SkewedInfo"], dict):
-            sdo["SkewedInfo"] = _sanitize_skewed(sdo["SkewedInfo"])  # type: ignore[assignment]
-        if "SchemaReference" in sdo and isinstance(sdo["SchemaReference"], dict):
-            sdo["SchemaReference"] = _sanitize_schema_ref(sdo["SchemaReference"])  # type: ignore[assignment]
-        return sdo
-
-    def _sanitize_partition_keys(pks: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        return [_sanitize_column(c) for c in pks if isinstance(c, dict)]
-
-    def _sanitize_target_table(tt: dict[str, Any]) -> dict[str, Any]:
-        allowed = {"CatalogId", "DatabaseName", "Name"}
-        return {k: v for k, v in tt.items() if k in allowed}
+def _sanitize_storage_descriptor(sd: dict[str, Any]) -> dict[str, Any]:
+    sdo = _pick(sd, _STORAGE_KEYS)
+    if "Columns" in sdo and isinstance(sdo["Columns"], list):
+        sdo["Columns"] = [_sanitize_column(c) for c in sdo["Columns"] if isinstance(c, dict)]
+    if "SerdeInfo" in sdo and isinstance(sdo["SerdeInfo"], dict):
+        sdo["SerdeInfo"] = _pick(sdo["SerdeInfo"], _SERDE_KEYS)
+    if "SortColumns" in sdo and isinstance(sdo["SortColumns"], list):
+        sdo["SortColumns"] = [
+            _pick(o, _ORDER_KEYS) for o in sdo["SortColumns"] if isinstance(o, dict)
+        ]
+    if "SkewedInfo" in sdo and isinstance(sdo["SkewedInfo"], dict):
+        sdo["SkewedInfo"] = _pick(sdo["SkewedInfo"], _SKEWED_KEYS)
+    if "SchemaReference" in sdo and isinstance(sdo["SchemaReference"], dict):
+        sdo["SchemaReference"] = _sanitize_schema_ref(sdo["SchemaReference"])
+    return sdo
 
+
+def _table_to_input(tbl: dict[str, Any]) -> dict[str, Any]:
+    """Convert Glue GetTable output to a valid TableInput for UpdateTable.
+
+    Strictly whitelist allowed TableInput fields and sanitize nested shapes to
+    avoid InvalidInputException from read-only/unknown fields in GetTable output.
+    """
     # Build whitelisted table
     ti: dict[str, Any] = {}
-    for k in allowed_table_keys:
+    for k in _TABLE_KEYS:
         if k not in tbl:
             continue
         v = tbl[k]
         if k == "StorageDescriptor" and isinstance(v, dict):
             ti[k] = _sanitize_storage_descriptor(v)
         elif k == "PartitionKeys" and isinstance(v, list):
-            ti[k] = _sanitize_partition_keys(v)
+            ti[k] = [_sanitize_column(c) for c in v if isinstance(c, dict)]
         elif k == "TargetTable" and isinstance(v, dict):
-            ti[k] = _sanitize_target_table(v)
+            ti[k] = _pick(v, _TARGET_TABLE_KEYS)
+        elif isinstance(v, dict):
+            # Remaining fields are primitives or flat string maps (e.g. Parameters)
+            ti[k] = dict(v)
         else:
-            ti[k] = copy.deepcopy(v)
+            ti[k] = v
 
     # Ensure minimal required defaults exist
     ti.setdefault("Name", tbl.get("Name"))
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import fnmatch
 import os
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
-from typing import Any, cast
+from types import MappingProxyType
+from typing import Any, NamedTuple, TypeVar, cast
 
 try:  # Optional dependency; tests may mock
     from hmsclient import hmsclient as _hms
@@ -13,25 +13,42 @@ except Exception:  # pragma: no cover - optional dependency guard
     _hms = None  # type: ignore
     _ttypes = None  # type: ignore
 
+from ._common import TTLCache, compile_patterns
 
-@dataclass
+
+@dataclass(slots=True)
 class HMSColumn:
     database: str
     table: str
     name: str
     type: str | None
     comment: str | None
-    properties: dict[str, str]
+    properties: Mapping[str, str]
 
     @property
     def ref(self) -> str:
         return f"hms://{self.database}/{self.table}/{self.name}"
 
 
+class HMSColumnTuple(NamedTuple):
+    """Tuple form of :class:`HMSColumn` (same field order) for bulk enumeration."""
+
+    database: str
+    table: str
+    name: str
+    type: str | None
+    comment: str | None
+    properties: Mapping[str, str]
+
+
+# Column record built straight from listing fields: HMSColumn or HMSColumnTuple
+_Row = TypeVar("_Row", HMSColumn, HMSColumnTuple)
+
+
 class HiveMetastoreClient:
     """Hive Metastore (Thrift) client wrapper.
 
-    - Enumerates columns via Thrift `get_table`
+    - Enumerates columns via Thrift `get_table_objects_by_name` (batched) or `get_table`
     - Writes back by altering table column comments and table parameters
 
     Env defaults:
@@ -39,13 +56,21 @@ class HiveMetastoreClient:
       - `HMS_PORT` (default: 9083)
     """
 
+    # One Thrift socket without a lock: calls must not overlap across threads
+    concurrent_writes = False
+
     def __init__(
         self,
         *,
         host: str | None = None,
         port: int | None = None,
         raw_client: Any | None = None,
+        batch_size: int = 100,
+        cache_ttl: float = 60.0,
     ) -> None:
+        self.batch_size = max(1, int(batch_size))
+        # Listing and get_table responses, reused e.g. between a scan and its write-back
+        self._cache = TTLCache(ttl=cache_ttl)
         if raw_client is not None:
             self._client = raw_client
         else:
@@ -62,48 +87,113 @@ class HiveMetastoreClient:
 
     # ------------- Enumeration -------------
 
-    def list_databases(self) -> list[str]:
-        dbs = cast(list[str], self._client.get_all_databases())
+    def list_databases(self, pattern: str | None = None) -> list[str]:
+        """List databases, optionally filtered server-side by a Hive ``pattern``."""
+        if pattern is not None and hasattr(self._client, "get_databases"):
+            dbs = self._cache.get_or_set(
+                ("databases", pattern),
+                lambda: cast(list[str], self._client.get_databases(pattern)),
+            )
+        else:
+            dbs = self._cache.get_or_set(
+                ("databases",), lambda: cast(list[str], self._client.get_all_databases())
+            )
         return sorted(dbs)
 
-    def list_tables(self, database: str) -> list[str]:
-        tbls = cast(list[str], self._client.get_all_tables(database))
+    def list_tables(self, database: str, pattern: str | None = None) -> list[str]:
+        """List tables of ``database``, optionally filtered server-side by a Hive ``pattern``."""
+        if pattern is not None and hasattr(self._client, "get_tables"):
+            tbls = self._cache.get_or_set(
+                ("tables", database, pattern),
+                lambda: cast(list[str], self._client.get_tables(database, pattern)),
+            )
+        else:
+            tbls = self._cache.get_or_set(
+                ("tables", database),
+                lambda: cast(list[str], self._client.get_all_tables(database)),
+            )
         return sorted(tbls)
 
     def get_table(self, database: str, table: str) -> Any:
-        return self._client.get_table(database, table)
+        # The Thrift object may be shared through the cache; writers invalidate after use
+        return self._cache.get_or_set(
+            ("table", database, table), lambda: self._client.get_table(database, table)
+        )
+
+    def invalidate(self, database: str | None = None, table: str | None = None) -> None:
+        """Drop the cached ``get_table`` for ``database.table``, or everything when omitted."""
+        if database is None or table is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(("table", database, table))
+
+    def iter_table_objects(self, database: str, names: list[str]) -> Iterator[tuple[str, Any]]:
+        """Yield ``(name, Table)`` for ``names``, fetching ``batch_size`` per round-trip.
+
+        Falls back to one ``get_table`` per name when the client lacks the bulk call.
+        Bulk-fetched tables are cached, so a write-back right after a scan skips its
+        ``get_table`` round-trip.
+        """
+        bulk = getattr(self._client, "get_table_objects_by_name", None)
+        if bulk is None:
+            for tname in names:
+                yield tname, self.get_table(database, tname)
+            return
+        for i in range(0, len(names), self.batch_size):
+            chunk = names[i : i + self.batch_size]
+            # The metastore returns no particular order and skips dropped tables
+            by_name = {getattr(t, "tableName", None): t for t in bulk(database, chunk) or []}
+            for tname in chunk:
+                t = by_name.get(tname)
+                if t is not None:
+                    self._cache.put(("table", database, tname), t)
+                    yield tname, t
 
     def iter_columns(
         self,
         db_patterns: Iterable[str] | None = None,
         table_patterns: Iterable[str] | None = None,
     ) -> Iterator[HMSColumn]:
-        db_pats = list(db_patterns or ["*"])
-        tbl_pats = list(table_patterns or ["*"])
-        for db in self.list_databases():
-            if not any(fnmatch.fnmatch(db, p) for p in db_pats):
+        return self._iter_rows(HMSColumn, db_patterns, table_patterns)
+
+    def iter_columns_fast(
+        self,
+        db_patterns: Iterable[str] | None = None,
+        table_patterns: Iterable[str] | None = None,
+    ) -> Iterator[HMSColumnTuple]:
+        """Like :meth:`iter_columns`, yielding plain named tuples instead of dataclasses."""
+        return self._iter_rows(HMSColumnTuple, db_patterns, table_patterns)
+
+    def _iter_rows(
+        self,
+        make: type[_Row],
+        db_patterns: Iterable[str] | None,
+        table_patterns: Iterable[str] | None,
+    ) -> Iterator[_Row]:
+        # Each column record is built once, directly in the requested type
+        db_pats = None if db_patterns is None else list(db_patterns)
+        tbl_pats = None if table_patterns is None else list(table_patterns)
+        db_match = compile_patterns(db_pats)
+        tbl_match = compile_patterns(tbl_pats)
+        # Push simple globs to the metastore; the client-side match stays authoritative
+        db_hive = _hive_pattern(db_pats)
+        tbl_hive = _hive_pattern(tbl_pats)
+        for db in self.list_databases(db_hive):
+            if db_match is not None and not db_match(db):
                 continue
-            for tname in self.list_tables(db):
-                if not any(fnmatch.fnmatch(tname, p) for p in tbl_pats):
-                    continue
-                t = self.get_table(db, tname)
+            names = [t for t in self.list_tables(db, tbl_hive) if tbl_match is None or tbl_match(t)]
+            for tname, t in self.iter_table_objects(db, names):
                 sd = getattr(t, "sd", None)
                 cols = getattr(sd, "cols", []) or []
-                props = cast(dict[str, str], getattr(t, "parameters", {}) or {})
+                # One read-only view per table, shared by all of its columns
+                props = MappingProxyType(cast(dict[str, str], getattr(t, "parameters", {}) or {}))
                 for c in cols:
                     name = getattr(c, "name", None)
                     dtype = getattr(c, "type", None)
                     comment = getattr(c, "comment", None)
                     if not name:
                         continue
-                    yield HMSColumn(
-                        database=db,
-                        table=tname,
-                        name=name,
-                        type=dtype,
-                        comment=comment,
-                        properties=props,
-                    )
+                    yield make(db, tname, name, dtype, comment, props)
 
     # ------------- Writeback -------------
 
@@ -121,48 +211,83 @@ class HiveMetastoreClient:
 
         Returns True if any change was applied.
         """
+        changed = self.update_column_tags_batch(
+            database=database, table=table, updates={column: (pii, pii_types, append_comment)}
+        )
+        return bool(changed)
+
+    def update_column_tags_batch(
+        self,
+        *,
+        database: str,
+        table: str,
+        updates: dict[str, tuple[bool, list[str] | None, str | None]],
+    ) -> list[str]:
+        """Apply ``{column: (pii, pii_types, append_comment)}`` with one get/alter_table.
+
+        The ``Table`` comes from the cache when a scan just fetched it. Returns the names
+        of the columns that changed; no alter_table is issued if none did.
+        """
         t = self.get_table(database, table)
-        changed = False
+        # ``t`` is edited in place below; take it out of the cache so it is never served
+        # half-modified and the next read sees the metastore's copy
+        self.invalidate(database, table)
+        changed: list[str] = []
 
-        # Update table-level parameters to reflect column tagging
         params = cast(dict[str, str], getattr(t, "parameters", {}) or {})
         new_params = dict(params)
-        key_enabled = f"cps.pii.col.{column}"
-        if str(new_params.get(key_enabled)).lower() != str(bool(pii)).lower():
-            new_params[key_enabled] = str(bool(pii)).lower()
-            changed = True
-        if pii_types is not None:
-            desired = ",".join(sorted(t.strip() for t in pii_types if t.strip()))
-            key_types = f"cps.pii_types.col.{column}"
-            if new_params.get(key_types) != desired:
-                new_params[key_types] = desired
-                changed = True
-        if new_params != params:
-            t.parameters = new_params  # type: ignore[attr-defined]
-
-        # Update column comment if needed
         sd = getattr(t, "sd", None)
-        cols = getattr(sd, "cols", []) or []
-        for c in cols:
-            if getattr(c, "name", None) != column:
-                continue
-            if append_comment:
+        cols = {getattr(c, "name", None): c for c in getattr(sd, "cols", []) or []}
+        for column, (pii, pii_types, append_comment) in updates.items():
+            touched = False
+            # Update table-level parameters to reflect column tagging
+            key_enabled = f"cps.pii.col.{column}"
+            if str(new_params.get(key_enabled)).lower() != str(bool(pii)).lower():
+                new_params[key_enabled] = str(bool(pii)).lower()
+                touched = True
+            if pii_types is not None:
+                desired = ",".join(sorted(pt.strip() for pt in pii_types if pt.strip()))
+                key_types = f"cps.pii_types.col.{column}"
+                if new_params.get(key_types) != desired:
+                    new_params[key_types] = desired
+                    touched = True
+
+            # Update column comment if needed
+            c = cols.get(column)
+            if c is not None and append_comment:
                 existing = cast(str, getattr(c, "comment", None) or "")
                 if append_comment not in existing:
                     new_comment = (existing + (" " if existing else "") + append_comment)[:255]
                     c.comment = new_comment  # type: ignore[attr-defined]
-                    changed = True
-            break
+                    touched = True
+            if touched:
+                changed.append(column)
 
         if not changed:
-            return False
+            return []
+        if new_params != params:
+            t.parameters = new_params  # type: ignore[attr-defined]
 
         # Apply via alter_table
         self._client.alter_table(database, table, t)
-        return True
+        return changed
+
+
+def _hive_pattern(patterns: list[str] | None) -> str | None:
+    """Translate fnmatch patterns to one metastore pattern, or None if not expressible.
+
+    Hive patterns support ``*`` and ``|`` alternation only; ``?`` and character classes
+    (and a bare ``*``, which filters nothing) keep the unfiltered listing.
+    """
+    if not patterns or "*" in patterns:
+        return None
+    if any(ch in p for p in patterns for ch in "?[]|"):
+        return None
+    return "|".join(patterns)
 
 
 __all__ = [
     "HiveMetastoreClient",
     "HMSColumn",
+    "HMSColumnTuple",
 ]
@@ -1,18 +1,44 @@
 from __future__ import annotations
 
-import fnmatch
 import os
-from collections.abc import Iterable, Iterator
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, cast
+from types import MappingProxyType
+from typing import Any, NamedTuple, TypeVar, cast
 
 try:  # Optional at runtime; tests may mock
     import requests  # type: ignore
 except Exception:  # pragma: no cover - optional dependency in some envs
     requests = None  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional fast path
+    orjson = None  # type: ignore
 
-@dataclass
+
+from ._common import TTLCache, compile_patterns
+
+# Compiled name filter; None matches everything
+_Match = Callable[[str], Any] | None
+# Column record built straight from listing fields: UnityColumn or UnityColumnTuple
+_Row = TypeVar("_Row", "UnityColumn", "UnityColumnTuple")
+
+_INFO_SCHEMA_COLUMNS = (
+    "SELECT table_catalog, table_schema, table_name, column_name, data_type, comment "
+    "FROM system.information_schema.columns"
+)
+
+_PAGE: dict[str, Any] = {"max_results": 1000}
+
+# information_schema rows carry no table properties; every such column shares this view
+_NO_PROPERTIES: Mapping[str, str] = MappingProxyType({})
+
+
+@dataclass(slots=True)
 class UnityColumn:
     catalog: str
     schema: str
@@ -20,13 +46,25 @@ class UnityColumn:
     name: str
     type: str | None
     comment: str | None
-    properties: dict[str, str]
+    properties: Mapping[str, str]
 
     @property
     def ref(self) -> str:
         return f"unity://{self.catalog}/{self.schema}/{self.table}/{self.name}"
 
 
+class UnityColumnTuple(NamedTuple):
+    """Tuple form of :class:`UnityColumn` (same field order) for bulk enumeration."""
+
+    catalog: str
+    schema: str
+    table: str
+    name: str
+    type: str | None
+    comment: str | None
+    properties: Mapping[str, str]
+
+
 class UnityCatalogClient:
     """Databricks Unity Catalog client.
 
@@ -36,6 +74,7 @@ class UnityCatalogClient:
     Auth via env:
       - REST:  DATABRICKS_HOST, DATABRICKS_TOKEN
       - JDBC:  DATABRICKS_HOST, DATABRICKS_TOKEN, DATABRICKS_HTTP_PATH
+      - Statement Execution API listing: REST vars plus DATABRICKS_WAREHOUSE_ID
     """
 
     def __init__(
@@ -47,11 +86,23 @@ class UnityCatalogClient:
         session: Any | None = None,
         sql_conn: Any | None = None,
         fetch_size: int = 1000,
+        rest_workers: int = 16,
+        warehouse_id: str | None = None,
+        cache_ttl: float = 60.0,
+        statement_max_wait_seconds: float = 600.0,
     ) -> None:
         self.host = host or os.getenv("DATABRICKS_HOST") or ""
         self.token = token or os.getenv("DATABRICKS_TOKEN") or ""
         self.http_path = http_path or os.getenv("DATABRICKS_HTTP_PATH") or ""
+        self.warehouse_id = warehouse_id or os.getenv("DATABRICKS_WAREHOUSE_ID") or ""
+        # Listing and get_table responses, reused e.g. between a scan and its write-back
+        self._cache = TTLCache(ttl=cache_ttl)
+        # Column comments seen by the SQL listing, so write-back can skip its SELECT.
+        # Keyed by table full name ({column: comment}), so invalidate drops them together.
+        self._comments = TTLCache(ttl=cache_ttl, maxsize=1 << 14)
         self.fetch_size = max(1, int(fetch_size))
+        self.rest_workers = max(1, int(rest_workers))
+        self.statement_max_wait_seconds = float(statement_max_wait_seconds)
 
         self._session = session
         self._sql_conn = sql_conn
@@ -64,8 +115,21 @@ class UnityCatalogClient:
                 )
             s = requests.Session()
             s.headers.update({"Authorization": f"Bearer {self.token}"})
+            # Room for one pooled connection per concurrent get_table
+            pool = max(10, self.rest_workers)
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool, pool_maxsize=pool)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
             self._session = s
 
+    @property
+    def concurrent_writes(self) -> bool:
+        """Whether write-backs may run on several threads at once.
+
+        The REST session may be shared; a DB-API connection (threadsafety 1) may not.
+        """
+        return self._sql_conn is None
+
     # ------------- Enumeration -------------
 
     def iter_columns(
@@ -74,54 +138,138 @@ class UnityCatalogClient:
         schema_patterns: Iterable[str] | None = None,
         table_patterns: Iterable[str] | None = None,
     ) -> Iterator[UnityColumn]:
-        """Yield UnityColumn via JDBC if available, else REST traversal.
+        """Yield UnityColumn via JDBC if available, else REST.
 
-        Patterns use fnmatch semantics (e.g., '*', 'demo*').
+        With a SQL warehouse configured, REST listing runs one information_schema query
+        through the Statement Execution API instead of a per-table traversal; columns
+        listed that way carry no table properties. Patterns use fnmatch semantics
+        (e.g., '*', 'demo*').
         """
-        cat_pats = list(catalog_patterns or ["*"])
-        sch_pats = list(schema_patterns or ["*"])
-        tbl_pats = list(table_patterns or ["*"])
+        return self._iter_rows(UnityColumn, catalog_patterns, schema_patterns, table_patterns)
+
+    def iter_columns_fast(
+        self,
+        catalog_patterns: Iterable[str] | None = None,
+        schema_patterns: Iterable[str] | None = None,
+        table_patterns: Iterable[str] | None = None,
+    ) -> Iterator[UnityColumnTuple]:
+        """Like :meth:`iter_columns`, yielding plain named tuples instead of dataclasses."""
+        return self._iter_rows(UnityColumnTuple, catalog_patterns, schema_patterns, table_patterns)
+
+    def _iter_rows(
+        self,
+        make: type[_Row],
+        catalog_patterns: Iterable[str] | None,
+        schema_patterns: Iterable[str] | None,
+        table_patterns: Iterable[str] | None,
+    ) -> Iterator[_Row]:
+        # Each column record is built once, directly in the requested type
+        cat_pats = compile_patterns(catalog_patterns)
+        sch_pats = compile_patterns(schema_patterns)
+        tbl_pats = compile_patterns(table_patterns)
 
         if self._sql_conn is not None:
-            yield from self._iter_columns_sql(cat_pats, sch_pats, tbl_pats)
+            yield from self._iter_columns_sql(make, cat_pats, sch_pats, tbl_pats)
+            return
+        if self.warehouse_id and self._session is not None:
+            yield from self._iter_columns_statement_api(make, cat_pats, sch_pats, tbl_pats)
             return
-        yield from self._iter_columns_rest(cat_pats, sch_pats, tbl_pats)
+        yield from self._iter_columns_rest(make, cat_pats, sch_pats, tbl_pats)
 
     # ----- JDBC path (system.information_schema) -----
 
     def _iter_columns_sql(
-        self, cat_pats: list[str], sch_pats: list[str], tbl_pats: list[str]
-    ) -> Iterator[UnityColumn]:
-        q = (
-            "SELECT table_catalog, table_schema, table_name, column_name, data_type, comment "
-            "FROM system.information_schema.columns"
-        )
+        self, make: type[_Row], cat_pats: _Match, sch_pats: _Match, tbl_pats: _Match
+    ) -> Iterator[_Row]:
         assert self._sql_conn is not None
         conn = cast(Any, self._sql_conn)
         cur = conn.cursor()
         cur.arraysize = self.fetch_size
-        cur.execute(q)
+        cur.execute(_INFO_SCHEMA_COLUMNS)
+
+        def _rows() -> Iterator[Any]:
+            while True:
+                rows = cur.fetchmany(self.fetch_size)
+                if not rows:
+                    return
+                yield from rows
+
+        for row in _filter_info_schema_rows(_rows(), make, cat_pats, sch_pats, tbl_pats):
+            tkey = f"{row.catalog}.{row.schema}.{row.table}"
+            seen = self._comments.get(tkey)
+            if seen is None:
+                seen = {}
+                self._comments.put(tkey, seen)
+            # Filled in place by this listing only; writers store a fresh copy
+            seen[row.name] = row.comment or ""
+            yield row
+
+    # ----- Statement Execution API path -----
+
+    def _iter_columns_statement_api(
+        self, make: type[_Row], cat_pats: _Match, sch_pats: _Match, tbl_pats: _Match
+    ) -> Iterator[_Row]:
+        body = {
+            "warehouse_id": self.warehouse_id,
+            "statement": _INFO_SCHEMA_COLUMNS,
+            "wait_timeout": "30s",
+            "disposition": "EXTERNAL_LINKS",
+            "format": "JSON_ARRAY",
+        }
+        resp = self._rest_post("/api/2.0/sql/statements", body)
+        sid = resp.get("statement_id")
+        finished = False
+        try:
+            deadline = time.monotonic() + self.statement_max_wait_seconds
+            delay = 0.5
+            while (state := (resp.get("status") or {}).get("state")) in {"PENDING", "RUNNING"}:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"information_schema statement {sid} timed out; last_state={state}"
+                    )
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, 5.0)
+                resp = self._rest_get(f"/api/2.0/sql/statements/{sid}")
+            status = resp.get("status") or {}
+            if status.get("state") != "SUCCEEDED":
+                msg = (status.get("error") or {}).get("message") or status.get("state")
+                raise RuntimeError(f"information_schema statement failed: {msg}")
+            yield from _filter_info_schema_rows(
+                self._iter_statement_rows(resp.get("result") or {}),
+                make,
+                cat_pats,
+                sch_pats,
+                tbl_pats,
+            )
+            finished = True
+        finally:
+            # Timeout, error or the caller stopped early (GeneratorExit): free the warehouse
+            if not finished and sid:
+                self._cancel_statement(sid)
+
+    def _cancel_statement(self, sid: str) -> None:
+        try:
+            self._rest_post(f"/api/2.0/sql/statements/{sid}/cancel", {})
+        except Exception:
+            # Best effort; the original error (if any) is the one worth surfacing
+            pass
+
+    def _iter_statement_rows(self, result: dict[str, Any]) -> Iterator[list[Any]]:
+        """Walk result chunks: inline ``data_array`` or presigned ``external_links``."""
         while True:
-            rows = cur.fetchmany(self.fetch_size)
-            if not rows:
-                break
-            for r in rows:
-                catalog, schema, table, col, dtype, comment = r
-                if not any(fnmatch.fnmatch(catalog, p) for p in cat_pats):
-                    continue
-                if not any(fnmatch.fnmatch(schema, p) for p in sch_pats):
-                    continue
-                if not any(fnmatch.fnmatch(table, p) for p in tbl_pats):
-                    continue
-                yield UnityColumn(
-                    catalog=catalog,
-                    schema=schema,
-                    table=table,
-                    name=col,
-                    type=dtype,
-                    comment=comment,
-                    properties={},
-                )
+            yield from result.get("data_array") or []
+            next_link = result.get("next_chunk_internal_link")
+            for link in result.get("external_links") or []:
+                assert self._session is not None
+                # Presigned cloud-storage URL: must not carry the workspace token
+                r = self._session.get(link["external_link"], headers={"Authorization": None})
+                r.raise_for_status()
+                yield from _json_body(r) or []
+                next_link = link.get("next_chunk_internal_link")
+            if not next_link:
+                return
+            result = self._rest_get(next_link)
 
     # ----- REST path -----
 
@@ -131,7 +279,15 @@ class UnityCatalogClient:
         url = self._join(self.host, path)
         resp = self._session.get(url, params=params or {})
         resp.raise_for_status()
-        return resp.json()  # type: ignore[no-any-return]
+        return _json_body(resp)  # type: ignore[no-any-return]
+
+    def _rest_post(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
+        if not self._session:
+            raise RuntimeError("REST session not configured; provide host/token or session")
+        url = self._join(self.host, path)
+        resp = self._session.post(url, json=body)
+        resp.raise_for_status()
+        return _json_body(resp)  # type: ignore[no-any-return]
 
     def _rest_patch(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
         if not self._session:
@@ -139,7 +295,7 @@ class UnityCatalogClient:
         url = self._join(self.host, path)
         resp = self._session.patch(url, json=body)
         resp.raise_for_status()
-        return resp.json()  # type: ignore[no-any-return]
+        return _json_body(resp)  # type: ignore[no-any-return]
 
     @staticmethod
     def _join(host: str, path: str) -> str:
@@ -147,99 +303,137 @@ class UnityCatalogClient:
         path = path.lstrip("/")
         return f"{host}/{path}"
 
-    def list_catalogs(self) -> list[str]:
+    def _iter_pages(self, path: str, params: dict[str, Any], items_key: str) -> Iterator[Any]:
+        """Yield the items of a paginated listing, prefetching the next page.
+
+        The GET for page N+1 runs in the background while page N's items are consumed,
+        so callers doing per-item work (e.g. submitting get_table) hide the round-trip.
+        """
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            resp = self._rest_get(path, params)
+            while True:
+                token = resp.get("next_page_token")
+                nxt: Future[dict[str, Any]] | None = None
+                if token:
+                    nxt = ex.submit(self._rest_get, path, {**params, "page_token": token})
+                try:
+                    yield from resp.get(items_key, []) or []
+                except GeneratorExit:
+                    if nxt is not None:
+                        nxt.cancel()
+                    raise
+                if nxt is None:
+                    return
+                resp = nxt.result()
+
+    def iter_catalogs(self) -> Iterator[str]:
+        for c in self._iter_pages("/api/2.1/unity-catalog/catalogs", _PAGE, "catalogs"):
+            name = c.get("name")
+            if name:
+                yield name
+
+    def iter_schemas(self, catalog: str) -> Iterator[str]:
+        params = {"catalog_name": catalog, **_PAGE}
+        for s in self._iter_pages("/api/2.1/unity-catalog/schemas", params, "schemas"):
+            name = s.get("name")
+            if name:
+                yield name
+
+    def iter_tables(self, catalog: str, schema: str) -> Iterator[str]:
+        """Stream table names uncached; a full pass also fills the list_tables cache."""
+        params = {"catalog_name": catalog, "schema_name": schema, **_PAGE}
         out: list[str] = []
-        token: str | None = None
-        while True:
-            params: dict[str, Any] = {"max_results": 1000}
-            if token:
-                params["page_token"] = token
-            resp = self._rest_get("/api/2.1/unity-catalog/catalogs", params)
-            for c in resp.get("catalogs", []) or []:
-                name = c.get("name")
-                if name:
-                    out.append(name)  # type: ignore[arg-type]
-            token = resp.get("next_page_token")
-            if not token:
-                break
-        return out
+        for t in self._iter_pages("/api/2.1/unity-catalog/tables", params, "tables"):
+            name = t.get("name") or t.get("full_name")
+            if name:
+                out.append(name)
+                yield name
+        self._cache.put(("tables", catalog, schema), out)
+
+    def _list_catalogs(self) -> list[str]:
+        return list(self.iter_catalogs())
+
+    def _list_schemas(self, catalog: str) -> list[str]:
+        return list(self.iter_schemas(catalog))
+
+    def _list_tables(self, catalog: str, schema: str) -> list[str]:
+        return list(self.iter_tables(catalog, schema))
+
+    def list_catalogs(self) -> list[str]:
+        return list(self._cache.get_or_set(("catalogs",), self._list_catalogs))
 
     def list_schemas(self, catalog: str) -> list[str]:
-        out: list[str] = []
-        token: str | None = None
-        while True:
-            params: dict[str, Any] = {"catalog_name": catalog, "max_results": 1000}
-            if token:
-                params["page_token"] = token
-            resp = self._rest_get("/api/2.1/unity-catalog/schemas", params)
-            for s in resp.get("schemas", []) or []:
-                name = s.get("name")
-                if name:
-                    out.append(name)  # type: ignore[arg-type]
-            token = resp.get("next_page_token")
-            if not token:
-                break
-        return out
+        return list(
+            self._cache.get_or_set(("schemas", catalog), lambda: self._list_schemas(catalog))
+        )
 
     def list_tables(self, catalog: str, schema: str) -> list[str]:
-        out: list[str] = []
-        token: str | None = None
-        while True:
-            params: dict[str, Any] = {
-                "catalog_name": catalog,
-                "schema_name": schema,
-                "max_results": 1000,
-            }
-            if token:
-                params["page_token"] = token
-            resp = self._rest_get("/api/2.1/unity-catalog/tables", params)
-            for t in resp.get("tables", []) or []:
-                name = t.get("name") or t.get("full_name")
-                if name:
-                    out.append(name)  # type: ignore[arg-type]
-            token = resp.get("next_page_token")
-            if not token:
-                break
-        return out
+        return list(
+            self._cache.get_or_set(
+                ("tables", catalog, schema), lambda: self._list_tables(catalog, schema)
+            )
+        )
 
     def get_table(self, full_name: str) -> dict[str, Any]:
-        # full_name is catalog.schema.table
-        return self._rest_get(f"/api/2.1/unity-catalog/tables/{full_name}")
+        # full_name is catalog.schema.table; the result may be shared, copy before mutating
+        return self._cache.get_or_set(
+            ("table", full_name),
+            lambda: self._rest_get(f"/api/2.1/unity-catalog/tables/{full_name}"),
+        )
 
-    def _iter_columns_rest(
-        self, cat_pats: list[str], sch_pats: list[str], tbl_pats: list[str]
-    ) -> Iterator[UnityColumn]:
+    def invalidate(self, full_name: str | None = None) -> None:
+        """Drop cached ``get_table`` and column comments for ``full_name``, or everything."""
+        if full_name is None:
+            self._cache.clear()
+            self._comments.clear()
+        else:
+            self._cache.pop(("table", full_name))
+            self._comments.pop(full_name)
+
+    def _iter_rest_tables(
+        self, cat_pats: _Match, sch_pats: _Match, tbl_pats: _Match
+    ) -> Iterator[tuple[str, str, str, str]]:
+        """Yield ``(catalog, schema, table, full_name)`` for tables matching the patterns."""
         for cat in self.list_catalogs():
-            if not any(fnmatch.fnmatch(cat, p) for p in cat_pats):
+            if cat_pats is not None and not cat_pats(cat):
                 continue
             for sch in self.list_schemas(cat):
-                if not any(fnmatch.fnmatch(sch, p) for p in sch_pats):
+                if sch_pats is not None and not sch_pats(sch):
                     continue
-                for tname in self.list_tables(cat, sch):
+                # Stream a cold table listing so get_table calls start on its first page
+                cached = self._cache.get(("tables", cat, sch))
+                names = cached if cached is not None else self.iter_tables(cat, sch)
+                for tname in names:
                     # tname may be 'catalog.schema.table' or just table; normalize
                     full_name = tname
                     if full_name.count(".") == 0:
                         full_name = f"{cat}.{sch}.{tname}"
                     _, _, table = full_name.split(".", 2)
-                    if not any(fnmatch.fnmatch(table, p) for p in tbl_pats):
+                    if tbl_pats is not None and not tbl_pats(table):
                         continue
-                    ti = self.get_table(full_name)
-                    cols = ti.get("columns", []) or []
-                    # Optional properties live at table-level
-                    props: dict[str, str] = ti.get("properties") or {}
-                    for c in cols:
-                        name = c.get("name")
-                        dtype = c.get("type_name") or c.get("type_text")
-                        comment = c.get("comment")
-                        yield UnityColumn(
-                            catalog=cat,
-                            schema=sch,
-                            table=table,
-                            name=name,  # type: ignore[arg-type]
-                            type=dtype,  # type: ignore[arg-type]
-                            comment=comment,  # type: ignore[arg-type]
-                            properties=props,
-                        )
+                    yield cat, sch, table, full_name
+
+    def _iter_columns_rest(
+        self, make: type[_Row], cat_pats: _Match, sch_pats: _Match, tbl_pats: _Match
+    ) -> Iterator[_Row]:
+        # get_table is one round-trip per table: keep up to ``rest_workers`` in flight and
+        # yield in listing order so each table's columns stay contiguous.
+        pending: deque[tuple[str, str, str, Future[dict[str, Any]]]] = deque()
+        with ThreadPoolExecutor(max_workers=self.rest_workers) as ex:
+            try:
+                for cat, sch, table, full_name in self._iter_rest_tables(
+                    cat_pats, sch_pats, tbl_pats
+                ):
+                    pending.append((cat, sch, table, ex.submit(self.get_table, full_name)))
+                    if len(pending) >= self.rest_workers:
+                        cat0, sch0, table0, fut = pending.popleft()
+                        yield from _rest_table_columns(make, cat0, sch0, table0, fut.result())
+                while pending:
+                    cat0, sch0, table0, fut = pending.popleft()
+                    yield from _rest_table_columns(make, cat0, sch0, table0, fut.result())
+            finally:
+                for *_, fut in pending:
+                    fut.cancel()
 
     # ------------- Writeback -------------
 
@@ -258,94 +452,191 @@ class UnityCatalogClient:
 
         Returns True if any update is applied.
         """
-        changed = False
+        return bool(
+            self.update_column_tags_batch(
+                catalog=catalog,
+                schema=schema,
+                table=table,
+                updates={column: (pii, pii_types, append_comment)},
+            )
+        )
 
+    def update_column_tags_batch(
+        self,
+        *,
+        catalog: str,
+        schema: str,
+        table: str,
+        updates: dict[str, tuple[bool, list[str] | None, str | None]],
+    ) -> list[str]:
+        """Apply ``{column: (pii, pii_types, append_comment)}`` to one table.
+
+        SQL issues a single ``SET TBLPROPERTIES`` and one comment lookup for all columns
+        (plus a ``COMMENT ON COLUMN`` per changed comment); REST does one get/patch.
+        Returns the names of the columns that changed.
+        """
+        if not updates:
+            return []
         if self._sql_conn is not None:
-            cur = self._sql_conn.cursor()
-            # Table properties to hold tagging info (table-level key per column)
-            desired_types = ",".join(sorted(t.strip() for t in (pii_types or []) if t.strip()))
-            props: list[tuple[str, str]] = [
-                (f"cps.pii.col.{column}", str(bool(pii)).lower()),
-            ]
+            return self._update_tags_sql(catalog, schema, table, updates)
+        return self._update_tags_rest(catalog, schema, table, updates)
+
+    def _update_tags_sql(
+        self,
+        catalog: str,
+        schema: str,
+        table: str,
+        updates: dict[str, tuple[bool, list[str] | None, str | None]],
+    ) -> list[str]:
+        assert self._sql_conn is not None
+        cur = self._sql_conn.cursor()
+        full_name = f"{catalog}.{schema}.{table}"
+        # Table properties to hold tagging info (table-level key per column)
+        props: list[tuple[str, str]] = []
+        for column, (pii, pii_types, _) in updates.items():
+            props.append((f"cps.pii.col.{column}", str(bool(pii)).lower()))
             if pii_types is not None:
+                desired_types = ",".join(sorted(t.strip() for t in pii_types if t.strip()))
                 props.append((f"cps.pii_types.col.{column}", desired_types))
+        kv = ", ".join([f"'{k}'='{v}'" for k, v in props])
+        cur.execute(f"ALTER TABLE {full_name} SET TBLPROPERTIES ({kv})")
+        changed = list(updates)
 
-            if props:
-                kv = ", ".join([f"'{k}'='{v}'" for k, v in props])
-                cur.execute(f"ALTER TABLE {catalog}.{schema}.{table} SET TBLPROPERTIES ({kv})")
-                changed = True
-
-            if append_comment is not None:
-                # Read existing, detecting paramstyle (qmark '?' or format '%s')
-                get_q = (
-                    "SELECT comment FROM system.information_schema.columns "
-                    "WHERE table_catalog=? AND table_schema=? AND table_name=? AND column_name=?"
-                )
-                param_style = "qmark"
-                try:
-                    cur.execute(get_q, (catalog, schema, table, column))
-                except Exception:  # pragma: no cover - alternate paramstyle
-                    get_q_fmt = get_q.replace("?", "%s")
-                    cur.execute(get_q_fmt, (catalog, schema, table, column))
-                    param_style = "format"
-                row = cur.fetchone()
-                existing_comment = (row[0] if row else None) or ""
-                new_comment = existing_comment
-                if append_comment and append_comment not in (existing_comment or ""):
-                    new_comment = (
-                        existing_comment + (" " if existing_comment else "") + append_comment
-                    )[:1024]
-                if new_comment != existing_comment:
-                    comment_prefix = f"COMMENT ON COLUMN {catalog}.{schema}.{table}.{column} IS "
-                    try:
-                        if param_style == "qmark":
-                            cur.execute(comment_prefix + "?", (new_comment,))
-                        else:
-                            cur.execute(comment_prefix + "%s", (new_comment,))
-                    except Exception:  # pragma: no cover - final fallback try both
-                        try:
-                            cur.execute(comment_prefix + "%s", (new_comment,))
-                        except Exception:
-                            cur.execute(comment_prefix + "?", (new_comment,))
-                    changed = True
+        to_comment = [c for c, (_, _, append) in updates.items() if append]
+        if not to_comment:
             return changed
-
-        # REST fallback: patch table with updated properties and column comment
+        known: dict[str, str] = self._comments.get(full_name) or {}
+        existing: dict[str, str | None] = {c: known[c] for c in to_comment if c in known}
+        missing = [c for c in to_comment if c not in existing]
+        param_style = "qmark"
+        if missing:
+            # Read existing comments in one query, detecting paramstyle (qmark or format)
+            get_q = (
+                "SELECT column_name, comment FROM system.information_schema.columns "
+                "WHERE table_catalog=? AND table_schema=? AND table_name=? "
+                f"AND column_name IN ({', '.join('?' * len(missing))})"
+            )
+            params = (catalog, schema, table, *missing)
+            try:
+                cur.execute(get_q, params)
+            except Exception:  # pragma: no cover - alternate paramstyle
+                cur.execute(get_q.replace("?", "%s"), params)
+                param_style = "format"
+            existing.update({name: comment for name, comment in cur.fetchall() or []})
+        for column in to_comment:
+            append_comment = updates[column][2]
+            existing_comment = existing.get(column) or ""
+            if not append_comment or append_comment in existing_comment:
+                continue
+            sep = " " if existing_comment else ""
+            new_comment = (existing_comment + sep + append_comment)[:1024]
+            comment_prefix = f"COMMENT ON COLUMN {full_name}.{column} IS "
+            try:
+                if param_style == "qmark":
+                    cur.execute(comment_prefix + "?", (new_comment,))
+                else:
+                    cur.execute(comment_prefix + "%s", (new_comment,))
+            except Exception:  # pragma: no cover - final fallback try both
+                try:
+                    cur.execute(comment_prefix + "%s", (new_comment,))
+                except Exception:
+                    cur.execute(comment_prefix + "?", (new_comment,))
+            known = {**(self._comments.get(full_name) or {}), column: new_comment}
+            self._comments.put(full_name, known)
+        return changed
+
+    def _update_tags_rest(
+        self,
+        catalog: str,
+        schema: str,
+        table: str,
+        updates: dict[str, tuple[bool, list[str] | None, str | None]],
+    ) -> list[str]:
+        # REST fallback: patch table with updated properties and column comments
         full_name = f"{catalog}.{schema}.{table}"
         ti = self.get_table(full_name)
         new_props = dict(ti.get("properties") or {})
-        if str(new_props.get(f"cps.pii.col.{column}")).lower() != str(bool(pii)).lower():
-            new_props[f"cps.pii.col.{column}"] = str(bool(pii)).lower()
-            changed = True
-        if pii_types is not None:
-            desired_list = [t.strip() for t in pii_types if t.strip()]
-            desired = ",".join(sorted(desired_list))
-            if new_props.get(f"cps.pii_types.col.{column}") != desired:
-                new_props[f"cps.pii_types.col.{column}"] = desired
-                changed = True
-
-        cols = list(ti.get("columns") or [])
+        changed: set[str] = set()
+        for column, (pii, pii_types, _) in updates.items():
+            if str(new_props.get(f"cps.pii.col.{column}")).lower() != str(bool(pii)).lower():
+                new_props[f"cps.pii.col.{column}"] = str(bool(pii)).lower()
+                changed.add(column)
+            if pii_types is not None:
+                desired_list = [t.strip() for t in pii_types if t.strip()]
+                desired = ",".join(sorted(desired_list))
+                if new_props.get(f"cps.pii_types.col.{column}") != desired:
+                    new_props[f"cps.pii_types.col.{column}"] = desired
+                    changed.add(column)
+
+        # Copy the column dicts: ``ti`` may be the cached response
+        cols = [dict(c) for c in ti.get("columns") or []]
         for c in cols:
-            if c.get("name") != column:
+            name = c.get("name")
+            if name not in updates:
                 continue
+            append_comment = updates[name][2]
             if append_comment:
-                existing_comment2: str = c.get("comment") or ""
-                if append_comment not in (existing_comment2 or ""):
+                existing_comment: str = c.get("comment") or ""
+                if append_comment not in existing_comment:
                     c["comment"] = (
-                        existing_comment2 + (" " if existing_comment2 else "") + append_comment
+                        existing_comment + (" " if existing_comment else "") + append_comment
                     )[:1024]
-                    changed = True
-            break
+                    changed.add(name)
 
         if not changed:
-            return False
+            return []
         body: dict[str, Any] = {"full_name": full_name, "properties": new_props, "columns": cols}
         # Some deployments require name in body; we include both defensively
-        self._rest_patch(f"/api/2.1/unity-catalog/tables/{full_name}", body)
-        return True
+        try:
+            self._rest_patch(f"/api/2.1/unity-catalog/tables/{full_name}", body)
+        finally:
+            self.invalidate(full_name)
+        return [c for c in updates if c in changed]
+
+
+def _json_body(resp: Any) -> Any:
+    """Decode a response body, with orjson on the raw bytes when available."""
+    content = getattr(resp, "content", None)
+    if orjson is not None and isinstance(content, bytes) and content:
+        return orjson.loads(content)
+    return resp.json()
+
+
+def _filter_info_schema_rows(
+    rows: Iterable[Any], make: type[_Row], cat_pats: _Match, sch_pats: _Match, tbl_pats: _Match
+) -> Iterator[_Row]:
+    for r in rows:
+        catalog, schema, table, col, dtype, comment = r
+        if cat_pats is not None and not cat_pats(catalog):
+            continue
+        if sch_pats is not None and not sch_pats(schema):
+            continue
+        if tbl_pats is not None and not tbl_pats(table):
+            continue
+        yield make(catalog, schema, table, col, dtype, comment, _NO_PROPERTIES)
+
+
+def _rest_table_columns(
+    make: type[_Row], cat: str, sch: str, table: str, ti: dict[str, Any]
+) -> Iterator[_Row]:
+    cols = ti.get("columns", []) or []
+    # Optional properties live at table-level; the read-only view keeps cached
+    # get_table payloads safe from callers mutating a column's properties
+    props = MappingProxyType(ti.get("properties") or {})
+    for c in cols:
+        yield make(
+            cat,
+            sch,
+            table,
+            c.get("name"),
+            c.get("type_name") or c.get("type_text"),
+            c.get("comment"),
+            props,
+        )
 
 
 __all__ = [
     "UnityCatalogClient",
     "UnityColumn",
+    "UnityColumnTuple",
 ]
@@ -1,148 +1,194 @@
 from __future__ import annotations
 
 import json
+import mmap
 import random
-from collections.abc import Iterable
+import string
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional fast path
+    orjson = None  # type: ignore
 
 from .pii_types import PIIType, Span, from_json_label
 
 
-@dataclass
+@dataclass(slots=True)
 class LabeledExample:
     text: str
     labels: list[tuple[Span, PIIType]]
 
 
-def _random_email() -> str:
-    users = ["john.doe", "jane_smith", "a.brown", "user123"]
-    domains = ["example.com", "sample.org", "test.net"]
-    return f"{random.choice(users)}@{random.choice(domains)}"
+_USERS = ("john.doe", "jane_smith", "a.brown", "user123")
+_DOMAINS = ("example.com", "sample.org", "test.net")
+_CC_PREFIXES = ("4", "51", "52", "53", "54", "55")  # Visa/Mastercard-ish
+_FIRSTS = ("John", "Jane", "Alice", "Bob", "Carlos", "Emily")
+_LASTS = ("Doe", "Smith", "Brown", "Johnson", "Davis", "Miller")
+
+
+def _random_email(rnd: random.Random) -> str:
+    return f"{rnd.choice(_USERS)}@{rnd.choice(_DOMAINS)}"
 
 
-def _random_phone() -> str:
+def _random_phone(rnd: random.Random) -> str:
     # US-like phone
-    return (
-        f"({random.randint(200, 999)}) {random.randint(200, 999):03d}-{random.randint(0, 9999):04d}"
-    )
+    return f"({rnd.randint(200, 999)}) {rnd.randint(200, 999):03d}-{rnd.randint(0, 9999):04d}"
+
+
+# Luhn contribution of a digit in an undoubled / doubled position
+_LUHN_EVEN = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)
+_LUHN_ODD = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
 
 
-def _luhnify(base16: str) -> str:
+def _luhnify(base16: str, rnd: random.Random) -> str:
     # Create a plausible credit card number with Luhn checksum
     digits = [int(c) for c in base16 if c.isdigit()]
     while len(digits) < 15:
-        digits.append(random.randint(0, 9))
-    # compute check digit
-    s = 0
-    parity = (len(digits) + 1) % 2
-    for i, d in enumerate(digits):
-        if i % 2 == parity:
-            d *= 2
-            if d > 9:
-                d -= 9
-        s += d
+        digits.append(rnd.randint(0, 9))
+    # compute check digit; positions matching the parity are doubled
+    tables = (_LUHN_ODD, _LUHN_EVEN) if (len(digits) + 1) % 2 == 0 else (_LUHN_EVEN, _LUHN_ODD)
+    s = sum(tables[i & 1][d] for i, d in enumerate(digits))
     check = (10 - (s % 10)) % 10
     return "".join(map(str, digits)) + str(check)
 
 
-def _random_cc() -> str:
-    prefix = random.choice(["4", "51", "52", "53", "54", "55"])  # Visa/Mastercard-ish
-    return _luhnify(prefix + "0" * 14)
+def _random_cc(rnd: random.Random) -> str:
+    prefix = rnd.choice(_CC_PREFIXES)
+    return _luhnify(prefix + "0" * 14, rnd)
 
 
-def _random_ssn() -> str:
-    return (
-        f"{random.randint(100, 999)}-{random.randint(10, 99):02d}-{random.randint(1000, 9999):04d}"
-    )
+def _random_ssn(rnd: random.Random) -> str:
+    return f"{rnd.randint(100, 999)}-{rnd.randint(10, 99):02d}-{rnd.randint(1000, 9999):04d}"
 
 
-def _random_ip() -> str:
-    return ".".join(str(random.randint(1, 254)) for _ in range(4))
+def _random_ip(rnd: random.Random) -> str:
+    return ".".join(str(rnd.randint(1, 254)) for _ in range(4))
 
 
-def _random_name() -> str:
-    first = random.choice(["John", "Jane", "Alice", "Bob", "Carlos", "Emily"])
-    last = random.choice(["Doe", "Smith", "Brown", "Johnson", "Davis", "Miller"])
-    return f"{first} {last}"
+def _random_name(rnd: random.Random) -> str:
+    return f"{rnd.choice(_FIRSTS)} {rnd.choice(_LASTS)}"
 
 
-def _random_date() -> str:
-    y = random.randint(1990, 2024)
-    m = random.randint(1, 12)
-    d = random.randint(1, 28)
+def _random_date(rnd: random.Random) -> str:
+    y = rnd.randint(1990, 2024)
+    m = rnd.randint(1, 12)
+    d = rnd.randint(1, 28)
     return f"{y:04d}-{m:02d}-{d:02d}"
 
 
+_TEMPLATES = (
+    "Contact {name} via email {email} or phone {phone}.",
+    "Visa card {cc} expires on {date}.",
+    "SSN for {name} is {ssn}.",
+    "Server IP {ip} logged a request from {name} on {date}.",
+    "Primary contact: {email}. Secondary: {phone}.",
+)
+
+_KEY_TO_PIITYPE: dict[str, PIIType] = {
+    "email": PIIType.EMAIL,
+    "phone": PIIType.PHONE_NUMBER,
+    "cc": PIIType.CREDIT_CARD,
+    "ssn": PIIType.SSN,
+    "ip": PIIType.IP_ADDRESS,
+    "name": PIIType.PERSON,
+    "date": PIIType.DATE,
+}
+
+# (literal, field) segments per template, so label offsets follow from value lengths
+_PARSED_TEMPLATES: dict[str, tuple[tuple[str, str | None], ...]] = {
+    t: tuple((lit, field) for lit, field, _, _ in string.Formatter().parse(t)) for t in _TEMPLATES
+}
+
+
 def generate_synthetic(n: int = 200, seed: int = 1234) -> list[LabeledExample]:
     rnd = random.Random(seed)
     examples: list[LabeledExample] = []
-    templates = [
-        "Contact {name} via email {email} or phone {phone}.",
-        "Visa card {cc} expires on {date}.",
-        "SSN for {name} is {ssn}.",
-        "Server IP {ip} logged a request from {name} on {date}.",
-        "Primary contact: {email}. Secondary: {phone}.",
-    ]
     for _ in range(n):
-        t = rnd.choice(templates)
+        t = rnd.choice(_TEMPLATES)
         values: dict[str, str] = {
-            "name": _random_name(),
-            "email": _random_email(),
-            "phone": _random_phone(),
-            "cc": _random_cc(),
-            "ssn": _random_ssn(),
-            "ip": _random_ip(),
-            "date": _random_date(),
+            "name": _random_name(rnd),
+            "email": _random_email(rnd),
+            "phone": _random_phone(rnd),
+            "cc": _random_cc(rnd),
+            "ssn": _random_ssn(rnd),
+            "ip": _random_ip(rnd),
+            "date": _random_date(rnd),
         }
-        text = t.format(**values)
+        parts: list[str] = []
         labels: list[tuple[Span, PIIType]] = []
-        for key, val in values.items():
-            start = text.find(val)
-            if start == -1:
+        pos = 0
+        for literal, field in _PARSED_TEMPLATES[t]:
+            parts.append(literal)
+            pos += len(literal)
+            if field is None:
                 continue
-            end = start + len(val)
-            span = Span(start=start, end=end, text=val)
-            if key == "email":
-                labels.append((span, PIIType.EMAIL))
-            elif key == "phone":
-                labels.append((span, PIIType.PHONE_NUMBER))
-            elif key == "cc":
-                labels.append((span, PIIType.CREDIT_CARD))
-            elif key == "ssn":
-                labels.append((span, PIIType.SSN))
-            elif key == "ip":
-                labels.append((span, PIIType.IP_ADDRESS))
-            elif key == "name":
-                labels.append((span, PIIType.PERSON))
-            elif key == "date":
-                labels.append((span, PIIType.DATE))
-        examples.append(LabeledExample(text=text, labels=labels))
+            val = values[field]
+            parts.append(val)
+            labels.append((Span(start=pos, end=pos + len(val), text=val), _KEY_TO_PIITYPE[field]))
+            pos += len(val)
+        examples.append(LabeledExample(text="".join(parts), labels=labels))
     return examples
 
 
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+_WRITE_BUFFER = 1 << 20
+
+
 def save_jsonl(path: str, data: Iterable[LabeledExample]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        for ex in data:
-            row = {
+    rows = (
+        _dumps(
+            {
                 "text": ex.text,
                 "labels": [
                     {"start": s.start, "end": s.end, "type": t.value, "text": s.text}
                     for s, t in ex.labels
                 ],
             }
-            f.write(json.dumps(row) + "\n")
+        )
+        + b"\n"
+        for ex in data
+    )
+    # Large buffer: millions of short rows become a few large write() calls
+    with open(path, "wb", buffering=_WRITE_BUFFER) as f:
+        f.writelines(rows)
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _parse_lines(lines: Iterable[bytes]) -> Iterator[LabeledExample]:
+    for line in lines:
+        if not line.strip():
+            continue
+        obj = _loads(line)
+        labels = [from_json_label(lbl) for lbl in obj.get("labels", [])]
+        yield LabeledExample(text=obj["text"], labels=labels)
+
+
+def iter_jsonl(path: str) -> Iterator[LabeledExample]:
+    """Yield examples one at a time, so large corpora never sit in memory as a list."""
+    with open(path, "rb") as f:
+        try:
+            # Map the file once; readline on the map splits lines without Python-level buffering
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files (ValueError) and pipes such as /dev/stdin (EINVAL) cannot be mapped
+            yield from _parse_lines(f)
+            return
+        with mm:
+            yield from _parse_lines(iter(mm.readline, b""))
 
 
 def load_jsonl(path: str) -> list[LabeledExample]:
-    out: list[LabeledExample] = []
-    with open(path, encoding="utf-8") as f:
-        for line in f:
-            if not line.strip():
-                continue
-            obj = json.loads(line)
-            labels = []
-            for lbl in obj.get("labels", []):
-                span, t = from_json_label(lbl)
-                labels.append((span, t))
-            out.append(LabeledExample(text=obj["text"], labels=labels))
-    return out
+    return list(iter_jsonl(path))
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Generator, Iterable
+from collections.abc import Generator, Iterable, Iterator
 from contextlib import contextmanager
 from datetime import UTC, datetime
-from typing import cast
+from typing import Any, cast
 
 from sqlalchemy import (
+    JSON,
     DateTime,
     Float,
     ForeignKey,
@@ -14,9 +15,14 @@ from sqlalchemy import (
     String,
     UniqueConstraint,
     create_engine,
+    event,
+    func,
+    insert,
+    inspect,
     select,
+    text,
 )
-from sqlalchemy.dialects.sqlite import JSON as SQLITE_JSON
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import (
     DeclarativeBase,
@@ -24,8 +30,13 @@ from sqlalchemy.orm import (
     Session,
     mapped_column,
     relationship,
+    selectinload,
     sessionmaker,
 )
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql import Select
+
+from .pii_types import _TYPE_BIT, PIIType
 
 NAMING_CONVENTION = {
     "ix": "ix_%(column_0_label)s",
@@ -112,8 +123,12 @@ class Finding(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     column_id: Mapped[int] = mapped_column(ForeignKey("columns.id", ondelete="CASCADE"))
-    # Store as JSON array for cross-DB compatibility (SQLite/PG)
-    types: Mapped[list[str]] = mapped_column(SQLITE_JSON, nullable=False, default=list)
+    # Store as JSON array for cross-DB compatibility (JSONB on PostgreSQL)
+    types: Mapped[list[str]] = mapped_column(
+        JSON().with_variant(postgresql.JSONB(), "postgresql"), nullable=False, default=list
+    )
+    # Bit ``i`` set for ``ALL_PII_TYPES[i]``; filter with :func:`filter_by_type`
+    types_mask: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
     confidence: Mapped[float] = mapped_column(Float, nullable=False)
     hit_rate: Mapped[float] = mapped_column(Float, nullable=False)
     model_version: Mapped[str] = mapped_column(String(64), nullable=False)
@@ -125,18 +140,84 @@ class Finding(Base):
     column: Mapped[Column] = relationship(back_populates="findings")
 
 
+def types_mask(types: Iterable[str]) -> int:
+    """Bitmask of PII type values (unknown values contribute no bits)."""
+    mask = 0
+    for t in types:
+        mask |= _TYPE_BIT.get(t, 0)
+    return mask
+
+
+def filter_by_type(stmt: Select[Any], pii_type: PIIType | str) -> Select[Any]:
+    """Restrict a findings ``SELECT`` to findings tagged with ``pii_type``."""
+    bit = _TYPE_BIT[PIIType(pii_type)]
+    return stmt.where(Finding.types_mask.op("&")(bit) != 0)
+
+
+# Rows per multi-VALUES statement when an executemany INSERT is batched
+_INSERT_PAGE = 1000
+
+
+# WAL lets readers run alongside a committing writer; with synchronous=NORMAL it only
+# fsyncs at checkpoints. Applied per connection (journal_mode persists in the file).
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _sqlite_pragmas(dbapi_conn: Any, _record: Any) -> None:
+    cur = dbapi_conn.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cur.execute(pragma)
+    finally:
+        cur.close()
+
+
 def create_engine_for_url(url: str) -> Engine:
     # Allow SQLite multi-thread access for CLI/tests
     if url.startswith("sqlite"):  # sqlite:///file.db or sqlite:///:memory:
-        engine = create_engine(url, connect_args={"check_same_thread": False})
+        in_memory = url.rstrip("/") == "sqlite:" or ":memory:" in url
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            insertmanyvalues_page_size=_INSERT_PAGE,
+            # An in-memory database lives and dies with its connection: share one
+            # across sessions and threads so the schema from init_db stays visible
+            poolclass=StaticPool if in_memory else None,
+        )
+        if not in_memory:
+            event.listen(engine, "connect", _sqlite_pragmas)
     else:
-        engine = create_engine(url)
+        engine = create_engine(url, insertmanyvalues_page_size=_INSERT_PAGE)
     return engine
 
 
+def _add_types_mask(engine: Engine) -> None:
+    """Add and backfill ``findings.types_mask`` in stores created before it existed."""
+    if "types_mask" in {c["name"] for c in inspect(engine).get_columns("findings")}:
+        return
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE findings ADD COLUMN types_mask INTEGER NOT NULL DEFAULT 0"))
+        rows = list(conn.execute(select(Finding.id, Finding.types)))
+        for chunk in _chunks(rows, _INSERT_PAGE):
+            conn.execute(
+                text("UPDATE findings SET types_mask = :mask WHERE id = :id"),
+                [{"id": fid, "mask": types_mask(types or [])} for fid, types in chunk],
+            )
+        for ix in Base.metadata.tables["findings"].indexes:
+            if list(ix.columns.keys()) == ["types_mask"]:
+                ix.create(conn)
+
+
 def init_db(url: str) -> sessionmaker[Session]:
     engine = create_engine_for_url(url)
     Base.metadata.create_all(engine)
+    _add_types_mask(engine)
     return sessionmaker(bind=engine, expire_on_commit=False)
 
 
@@ -154,6 +235,174 @@ def session_scope(Session: sessionmaker[Session]) -> Generator[Session, None, No
         session.close()
 
 
+_UPSERT_CHUNK = 300
+
+
+def _chunks(items: list[Any], n: int = _UPSERT_CHUNK) -> Iterator[list[Any]]:
+    for i in range(0, len(items), n):
+        yield items[i : i + n]
+
+
+# session.info key of the per-session ``(table, parent_id, name) -> id`` parent cache
+_ID_CACHE = "cps_parent_ids"
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_id_cache(session: Session) -> None:
+    # Rolled-back inserts may have handed out ids that no longer exist
+    session.info.pop(_ID_CACHE, None)
+
+
+def _resolve_ids(
+    session: Session,
+    model: type[Catalog] | type[Schema] | type[Table],
+    parent: str | None,
+    keys: set[tuple[int, str]],
+) -> dict[tuple[int, str], int]:
+    """Map ``(parent_id, name)`` keys to row ids, inserting the missing rows.
+
+    Catalogs have no parent and use ``0``. One ``IN`` select per chunk finds existing
+    rows; missing ones are inserted with ``ON CONFLICT DO NOTHING`` (so concurrent
+    writers are harmless) and selected back. Resolved ids are cached on the session,
+    so repeated upserts under the same parents skip these statements.
+    """
+    cache: dict[tuple[str, int, str], int] = session.info.setdefault(_ID_CACHE, {})
+    tag = model.__tablename__
+    ids = {k: cache[(tag, *k)] for k in keys if (tag, *k) in cache}
+    todo = keys - ids.keys()
+    if not todo:
+        return ids
+    parent_col = getattr(model, parent) if parent else None
+
+    def fetch(wanted: set[tuple[int, str]]) -> dict[tuple[int, str], int]:
+        out: dict[tuple[int, str], int] = {}
+        for chunk in _chunks(sorted(wanted)):
+            names = {n for _, n in chunk}
+            if parent_col is None:
+                stmt = select(model.id, model.name).where(model.name.in_(names))
+                out.update({(0, n): i for i, n in session.execute(stmt) if (0, n) in wanted})
+            else:
+                stmt2 = select(model.id, parent_col, model.name).where(
+                    parent_col.in_({p for p, _ in chunk}), model.name.in_(names)
+                )
+                out.update({(p, n): i for i, p, n in session.execute(stmt2) if (p, n) in wanted})
+        return out
+
+    found = fetch(todo)
+    missing = sorted(todo - found.keys())
+    if missing:
+        rows = [{"name": n, parent: p} if parent else {"name": n} for p, n in missing]
+        dialect = session.get_bind().dialect.name
+        if dialect in {"sqlite", "postgresql"}:
+            dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            index = [parent_col, model.name] if parent_col is not None else [model.name]
+            for chunk in _chunks(rows):
+                session.execute(
+                    dialect_insert(model).values(chunk).on_conflict_do_nothing(index_elements=index)
+                )
+        else:  # pragma: no cover - other dialects take the portable ORM path
+            session.add_all([model(**r) for r in rows])
+            session.flush()
+        found.update(fetch(set(missing)))
+    cache.update({(tag, *k): i for k, i in found.items()})
+    ids.update(found)
+    return ids
+
+
+def _ensure_tables(
+    session: Session, keys: Iterable[tuple[str, str, str]]
+) -> dict[tuple[str, str, str], int]:
+    """Resolve ``(catalog, schema, table)`` names to table ids, creating missing parents.
+
+    Each level costs one select (plus one insert and re-select when rows are missing),
+    however many tables are requested.
+    """
+    keys = set(keys)
+    cat_ids = _resolve_ids(session, Catalog, None, {(0, c) for c, _, _ in keys})
+    sch_ids = _resolve_ids(
+        session, Schema, "catalog_id", {(cat_ids[(0, c)], sc) for c, sc, _ in keys}
+    )
+    tbl_ids = _resolve_ids(
+        session,
+        Table,
+        "schema_id",
+        {(sch_ids[(cat_ids[(0, c)], sc)], t) for c, sc, t in keys},
+    )
+    return {(c, sc, t): tbl_ids[(sch_ids[(cat_ids[(0, c)], sc)], t)] for c, sc, t in keys}
+
+
+ColumnRow = tuple[str, str, str, str, str | None, str | None]
+
+
+def upsert_columns(
+    session: Session, rows: Iterable[ColumnRow]
+) -> dict[tuple[str, str, str, str], int]:
+    """Upsert ``(catalog, schema, table, column, data_type, description)`` rows in bulk.
+
+    Parents are resolved per level with ``IN`` selects and multi-row inserts, and
+    columns are written with a dialect-native ``INSERT .. ON CONFLICT DO UPDATE``
+    (SQLite/Postgres) that keeps existing metadata where the new value is None.
+    Returns the column id for each ``(catalog, schema, table, column)``.
+    """
+    by_key: dict[tuple[str, str, str, str], tuple[str | None, str | None]] = {}
+    for catalog, schema, table, column, data_type, description in rows:
+        by_key[(catalog, schema, table, column)] = (data_type, description)
+    if not by_key:
+        return {}
+    table_ids = _ensure_tables(session, {k[:3] for k in by_key})
+    values: dict[tuple[int, str], dict[str, Any]] = {
+        (table_ids[k[:3]], k[3]): {
+            "table_id": table_ids[k[:3]],
+            "name": k[3],
+            "data_type": data_type,
+            "description": description,
+        }
+        for k, (data_type, description) in by_key.items()
+    }
+
+    ids: dict[tuple[int, str], int] = {}
+    dialect = session.get_bind().dialect
+    if dialect.name in {"sqlite", "postgresql"}:
+        dialect_insert = sqlite.insert if dialect.name == "sqlite" else postgresql.insert
+        # Chunk multi-row VALUES to stay under SQLite's bound-parameter limit
+        for chunk in _chunks(list(values.values())):
+            stmt = dialect_insert(Column).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Column.table_id, Column.name],
+                set_={
+                    "data_type": func.coalesce(stmt.excluded.data_type, Column.data_type),
+                    "description": func.coalesce(stmt.excluded.description, Column.description),
+                },
+            )
+            if dialect.insert_returning:
+                # RETURNING covers inserted and updated rows alike
+                res = session.execute(stmt.returning(Column.id, Column.table_id, Column.name))
+                ids.update({(tid, name): cid for cid, tid, name in res})
+            else:  # pragma: no cover - SQLite older than 3.35
+                session.execute(stmt)
+    else:  # pragma: no cover - other dialects take the portable ORM path
+        for (tid, name), row in values.items():
+            existing = session.execute(
+                select(Column).where(Column.table_id == tid, Column.name == name)
+            ).scalar_one_or_none()
+            if existing is None:
+                session.add(Column(**row))
+            else:
+                if row["data_type"] is not None:
+                    existing.data_type = row["data_type"]
+                if row["description"] is not None:
+                    existing.description = row["description"]
+        session.flush()
+    if len(ids) < len(values):
+        for cid, tid, name in session.execute(
+            select(Column.id, Column.table_id, Column.name).where(
+                Column.table_id.in_(set(table_ids.values()))
+            )
+        ):
+            ids.setdefault((tid, name), cid)
+    return {k: ids[(table_ids[k[:3]], k[3])] for k in by_key}
+
+
 def upsert_column(
     session: Session,
     catalog: str,
@@ -164,54 +413,10 @@ def upsert_column(
     data_type: str | None = None,
     description: str | None = None,
 ) -> Column:
-    cat = cast(
-        Catalog | None,
-        session.execute(select(Catalog).where(Catalog.name == catalog)).scalar_one_or_none(),
-    )
-    if not cat:
-        cat = Catalog(name=catalog)
-        session.add(cat)
-        session.flush()
-
-    sch = cast(
-        Schema | None,
-        session.execute(
-            select(Schema).where(Schema.catalog_id == cat.id, Schema.name == schema)
-        ).scalar_one_or_none(),
-    )
-    if not sch:
-        sch = Schema(name=schema, catalog_id=cat.id)
-        session.add(sch)
-        session.flush()
-
-    tbl = cast(
-        Table | None,
-        session.execute(
-            select(Table).where(Table.schema_id == sch.id, Table.name == table)
-        ).scalar_one_or_none(),
-    )
-    if not tbl:
-        tbl = Table(name=table, schema_id=sch.id)
-        session.add(tbl)
-        session.flush()
-
-    col = cast(
-        Column | None,
-        session.execute(
-            select(Column).where(Column.table_id == tbl.id, Column.name == column)
-        ).scalar_one_or_none(),
-    )
-    if not col:
-        col = Column(name=column, table_id=tbl.id, data_type=data_type, description=description)
-        session.add(col)
-    else:
-        # update optional metadata if provided
-        if data_type is not None:
-            col.data_type = data_type
-        if description is not None:
-            col.description = description
-    session.flush()
-    return col
+    ids = upsert_columns(session, [(catalog, schema, table, column, data_type, description)])
+    # Core upserts bypass the identity map: refresh any instance this session holds
+    col = session.get(Column, ids[(catalog, schema, table, column)], populate_existing=True)
+    return cast(Column, col)
 
 
 def add_finding(
@@ -226,9 +431,11 @@ def add_finding(
     scanned_at: datetime | None = None,
 ) -> Finding:
     ts = scanned_at or datetime.now(UTC)
+    type_list = list(types)
     f = Finding(
         column_id=column.id,
-        types=list(types),
+        types=type_list,
+        types_mask=types_mask(type_list),
         confidence=float(confidence),
         hit_rate=float(hit_rate),
         model_version=model_version,
@@ -239,3 +446,104 @@ def add_finding(
     session.add(f)
     session.flush()
     return f
+
+
+def add_findings(
+    session: Session,
+    findings: Iterable[tuple[int, str, Iterable[str], float, float]],
+    *,
+    model_version: str,
+    source: str,
+    scanned_at: datetime | None = None,
+) -> int:
+    """Insert ``(column_id, column_ref, types, confidence, hit_rate)`` findings in bulk.
+
+    Callers pass ids and refs they already resolved (e.g. from :func:`upsert_columns`),
+    so no ORM instances are built; the rows go out as one executemany ``INSERT`` that
+    the engine pages through ``insertmanyvalues``. Returns the number of findings.
+    """
+    ts = scanned_at or datetime.now(UTC)
+    rows = []
+    for cid, ref, types, confidence, hit_rate in findings:
+        type_list = list(types)
+        rows.append(
+            {
+                "column_id": cid,
+                "types": type_list,
+                "types_mask": types_mask(type_list),
+                "confidence": float(confidence),
+                "hit_rate": float(hit_rate),
+                "model_version": model_version,
+                "scanned_at": ts,
+                "source": source,
+                "column_ref": ref,
+            }
+        )
+    if rows:
+        session.execute(insert(Finding), rows)
+    return len(rows)
+
+
+def add_findings_bulk(
+    session: Session,
+    columns: Iterable[tuple[str, str, str, str, str | None]],
+    *,
+    types: Iterable[str],
+    confidence: float,
+    hit_rate: float,
+    model_version: str,
+    source: str,
+    scanned_at: datetime | None = None,
+) -> int:
+    """Upsert many ``(catalog, schema, table, column, data_type)`` rows and add one finding each.
+
+    Columns go through :func:`upsert_columns` and findings through :func:`add_findings`.
+    Returns the number of findings written.
+    """
+    ids = upsert_columns(session, (row + (None,) for row in columns))
+    type_list = list(types)
+    return add_findings(
+        session,
+        ((cid, ".".join(key), type_list, confidence, hit_rate) for key, cid in ids.items()),
+        model_version=model_version,
+        source=source,
+        scanned_at=scanned_at,
+    )
+
+
+def findings_with_refs() -> Select[Finding]:
+    """``SELECT`` of ORM findings with their Column -> Table -> Schema -> Catalog preloaded.
+
+    Each level loads with one ``IN (...)`` query per batch, so reading ``f.column.ref``
+    costs no per-finding round-trips. Prefer :func:`iter_findings_flat` when the
+    denormalized ``column_ref`` is enough.
+    """
+    return select(Finding).options(
+        selectinload(Finding.column)
+        .selectinload(Column.table)
+        .selectinload(Table.schema)
+        .selectinload(Schema.catalog)
+    )
+
+
+_FINDING_EXPORT_COLUMNS = (
+    Finding.id,
+    Finding.column_ref,
+    Finding.types,
+    Finding.confidence,
+    Finding.hit_rate,
+    Finding.model_version,
+    Finding.scanned_at,
+    Finding.source,
+)
+
+
+def iter_findings_flat(session: Session, *, batch_size: int = 1000) -> Iterator[Any]:
+    """Stream findings as plain result rows for export.
+
+    Selects only the scalar columns (``column_ref`` is denormalized on the finding), so
+    no ORM identities are built and no relationship is ever touched. Rows support
+    attribute access by column name and are fetched ``batch_size`` at a time.
+    """
+    stmt = select(*_FINDING_EXPORT_COLUMNS).execution_options(yield_per=batch_size)
+    yield from session.execute(stmt)
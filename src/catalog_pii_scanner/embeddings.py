@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import threading
+from collections import OrderedDict
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
@@ -14,11 +16,15 @@ except Exception:  # pragma: no cover - optional dependency
 
 try:
     import joblib  # type: ignore
+    from scipy.special import expit  # type: ignore
+    from sklearn.feature_extraction.text import HashingVectorizer  # type: ignore
     from sklearn.linear_model import LogisticRegression  # type: ignore
     from sklearn.multiclass import OneVsRestClassifier  # type: ignore
     from sklearn.pipeline import Pipeline  # type: ignore
     from sklearn.preprocessing import StandardScaler  # type: ignore
 except Exception:  # pragma: no cover
+    expit = None  # type: ignore
+    HashingVectorizer = None  # type: ignore
     LogisticRegression = None  # type: ignore
     StandardScaler = None  # type: ignore
     Pipeline = None  # type: ignore
@@ -29,84 +35,150 @@ from .pii_types import ALL_PII_TYPES, PIIType
 
 DEFAULT_SBERT = "sentence-transformers/all-MiniLM-L6-v2"
 
+# Offline featurizer: stateless, so one shared instance serves every model
+_HASH_DIM = 32
+_HASHER = (
+    HashingVectorizer(n_features=_HASH_DIM, alternate_sign=False, norm="l2", dtype=np.float32)
+    if HashingVectorizer is not None
+    else None
+)
+# SBERT models loaded in this process, shared by every EmbedModel (and eval worker)
+_SBERT_MODELS: dict[str, Any] = {}
+# Class values in ALL_PII_TYPES order, the column order of every one-hot target matrix
+_CLASS_VALUES = np.array([t.value for t in ALL_PII_TYPES])
+
 
 @dataclass
 class EmbedModel:
     sbert_name: str = DEFAULT_SBERT
     clf_path: str | None = None
+    # Max distinct texts whose SBERT embeddings are kept (LRU)
+    cache_size: int = 50_000
     # internal caches
     _sbert: Any | None = field(init=False, default=None)
     _clf: list[Any | tuple[str, float]] | None = field(init=False, default=None)
+    # (W, b, trivial_mask, trivial_probs): the per-class pipelines folded into one layer
+    _linear: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None = field(
+        init=False, default=None
+    )
+
+    _emb_cache: OrderedDict[str, np.ndarray] = field(init=False, default_factory=OrderedDict)
+    _emb_lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+    # SBERT embedding width, known after the first non-empty encode
+    _dim: int | None = field(init=False, default=None)
 
     def __post_init__(self) -> None:
         self._sbert = None
         self._clf = None
+        self._linear = None
 
     def _load_sbert(self):  # type: ignore[no-untyped-def]
         # Offline mode: skip loading heavy models
         if os.getenv("CPS_OFFLINE"):
             return None
         if self._sbert is None and SentenceTransformer is not None:
-            self._sbert = SentenceTransformer(self.sbert_name)
+            model = _SBERT_MODELS.get(self.sbert_name)
+            if model is None:
+                model = _SBERT_MODELS[self.sbert_name] = SentenceTransformer(self.sbert_name)
+            self._sbert = model
         return self._sbert
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Ship only the classifier to worker processes; SBERT and the caches stay local
+        state = self.__dict__.copy()
+        state.update(_sbert=None, _emb_cache=OrderedDict())
+        del state["_emb_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._emb_lock = threading.Lock()
+
     def _load_clf(self) -> list[Any | tuple[str, float]] | None:  # type: ignore[no-any-unimported]
         if (
             self._clf is None
+            and self._linear is None
             and self.clf_path
-            and joblib is not None
             and os.path.exists(self.clf_path)
         ):
-            self._clf = joblib.load(self.clf_path)
+            if self.clf_path.endswith(".npz"):
+                # Folded layer only: plain arrays, no unpickling of sklearn objects
+                with np.load(self.clf_path, allow_pickle=False) as z:
+                    self._linear = (z["W"], z["b"], z["trivial_mask"], z["trivial_p"])
+            elif joblib is not None:
+                # Legacy pickled per-class pipelines
+                self._clf = joblib.load(self.clf_path)
         return self._clf
 
     def encode(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts and self._dim is not None:
+            return np.empty((0, self._dim), dtype=np.float32)
         model = self._load_sbert()
         if model is None:
-            # Fallback: simple hashing features if SBERT not available
-            rng = np.random.default_rng(42)
-            return rng.normal(size=(len(texts), 32)).astype(np.float32)
-        embs = model.encode(list(texts), normalize_embeddings=True, show_progress_bar=False)
-        return np.asarray(embs)
+            # Fallback: hashing-trick token features if SBERT not available
+            if _HASHER is None or not texts:
+                return np.zeros((len(texts), _HASH_DIM), dtype=np.float32)
+            return np.asarray(_HASHER.transform(list(texts)).toarray())
+        if not texts:
+            dim = model.get_sentence_embedding_dimension()
+            return np.empty((0, dim or 0), dtype=np.float32)
+        # Encode each distinct text once; repeats within and across calls hit the cache
+        found: dict[str, np.ndarray] = {}
+        with self._emb_lock:
+            for t in dict.fromkeys(texts):
+                emb = self._emb_cache.get(t)
+                if emb is not None:
+                    self._emb_cache.move_to_end(t)
+                    found[t] = emb
+        misses = [t for t in dict.fromkeys(texts) if t not in found]
+        if misses:
+            embs = model.encode(
+                misses,
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+            found.update(zip(misses, np.asarray(embs), strict=True))
+            with self._emb_lock:
+                for t in misses:
+                    self._emb_cache[t] = found[t]
+                while len(self._emb_cache) > self.cache_size:
+                    self._emb_cache.popitem(last=False)
+        out = np.stack([found[t] for t in texts])
+        self._dim = out.shape[1]
+        return out
 
-    def predict_proba(self, texts: Sequence[str]) -> dict[int, dict[PIIType, float]]:
-        clf = self._load_clf()
+    def predict_proba_matrix(self, texts: Sequence[str]) -> np.ndarray:
+        """Positive-class probabilities as an ``(n, K)`` array in ``ALL_PII_TYPES`` order."""
+        clf = self._load_clf() if texts else None
+        if not texts or (clf is None and self._linear is None):
+            # neutral predictions (and nothing to encode for empty input)
+            return np.zeros((len(texts), len(ALL_PII_TYPES)))
         X = self.encode(texts)
-        result: dict[int, dict[PIIType, float]] = {}
-        if clf is None:
-            # neutral predictions
-            for i in range(len(texts)):
-                result[i] = {t: 0.0 for t in ALL_PII_TYPES}
-            return result
-        # clf may be a list of per-class estimators or trivial entries
-        per_class_scores: list[list[float]] = []  # shape: [class][sample]
-        assert isinstance(clf, list)
-        for j, _t in enumerate(ALL_PII_TYPES):
-            est = clf[j]
-            if isinstance(est, tuple) and est and est[0] == "trivial":
-                p_pos = float(est[1])
-                per_class_scores.append([p_pos for _ in range(len(texts))])
-            else:
-                proba = est.predict_proba(X)  # type: ignore[no-any-return]
-                # scikit returns [n_samples, 2]; take prob of positive class (index 1)
-                p_pos_list: list[float] = [float(row[1]) for row in proba]
-                per_class_scores.append(p_pos_list)
-        for i in range(len(texts)):
-            out: dict[PIIType, float] = {}
-            for j, t in enumerate(ALL_PII_TYPES):
-                out[t] = float(per_class_scores[j][i])
-            result[i] = out
-        return result
+        if self._linear is None and clf is not None:
+            self._linear = _fold_linear(clf, X.shape[1])
+        if self._linear is not None:
+            # One GEMM for every class instead of one sklearn dispatch per class
+            W, b, trivial, trivial_p = self._linear
+            P = expit(X @ W.T + b)
+            P[:, trivial] = trivial_p[trivial]
+            return np.asarray(P)
+        assert clf is not None
+        return np.column_stack([_class_proba(est, X) for est in clf])
+
+    def predict_proba(self, texts: Sequence[str]) -> dict[int, dict[PIIType, float]]:
+        P = self.predict_proba_matrix(texts)
+        return {i: dict(zip(ALL_PII_TYPES, row, strict=True)) for i, row in enumerate(P.tolist())}
 
     def fit(self, texts: Sequence[str], labels: Sequence[PIIType]) -> None:
         if LogisticRegression is None:
             return
         X = self.encode(texts)
         y = np.array([t.value for t in labels])
-        # One-vs-rest with class weights to handle imbalance
-        classes = np.array([t.value for t in ALL_PII_TYPES])
-        # Build multi-label targets per class (one-hot)
-        Y = np.stack([(y == c).astype(int) for c in classes], axis=1)
+        # One-vs-rest with class weights to handle imbalance; one broadcast compare
+        # builds the (n, K) one-hot targets
+        Y = (y[:, None] == _CLASS_VALUES[None, :]).astype(np.int8)
         # No base pipeline variable needed; estimators are created per class below
         # Fit one-vs-rest manually to keep per-class calibration simple
         estims: list[Any | tuple[str, float]] = []
@@ -136,10 +208,74 @@ class EmbedModel:
             est.fit(X, yj)
             estims.append(est)  # type: ignore[arg-type]
         self._clf = estims
+        self._linear = _fold_linear(estims, X.shape[1])
 
     def save(self, path: str) -> None:
-        if self._clf is None or joblib is None:
-            return
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        joblib.dump(self._clf, path)
+        """Save the classifier; ``.npz`` stores the folded float32 layer, else joblib."""
+        if path.endswith(".npz"):
+            if self._linear is None:
+                return
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            W, b, trivial, trivial_p = self._linear
+            np.savez_compressed(
+                path,
+                W=W.astype(np.float32),
+                b=b.astype(np.float32),
+                trivial_mask=trivial,
+                trivial_p=trivial_p.astype(np.float32),
+            )
+        else:
+            if self._clf is None or joblib is None:
+                return
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            joblib.dump(self._clf, path)
         self.clf_path = path
+
+
+def _class_proba(est: Any, X: np.ndarray) -> np.ndarray:
+    """Positive-class probability of one per-class entry (trivial or fitted)."""
+    if isinstance(est, tuple) and est and est[0] == "trivial":
+        return np.full(X.shape[0], float(est[1]))
+    # scikit returns [n_samples, 2]; take prob of positive class (index 1)
+    return np.asarray(est.predict_proba(X))[:, 1]
+
+
+def _fold_linear(
+    clf: list[Any], dim: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+    """Collapse ``scaler -> logistic regression`` pipelines into one ``(W, b)`` layer.
+
+    ``sigmoid(((x - mean) / scale) @ c + i)`` equals ``sigmoid(x @ (c / scale) + i')``
+    with ``i' = i - (mean / scale) @ c``, so all classes score with one matrix product.
+    Returns None if an entry is not such a pipeline (the caller then goes per class).
+    """
+    if expit is None:  # pragma: no cover - scipy ships with scikit-learn
+        return None
+    k = len(clf)
+    W = np.zeros((k, dim))
+    b = np.zeros(k)
+    trivial = np.zeros(k, dtype=bool)
+    trivial_p = np.zeros(k)
+    for j, est in enumerate(clf):
+        if isinstance(est, tuple) and est and est[0] == "trivial":
+            trivial[j] = True
+            trivial_p[j] = float(est[1])
+            continue
+        steps: dict[str, Any] = dict(getattr(est, "named_steps", None) or {})
+        lr: Any = steps.get("clf")
+        coef = getattr(lr, "coef_", None)
+        if coef is None or coef.shape != (1, dim) or list(getattr(lr, "classes_", [])) != [0, 1]:
+            return None
+        c = coef[0].astype(float)
+        i = float(lr.intercept_[0])
+        scaler = steps.get("scaler")
+        if scaler is not None:
+            scale = getattr(scaler, "scale_", None)
+            mean = getattr(scaler, "mean_", None) if getattr(scaler, "with_mean", False) else None
+            if scale is not None:
+                c = c / scale
+            if mean is not None:
+                i -= float(mean @ c)
+        W[j] = c
+        b[j] = i
+    return W, b, trivial, trivial_p
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+import numpy as np
+
 try:
     import joblib  # type: ignore
     from sklearn.linear_model import LogisticRegression  # type: ignore
@@ -16,6 +18,12 @@ from .ner import ner_context_signals
 from .pii_types import ALL_PII_TYPES, Candidate, PIIType, Prediction
 from .redaction import contexts_for_candidates
 
+# Column of each type in the (n_candidates, K) score matrices
+_TYPE_INDEX: dict[PIIType, int] = {t: j for j, t in enumerate(ALL_PII_TYPES)}
+_VALUE_INDEX: dict[str, int] = {t.value: j for j, t in enumerate(ALL_PII_TYPES)}
+# Bit position of each column in Candidate.validations_mask
+_TYPE_SHIFTS = np.arange(len(ALL_PII_TYPES), dtype=np.int64)
+
 
 @dataclass
 class Calibrator:
@@ -27,34 +35,58 @@ class Calibrator:
         return Calibrator(models={t: (1.0, 0.0) for t in ALL_PII_TYPES})
 
     def save(self, path: str) -> None:
+        """Save the scalers; ``.npz`` stores plain ``a``/``b``/``types`` arrays, else joblib."""
+        if path.endswith(".npz"):
+            ab = np.array([self.models.get(t, (1.0, 0.0)) for t in ALL_PII_TYPES], dtype=float)
+            np.savez(path, a=ab[:, 0], b=ab[:, 1], types=np.array([t.value for t in ALL_PII_TYPES]))
+            return
         if joblib is None:
             return
         joblib.dump(self.models, path)
 
+    @staticmethod
+    def from_arrays(a: np.ndarray, b: np.ndarray, types: np.ndarray) -> Calibrator:
+        return Calibrator(
+            models={
+                PIIType(str(t)): (float(ai), float(bi))
+                for t, ai, bi in zip(types.tolist(), a.tolist(), b.tolist(), strict=True)
+            }
+        )
+
     @staticmethod
     def load(path: str) -> Calibrator:
-        if joblib is None:
-            return Calibrator.identity()
+        # Sniff the format: npz files are zip archives, anything else is a joblib pickle
         try:
+            with open(path, "rb") as fh:
+                is_npz = fh.read(4) == b"PK\x03\x04"
+            if is_npz:
+                with np.load(path, allow_pickle=False) as z:
+                    return Calibrator.from_arrays(z["a"], z["b"], z["types"])
+            if joblib is None:
+                return Calibrator.identity()
             m = joblib.load(path)
             return Calibrator(models=m)
         except Exception:
             return Calibrator.identity()
 
+    def __post_init__(self) -> None:
+        # (K, 2) slopes/intercepts in ALL_PII_TYPES order; missing types stay identity
+        self._ab = np.array([self.models.get(t, (1.0, 0.0)) for t in ALL_PII_TYPES], dtype=float)
+
     def __call__(self, per_type_scores: dict[PIIType, float]) -> dict[PIIType, float]:
-        out: dict[PIIType, float] = {}
-        for t, s in per_type_scores.items():
-            a, b = self.models.get(t, (1.0, 0.0))
-            z = a * s + b
-            # numerically stable sigmoid
-            if z >= 0:
-                ez = math.exp(-z)
-                p = 1.0 / (1.0 + ez)
-            else:
-                ez = math.exp(z)
-                p = ez / (1.0 + ez)
-            out[t] = float(p)
-        return out
+        types = list(per_type_scores)
+        ab = self._ab[[_TYPE_INDEX[t] for t in types]]
+        z = ab[:, 0] * np.fromiter(per_type_scores.values(), float, len(types)) + ab[:, 1]
+        return dict(zip(types, _sigmoid(z).tolist(), strict=True))
+
+    def matrix(self, scores: np.ndarray) -> np.ndarray:
+        """Calibrate an ``(n, K)`` score matrix (columns in ``ALL_PII_TYPES`` order)."""
+        return _sigmoid(self._ab[:, 0] * scores + self._ab[:, 1])
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    # Stable sigmoid: tanh saturates instead of overflowing
+    return np.asarray(0.5 * (1.0 + np.tanh(0.5 * z)))
 
 
 @dataclass
@@ -67,8 +99,64 @@ class Ensemble:
     w_embed: float = 0.4
 
     def predict(self, text: str, candidates: list[Candidate]) -> list[Prediction]:
-        # Build sanitized contexts
-        contexts = contexts_for_candidates(text, candidates, window=48)
+        if not candidates:
+            return []
+        return self.predict_batch([(text, candidates)])[0]
+
+    def predict_batch(self, items: Sequence[tuple[str, list[Candidate]]]) -> list[list[Prediction]]:
+        """:meth:`predict` for many ``(text, candidates)`` pairs.
+
+        Embedding, NER and calibration run once over the candidates of every text, so
+        models see full batches even when each text has only a few candidates.
+        """
+        batch = self._batch_inputs(items)
+        n_total = sum(len(cands) for _, cands in items)
+        if not n_total:
+            return [[] for _ in items]
+        S = np.vstack(
+            [
+                self._score_matrix(cands, ner_sig, embed_p)
+                for (_, cands), (_, ner_sig, embed_p) in zip(items, batch, strict=True)
+            ]
+        )
+        # Calibrate into probabilities, normalized to avoid all-zeros
+        P = self.calibrator.matrix(S)
+        ssum = P.sum(axis=1, keepdims=True)
+        P /= np.where(ssum > 0, ssum, 1.0)
+        idx = P.argmax(axis=1)
+        scores = P[np.arange(n_total), idx].tolist()
+        labels = idx.tolist()
+        rows = P.tolist()
+
+        out: list[list[Prediction]] = []
+        off = 0
+        for (text, candidates), (contexts, ner_sig, embed_p) in zip(items, batch, strict=True):
+            if candidates:
+                self._log_contexts(text, candidates, contexts)
+            preds: list[Prediction] = []
+            for i, (c, erow) in enumerate(zip(candidates, embed_p.tolist(), strict=True)):
+                r = off + i
+                preds.append(
+                    Prediction(
+                        span=c.span,
+                        probs=dict(zip(ALL_PII_TYPES, rows[r], strict=True)),
+                        label=ALL_PII_TYPES[labels[r]],
+                        score=scores[r],
+                        signals={
+                            "rule_label": c.rule_label.value if c.rule_label else None,
+                            "rule_conf": c.rule_confidence,
+                            "validations": {k.value: v for k, v in (c.validations or {}).items()},
+                            "ner": ner_sig.get(i, {}),
+                            "embed": {t.value: v for t, v in zip(ALL_PII_TYPES, erow, strict=True)},
+                        },
+                    )
+                )
+            off += len(candidates)
+            out.append(preds)
+        return out
+
+    @staticmethod
+    def _log_contexts(text: str, candidates: list[Candidate], contexts: dict[int, str]) -> None:
         # Safe structured log about sanitized inputs
         try:
             import logging
@@ -86,103 +174,133 @@ class Ensemble:
         except Exception:
             # Logging must never break prediction
             pass
-        # NER context signals (sanitized)
-        ner_sig = ner_context_signals(contexts)
+
+    def _batch_inputs(
+        self, items: Sequence[tuple[str, list[Candidate]]]
+    ) -> list[tuple[dict[int, str], dict[int, dict[str, float]], np.ndarray]]:
+        """Sanitized contexts, NER signals and embedding probs per ``(text, candidates)``.
+
+        Contexts of all texts go through NER and the embedding model as one batch and
+        are split back per text afterwards.
+        """
+        contexts = [
+            contexts_for_candidates(text, cands, window=48) if cands else {}
+            for text, cands in items
+        ]
+        flat: list[str] = []
+        owner: list[tuple[int, int]] = []
+        for j, ((_, cands), ctx) in enumerate(zip(items, contexts, strict=True)):
+            for i in range(len(cands)):
+                flat.append(ctx[i])
+                owner.append((j, i))
+        ner_sigs: list[dict[int, dict[str, float]]] = [{} for _ in items]
+        if flat:
+            # NER context signals (sanitized)
+            for k, sig in ner_context_signals(dict(enumerate(flat))).items():
+                j, i = owner[k]
+                ner_sigs[j][i] = sig
         # Embedding predictions on sanitized snippets (candidate masked in context)
-        embed_inputs = [contexts[i] for i in range(len(candidates))]
-        embed_probs = self.embed.predict_proba(embed_inputs)
+        embed_all = self.embed.predict_proba_matrix(flat)
+        out = []
+        off = 0
+        for (_, cands), ctx, ner_sig in zip(items, contexts, ner_sigs, strict=True):
+            out.append((ctx, ner_sig, embed_all[off : off + len(cands)]))
+            off += len(cands)
+        return out
 
-        preds: list[Prediction] = []
+    def _score_matrix(
+        self,
+        candidates: list[Candidate],
+        ner_sig: dict[int, dict[str, float]],
+        embed_p: np.ndarray,
+    ) -> np.ndarray:
+        """Weighted ``(n, K)`` sum of rule, validation, NER and embedding signals."""
+        S = self.w_embed * embed_p
+        masks = np.zeros(len(candidates), dtype=np.int64)
         for i, c in enumerate(candidates):
-            # Start with rule prior
-            per_type_score: dict[PIIType, float] = {t: 0.0 for t in ALL_PII_TYPES}
+            # Rule prior
             if c.rule_label is not None:
-                per_type_score[c.rule_label] += self.w_rule * c.rule_confidence
-            # Validation boosts (e.g., Luhn for CC)
-            for t, ok in (c.validations or {}).items():
-                if ok:
-                    per_type_score[t] += 0.2
-            # NER context mapping
-            for t in ALL_PII_TYPES:
-                per_type_score[t] += self.w_ner * float(ner_sig.get(i, {}).get(t.value, 0.0))
-            # Embedding classifier
-            for t in ALL_PII_TYPES:
-                per_type_score[t] += self.w_embed * float(embed_probs.get(i, {}).get(t, 0.0))
-
-            # Calibrate into probabilities
-            probs = self.calibrator(per_type_score)
-            # Normalize to avoid all-zeros
-            ssum = sum(probs.values()) or 1.0
-            probs = {t: v / ssum for t, v in probs.items()}
-            label = max(probs.keys(), key=lambda k: probs[k])
-            score = float(probs[label])
-            preds.append(
-                Prediction(
-                    span=c.span,
-                    probs=probs,
-                    label=label,
-                    score=score,
-                    signals={
-                        "rule_label": c.rule_label.value if c.rule_label else None,
-                        "rule_conf": c.rule_confidence,
-                        "validations": {k.value: v for k, v in (c.validations or {}).items()},
-                        "ner": ner_sig.get(i, {}),
-                        "embed": {
-                            k.value: float(v) for k, v in (embed_probs.get(i, {}) or {}).items()
-                        },
-                    },
-                )
+                S[i, _TYPE_INDEX[c.rule_label]] += self.w_rule * c.rule_confidence
+            if c.validations:
+                masks[i] = c.validations_mask
+        # Validation boosts (e.g., Luhn for CC): unpack the bitmasks into one (n, K) add
+        if masks.any():
+            S += 0.2 * ((masks[:, None] >> _TYPE_SHIFTS) & 1)
+        # NER context mapping; signals are sparse and keyed by type value
+        for i, sig in ner_sig.items():
+            if not 0 <= i < len(candidates):
+                continue
+            for value, v in sig.items():
+                j = _VALUE_INDEX.get(value)
+                if j is not None:
+                    S[i, j] += self.w_ner * float(v)
+        return S
+
+    def raw_score_matrix(
+        self, text: str, candidates: list[Candidate]
+    ) -> tuple[np.ndarray, dict[int, dict[str, float]], np.ndarray]:
+        """Pre-calibration ``(n, K)`` scores, NER signals and ``(n, K)`` embedding probs."""
+        if not candidates:
+            empty = np.zeros((0, len(ALL_PII_TYPES)))
+            return empty, {}, empty
+        return self.raw_score_batch([(text, candidates)])[0]
+
+    def raw_score_batch(
+        self, items: Sequence[tuple[str, list[Candidate]]]
+    ) -> list[tuple[np.ndarray, dict[int, dict[str, float]], np.ndarray]]:
+        """:meth:`raw_score_matrix` for many texts, batching NER and embeddings across them."""
+        return [
+            (self._score_matrix(cands, ner_sig, embed_p), ner_sig, embed_p)
+            for (_, cands), (_, ner_sig, embed_p) in zip(
+                items, self._batch_inputs(items), strict=True
             )
-        return preds
+        ]
 
     def raw_scores(
         self, text: str, candidates: list[Candidate]
     ) -> tuple[
         list[dict[PIIType, float]], dict[int, dict[str, float]], dict[int, dict[PIIType, float]]
     ]:
-        contexts = contexts_for_candidates(text, candidates, window=48)
-        ner_sig = ner_context_signals(contexts)
-        embed_inputs = [contexts[i] for i in range(len(candidates))]
-        embed_probs = self.embed.predict_proba(embed_inputs)
-        scores: list[dict[PIIType, float]] = []
-        for i, c in enumerate(candidates):
-            per_type_score: dict[PIIType, float] = {t: 0.0 for t in ALL_PII_TYPES}
-            if c.rule_label is not None:
-                per_type_score[c.rule_label] += self.w_rule * c.rule_confidence
-            for t, ok in (c.validations or {}).items():
-                if ok:
-                    per_type_score[t] += 0.2
-            for t in ALL_PII_TYPES:
-                per_type_score[t] += self.w_ner * float(ner_sig.get(i, {}).get(t.value, 0.0))
-            for t in ALL_PII_TYPES:
-                per_type_score[t] += self.w_embed * float(embed_probs.get(i, {}).get(t, 0.0))
-            scores.append(per_type_score)
+        if not candidates:
+            return [], {}, {}
+        S, ner_sig, embed_p = self.raw_score_matrix(text, candidates)
         return (
-            scores,
+            [dict(zip(ALL_PII_TYPES, row, strict=True)) for row in S.tolist()],
             ner_sig,
             {
-                i: {t: float(embed_probs.get(i, {}).get(t, 0.0)) for t in ALL_PII_TYPES}
-                for i in range(len(candidates))
+                i: dict(zip(ALL_PII_TYPES, row, strict=True))
+                for i, row in enumerate(embed_p.tolist())
             },
         )
 
 
 def fit_calibrator(
-    raw_scores: list[dict[PIIType, float]],
+    raw_scores: list[dict[PIIType, float]] | np.ndarray,
     true_labels: list[PIIType | None],
 ) -> Calibrator:
-    # Fit per-type Platt scalers a*x + b
+    """Fit per-type Platt scalers ``a*x + b``.
+
+    ``raw_scores`` is one dict per candidate or an ``(n, K)`` matrix with columns in
+    ``ALL_PII_TYPES`` order (as from :meth:`Ensemble.raw_score_matrix`).
+    """
+    if isinstance(raw_scores, np.ndarray):
+        M = raw_scores.reshape(len(true_labels), len(ALL_PII_TYPES))
+    else:
+        M = np.array(
+            [[rs.get(t, 0.0) for t in ALL_PII_TYPES] for rs in raw_scores], dtype=float
+        ).reshape(len(raw_scores), len(ALL_PII_TYPES))
+    label_idx = np.array([-1 if lbl is None else _TYPE_INDEX[lbl] for lbl in true_labels])
     models: dict[PIIType, tuple[float, float]] = {}
-    for t in ALL_PII_TYPES:
+    for j, t in enumerate(ALL_PII_TYPES):
         # Build dataset: x=raw_score_t, y=1 if label==t else 0
-        X = [[rs.get(t, 0.0)] for rs in raw_scores]
-        y = [1 if (lbl == t) else 0 for lbl in true_labels]
+        y = (label_idx == j).astype(int)
+        positives = int(y.sum())
         # Guard both extremes: no positives OR all positives -> fallback to identity
-        if sum(y) == 0 or sum(y) == len(y) or LogisticRegression is None:
+        if positives == 0 or positives == len(y) or LogisticRegression is None:
             models[t] = (1.0, 0.0)
             continue
         lr = LogisticRegression(solver="liblinear")
-        lr.fit(X, y)
+        lr.fit(M[:, j : j + 1], y)
         a = float(lr.coef_[0][0])
         b = float(lr.intercept_[0])
         models[t] = (a, b)
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from itertools import islice
+
+import numpy as np
+
+try:
+    from joblib import Parallel, delayed  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    Parallel = None  # type: ignore
+    delayed = None  # type: ignore
 
 from .datasets import LabeledExample
 from .embeddings import EmbedModel
@@ -20,28 +30,35 @@ class EvalReport:
 def _match(
     preds: list[Prediction], gold: list[tuple[Span, PIIType]]
 ) -> tuple[int, int, int, dict[PIIType, tuple[int, int, int]]]:
-    # Simple overlap matching: a prediction matches a gold if spans overlap any char and types equal
+    # Simple overlap matching: a prediction matches a gold if spans overlap any char and types
+    # equal. Each prediction takes the first (in ``gold`` order) unused overlapping gold span.
     tp = 0
     fp = 0
-    fn = 0
     per_type: dict[PIIType, list[int]] = {t: [0, 0, 0] for t in ALL_PII_TYPES}
+    # Gold spans per type sorted by start: only spans starting before ``p.end`` can overlap
+    by_type: dict[PIIType, list[tuple[int, int, int]]] = {}
+    for j, (gs, gt) in enumerate(gold):
+        by_type.setdefault(gt, []).append((gs.start, gs.end, j))
+    starts: dict[PIIType, list[int]] = {}
+    for gt, spans in by_type.items():
+        spans.sort()
+        starts[gt] = [st for st, _, _ in spans]
     used_gold = [False] * len(gold)
     for p in preds:
-        matched = False
-        for j, (gs, gt) in enumerate(gold):
-            if used_gold[j]:
-                continue
-            if p.span.start < gs.end and gs.start < p.span.end:
-                # overlap
-                if p.label == gt:
-                    tp += 1
-                    per_type[gt][0] += 1
-                    used_gold[j] = True
-                    matched = True
-                    break
-        if not matched:
+        best = -1
+        label = p.label
+        if label is not None and label in by_type:
+            for _, g_end, j in by_type[label][: bisect_left(starts[label], p.span.end)]:
+                if g_end > p.span.start and not used_gold[j] and (best < 0 or j < best):
+                    best = j
+        if best >= 0:
+            tp += 1
+            per_type[gold[best][1]][0] += 1
+            used_gold[best] = True
+        else:
             fp += 1
             per_type[p.label or ALL_PII_TYPES[0]][1] += 1
+    fn = 0
     for j, (_gs, gt) in enumerate(gold):
         if not used_gold[j]:
             fn += 1
@@ -57,15 +74,60 @@ def _prf(tp: int, fp: int, fn: int) -> dict[str, float]:
     return {"precision": prec, "recall": rec, "f1": f1}
 
 
-def run_eval(examples: Iterable[LabeledExample], ensemble: Ensemble) -> EvalReport:
-    all_preds: list[Prediction] = []
-    all_gold: list[tuple[Span, PIIType]] = []
-    for ex in examples:
-        cands = propose_candidates(ex.text)
-        preds = ensemble.predict(ex.text, cands)
-        all_preds.extend(preds)
-        all_gold.extend(ex.labels)
-    tp, fp, fn, per_type = _match(all_preds, all_gold)
+# Examples per parallel eval task
+_EVAL_CHUNK = 64
+
+
+def _example_chunks(
+    examples: Iterable[LabeledExample], n: int = _EVAL_CHUNK
+) -> Iterator[list[LabeledExample]]:
+    it = iter(examples)
+    while chunk := list(islice(it, n)):
+        yield chunk
+
+
+def _eval_chunk(
+    examples: Iterable[LabeledExample], ensemble: Ensemble
+) -> tuple[int, int, int, dict[PIIType, list[int]]]:
+    # Offsets are per text, so spans are only matched within their own example
+    tp = fp = fn = 0
+    per_type: dict[PIIType, list[int]] = {t: [0, 0, 0] for t in ALL_PII_TYPES}
+    for chunk in _example_chunks(examples):
+        # Predict the whole chunk at once so NER/embedding batches span examples
+        batch = ensemble.predict_batch([(ex.text, propose_candidates(ex.text)) for ex in chunk])
+        for ex, preds in zip(chunk, batch, strict=True):
+            tpe, fpe, fne, per_type_e = _match(preds, ex.labels)
+            tp, fp, fn = tp + tpe, fp + fpe, fn + fne
+            for t, counts in per_type_e.items():
+                acc = per_type[t]
+                for k in range(3):
+                    acc[k] += counts[k]
+    return tp, fp, fn, per_type
+
+
+def run_eval(
+    examples: Iterable[LabeledExample], ensemble: Ensemble, *, n_jobs: int = 1
+) -> EvalReport:
+    """Score ``ensemble`` on ``examples``.
+
+    With ``n_jobs != 1`` examples are evaluated in chunks of ``_EVAL_CHUNK`` across joblib
+    worker processes (``-1``: one per core); the ensemble is pickled without its SBERT
+    model, which each worker loads once.
+    """
+    if n_jobs == 1 or Parallel is None:
+        parts = [_eval_chunk(examples, ensemble)]
+    else:
+        parts = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_eval_chunk)(chunk, ensemble) for chunk in _example_chunks(examples)
+        )
+    tp = fp = fn = 0
+    per_type: dict[PIIType, list[int]] = {t: [0, 0, 0] for t in ALL_PII_TYPES}
+    for tpc, fpc, fnc, per_type_c in parts:
+        tp, fp, fn = tp + tpc, fp + fpc, fn + fnc
+        for t, counts in per_type_c.items():
+            acc = per_type[t]
+            for k in range(3):
+                acc[k] += counts[k]
     per_type_scores: dict[PIIType, dict[str, float]] = {}
     for t, (tpi, fpi, fni) in per_type.items():
         per_type_scores[t] = _prf(tpi, fpi, fni)
@@ -80,19 +142,24 @@ def run_eval(examples: Iterable[LabeledExample], ensemble: Ensemble) -> EvalRepo
 def calibrate_on_dataset(examples: list[LabeledExample], embed: EmbedModel) -> Calibrator:
     # Compute raw scores (pre-calibration) using rule + ner + embed
     ensemble = Ensemble(embed=embed, calibrator=Calibrator.identity())
-    raw_scores: list[dict[PIIType, float]] = []
+    # One (n, K) matrix per example; per-candidate dicts are never built
+    raw_scores: list[np.ndarray] = []
     labels: list[PIIType | None] = []
-    for ex in examples:
-        cands = propose_candidates(ex.text)
-        scores, _, _ = ensemble.raw_scores(ex.text, cands)
-        # For calibration we need true label per candidate: pick exact match if exists
-        gold = ex.labels
-        for c, sc in zip(cands, scores, strict=False):
-            lbl: PIIType | None = None
-            for gs, gt in gold:
-                if c.span.start < gs.end and gs.start < c.span.end:
-                    lbl = gt
-                    break
-            raw_scores.append(sc)
-            labels.append(lbl)
-    return fit_calibrator(raw_scores, labels)
+    for chunk in _example_chunks(examples):
+        items = [(ex.text, propose_candidates(ex.text)) for ex in chunk]
+        # Score the chunk at once so NER/embedding batches span examples
+        for (scores, _, _), ex, (_, cands) in zip(
+            ensemble.raw_score_batch(items), chunk, items, strict=True
+        ):
+            raw_scores.append(scores)
+            # For calibration we need true label per candidate: pick exact match if exists
+            gold = ex.labels
+            for c in cands:
+                lbl: PIIType | None = None
+                for gs, gt in gold:
+                    if c.span.start < gs.end and gs.start < c.span.end:
+                        lbl = gt
+                        break
+                labels.append(lbl)
+    M = np.vstack(raw_scores) if raw_scores else np.zeros((0, len(ALL_PII_TYPES)))
+    return fit_calibrator(M, labels)
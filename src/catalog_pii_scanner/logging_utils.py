@@ -2,13 +2,20 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 import sys
 import time
 import uuid
 from collections.abc import Iterator
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any, cast
 
+try:  # fast JSON encoder; stdlib json is the fallback
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 from .pii_types import Span
 from .redaction import mask_token, redact_text
 
@@ -56,6 +63,34 @@ def get_correlation_id() -> str | None:
         return None
 
 
+# Standard LogRecord attributes that are never copied into the JSON payload
+_RESERVED_RECORD_KEYS: frozenset[str] = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+    }
+)
+_SCALAR_TYPES = (int, float, bool)
+
+
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:  # noqa: D401
         # Build a minimal JSON structure
@@ -81,39 +116,78 @@ class JsonFormatter(logging.Formatter):
 
         # Include extras that don't collide with defaults
         for k, v in record.__dict__.items():
-            if k in {
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-            }:
+            if k in _RESERVED_RECORD_KEYS:
                 continue
             if k not in payload:
-                try:
-                    json.dumps(v)
-                    payload[k] = v
-                except Exception:
-                    payload[k] = str(v)
-        return json.dumps(payload, ensure_ascii=False)
+                payload[k] = v
+        # Values the encoder cannot serialize are rendered with str()
+        if orjson is not None:
+            try:
+                return cast(
+                    str, orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+                )
+            except Exception:  # pragma: no cover - e.g. ints beyond 64 bits
+                pass
+        return json.dumps(payload, ensure_ascii=False, default=str)
 
 
 _LOGGER_NAME = "catalog_pii_scanner"
+# Bytes of formatted records held before they are written to stderr in one call
+_LOG_BUFFER = 1 << 16
+
+
+class _BufferedStderrHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """Stream handler that batches records into ~64 KiB writes to stderr.
+
+    Records at ERROR and above flush immediately, as does ``logging.shutdown`` at exit.
+    Buffered records go to the ``sys.stderr`` that was current when they were logged;
+    if stderr is redirected (test capture, CLI runners) the buffer is flushed first.
+    """
+
+    def __init__(self, buffer_size: int = _LOG_BUFFER) -> None:
+        super().__init__(stream=sys.stderr)
+        self.buffer_size = buffer_size
+        self._buf = bytearray()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        if sys.stderr is not self.stream:
+            self.flush()
+            self.stream = sys.stderr
+        self._buf += line.encode("utf-8", "backslashreplace")
+        if record.levelno >= logging.ERROR or len(self._buf) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if not self._buf:
+                return
+            data = bytes(self._buf)
+            self._buf.clear()
+            stream = self.stream
+            raw = getattr(stream, "buffer", None)
+            try:
+                if raw is not None:
+                    stream.flush()
+                    raw.write(data)
+                    raw.flush()
+                else:
+                    stream.write(data.decode("utf-8", "replace"))
+                    stream.flush()
+            except (OSError, ValueError):  # pragma: no cover - stderr closed at shutdown
+                pass
+        finally:
+            self.release()
+
+
+_HANDLER: _BufferedStderrHandler | None = None
+# The configured logger; get_logger sets it up once and returns it afterwards
+_LOGGER: logging.Logger | None = None
 
 
 class _CorrelationFilter(logging.Filter):
@@ -126,16 +200,22 @@ class _CorrelationFilter(logging.Filter):
 
 
 def get_logger() -> logging.Logger:
+    global _HANDLER, _LOGGER
+    if _LOGGER is not None:
+        return _LOGGER
     logger = logging.getLogger(_LOGGER_NAME)
+    if _HANDLER is None:
+        _HANDLER = _BufferedStderrHandler()
+        _HANDLER.setFormatter(JsonFormatter())
     # Ensure single configured StreamHandler to stderr with JSON + correlation filter
-    # Remove existing StreamHandlers to avoid stdout pollution in CLI outputs
-    to_remove = [h for h in logger.handlers if isinstance(h, logging.StreamHandler)]
+    # Remove other StreamHandlers to avoid stdout pollution in CLI outputs
+    to_remove = [
+        h for h in logger.handlers if isinstance(h, logging.StreamHandler) and h is not _HANDLER
+    ]
     for h in to_remove:
         logger.removeHandler(h)
-
-    handler = logging.StreamHandler(stream=sys.stderr)
-    handler.setFormatter(JsonFormatter())
-    logger.addHandler(handler)
+    if _HANDLER not in logger.handlers:
+        logger.addHandler(_HANDLER)
     # Add correlation filter so caplog records include id
     if not any(isinstance(f, _CorrelationFilter) for f in logger.filters):
         logger.addFilter(_CorrelationFilter())
@@ -143,9 +223,16 @@ def get_logger() -> logging.Logger:
         logger.setLevel(logging.INFO)
     # Allow propagation so test capture (caplog) can see records
     logger.propagate = True
+    _LOGGER = logger
     return logger
 
 
+def _reset_logger_for_tests() -> None:
+    """Forget the configured logger so the next :func:`get_logger` sets it up again."""
+    global _LOGGER
+    _LOGGER = None
+
+
 def _dedupe_spans(spans: list[Span] | None) -> list[Span]:
     if not spans:
         return []
@@ -158,28 +245,74 @@ def _dedupe_spans(spans: list[Span] | None) -> list[Span]:
     return out
 
 
+@lru_cache(maxsize=256)
+def _span_pattern(texts: frozenset[str]) -> re.Pattern[str]:
+    # Longest first, so a span that contains another is matched whole
+    return re.compile("|".join(map(re.escape, sorted(texts, key=len, reverse=True))))
+
+
 def _scrub_string(s: str, spans: list[Span]) -> str:
-    out = s
-    for sp in spans:
-        if sp.text:
-            out = out.replace(sp.text, mask_token(sp.text))
-    return out
+    texts = frozenset(sp.text for sp in spans if sp.text)
+    if not texts:
+        return s
+    masks: dict[str, str] = {}
+
+    def _mask(m: re.Match[str]) -> str:
+        raw = m.group(0)
+        masked = masks.get(raw)
+        if masked is None:
+            masked = masks[raw] = mask_token(raw)
+        return masked
+
+    # One left-to-right pass over the string for all spans
+    return _span_pattern(texts).sub(_mask, s)
+
+
+# Characters JSON escapes; a span containing one would not appear verbatim in a dump
+_JSON_ESCAPED = re.compile(r'["\\\x00-\x1f]')
+
+
+def _has_span_text(obj: dict[Any, Any] | list[Any], spans: list[Span]) -> bool:
+    """Whether any span text occurs anywhere in ``obj``, found with one serialize and search.
+
+    Conservative: returns True whenever the dump cannot be trusted to contain span texts
+    verbatim, so callers fall back to the recursive scrub.
+    """
+    texts = frozenset(sp.text for sp in spans if sp.text)
+    if not texts:
+        return False
+    if orjson is None or any(_JSON_ESCAPED.search(t) for t in texts):
+        return True
+    try:
+        blob = orjson.dumps(obj).decode()
+    except Exception:
+        return True
+    return _span_pattern(texts).search(blob) is not None
 
 
 def _scrub_obj(obj: Any, spans: list[Span]) -> Any:
+    if isinstance(obj, (dict, list)) and not _has_span_text(obj, spans):
+        # Nothing to mask (the usual case): skip the per-node walk
+        return obj
+    return _scrub_node(obj, spans)
+
+
+def _scrub_node(obj: Any, spans: list[Span]) -> Any:
     if obj is None:
         return None
     if isinstance(obj, str):
         return _scrub_string(obj, spans)
-    if isinstance(obj, int | float | bool):
+    if isinstance(obj, _SCALAR_TYPES):
         return obj
     if isinstance(obj, list):
-        return [_scrub_obj(x, spans) for x in obj]
+        return [_scrub_node(x, spans) for x in obj]
     if isinstance(obj, tuple):  # pragma: no cover - rare
-        return tuple(_scrub_obj(x, spans) for x in obj)
+        return tuple(_scrub_node(x, spans) for x in obj)
     if isinstance(obj, dict):
-        return {k: _scrub_obj(v, spans) for k, v in obj.items()}
+        return {k: _scrub_node(v, spans) for k, v in obj.items()}
     try:  # pragma: no cover - fallback
+        if orjson is not None:
+            return orjson.loads(orjson.dumps(obj))
         return json.loads(json.dumps(obj))
     except Exception:
         return str(obj)
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:  # pragma: no cover - typing only
     import spacy  # type: ignore
-except Exception:  # pragma: no cover - optional dependency
-    spacy = None  # type: ignore
 
 from .config import NERConfig
 from .pii_types import PIIType, Span
@@ -18,7 +20,10 @@ from .rules import EMAIL_RE, PHONE_US_RE
 
 @lru_cache(maxsize=8)
 def _load_spacy(model: str | None, language: str = "en") -> spacy.Language | None:
-    if spacy is None:
+    # spaCy is imported on first use only: importing it dominates cold start
+    try:
+        import spacy  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency
         return None
     try:
         if model:
@@ -32,6 +37,23 @@ def _load_spacy(model: str | None, language: str = "en") -> spacy.Language | Non
             return None
 
 
+# Only entity labels are consumed downstream, so the other components are skipped
+_DISABLED_PIPES = ["tagger", "lemmatizer", "parser", "attribute_ruler"]
+_PIPE_BATCH = 64
+# Worker start-up costs more than it saves below this many texts
+_MULTIPROCESS_MIN_TEXTS = 2000
+
+
+def _pipe_docs(nlp: spacy.Language, texts: Sequence[str]) -> Iterator[object]:
+    """Stream docs for ``texts`` with the unused pipeline components disabled."""
+    n_process = 1
+    if len(texts) > _MULTIPROCESS_MIN_TEXTS:
+        n_process = max(1, (os.cpu_count() or 1) // 2)
+    return iter(
+        nlp.pipe(texts, disable=_DISABLED_PIPES, batch_size=_PIPE_BATCH, n_process=n_process)
+    )
+
+
 # ---------------- Public datatypes ----------------
 
 
@@ -80,8 +102,7 @@ class SpaCyProvider(NERProvider):
                 out.append(spans)
             return out
 
-        docs = list(nlp.pipe(texts, disable=["tagger", "lemmatizer"]))
-        for text, doc in zip(texts, docs, strict=False):
+        for text, doc in zip(texts, _pipe_docs(nlp, texts), strict=False):
             spans = []
             # PERSON via spaCy ents
             for ent in getattr(doc, "ents", []) or []:
@@ -231,11 +252,42 @@ def merge_with_rules(
 # ---------------- Context-level signals (existing) ----------------
 
 
+# Sanitized context -> signals; the same windows recur across rows, retries and re-scans
+_CTX_SIGNAL_CACHE_SIZE = 4096
+_ctx_signal_cache: OrderedDict[str, dict[str, float]] = OrderedDict()
+_ctx_signal_lock = threading.Lock()
+
+
+def clear_ner_cache() -> None:
+    """Drop memoized context signals (e.g. after swapping the spaCy model)."""
+    with _ctx_signal_lock:
+        _ctx_signal_cache.clear()
+
+
+def _signals_from_doc(doc: object) -> dict[str, float]:
+    # Basic counts of entity labels in context
+    label_counts: dict[str, int] = {}
+    for ent in getattr(doc, "ents", []) or []:
+        label_counts[ent.label_] = label_counts.get(ent.label_, 0) + 1
+    # Map some context labels/keywords to PIIType hints
+    mapped: dict[str, float] = {}
+    if label_counts:
+        total = sum(label_counts.values())
+        # PERSON context may support PERSON label
+        mapped[PIIType.PERSON.value] = label_counts.get("PERSON", 0) / total
+        # DATE context may support DATE
+        mapped[PIIType.DATE.value] = label_counts.get("DATE", 0) / total
+        # ORG context near emails often occurs, weak signal
+        mapped[PIIType.EMAIL.value] = label_counts.get("ORG", 0) / total * 0.5
+    return mapped
+
+
 def ner_context_signals(context_texts: dict[int, str]) -> dict[int, dict[str, float]]:
     """Run spaCy NER on sanitized context windows only.
 
     Returns a per-candidate dict of soft signals derived from context entity labels.
     This function never sees raw PII; contexts are expected to be redacted upstream.
+    Signals are memoized per context string, so only unseen contexts reach spaCy.
     """
     nlp = _load_spacy(model=None, language="en")
     signals: dict[int, dict[str, float]] = {}
@@ -244,21 +296,23 @@ def ner_context_signals(context_texts: dict[int, str]) -> dict[int, dict[str, fl
             signals[k] = {}
         return signals
 
-    docs = list(nlp.pipe(context_texts.values(), disable=["tagger", "lemmatizer"]))
-    for (idx, _ctx), doc in zip(context_texts.items(), docs, strict=False):
-        # Basic counts of entity labels in context
-        label_counts: dict[str, int] = {}
-        for ent in getattr(doc, "ents", []) or []:
-            label_counts[ent.label_] = label_counts.get(ent.label_, 0) + 1
-        # Map some context labels/keywords to PIIType hints
-        mapped: dict[str, float] = {}
-        if label_counts:
-            total = sum(label_counts.values())
-            # PERSON context may support PERSON label
-            mapped[PIIType.PERSON.value] = label_counts.get("PERSON", 0) / total
-            # DATE context may support DATE
-            mapped[PIIType.DATE.value] = label_counts.get("DATE", 0) / total
-            # ORG context near emails often occurs, weak signal
-            mapped[PIIType.EMAIL.value] = label_counts.get("ORG", 0) / total * 0.5
-        signals[idx] = mapped
+    found: dict[str, dict[str, float]] = {}
+    with _ctx_signal_lock:
+        for ctx in context_texts.values():
+            hit = _ctx_signal_cache.get(ctx)
+            if hit is not None:
+                _ctx_signal_cache.move_to_end(ctx)
+                found[ctx] = hit
+    missing = list(dict.fromkeys(c for c in context_texts.values() if c not in found))
+    if missing:
+        for ctx, doc in zip(missing, _pipe_docs(nlp, missing), strict=False):
+            found[ctx] = _signals_from_doc(doc)
+        with _ctx_signal_lock:
+            for ctx in missing:
+                _ctx_signal_cache[ctx] = found[ctx]
+            while len(_ctx_signal_cache) > _CTX_SIGNAL_CACHE_SIZE:
+                _ctx_signal_cache.popitem(last=False)
+    # Copies keep callers from mutating cached entries
+    for idx, ctx in context_texts.items():
+        signals[idx] = dict(found[ctx])
     return signals
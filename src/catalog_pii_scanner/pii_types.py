@@ -32,6 +32,9 @@ ALL_PII_TYPES: tuple[PIIType, ...] = (
     PIIType.ADDRESS,
     PIIType.DATE,
 )
+# Bit ``i`` is ``ALL_PII_TYPES[i]``; also persisted as findings.types_mask, so new types
+# must be appended. Keyed by str: PIIType members and their plain values both look up.
+_TYPE_BIT: dict[str, int] = {t: 1 << i for i, t in enumerate(ALL_PII_TYPES)}
 
 
 @dataclass(frozen=True)
@@ -51,6 +54,15 @@ class Candidate:
     # checksum or structural validations per type (True/False flags)
     validations: dict[PIIType, bool] | None = None
 
+    @property
+    def validations_mask(self) -> int:
+        """Passed validations as a bitmask: bit ``i`` is ``ALL_PII_TYPES[i]``."""
+        mask = 0
+        for t, ok in (self.validations or {}).items():
+            if ok:
+                mask |= _TYPE_BIT[t]
+        return mask
+
 
 @dataclass
 class Prediction:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 
 from .pii_types import Candidate, Span
 
@@ -13,8 +14,20 @@ class Redaction:
     replaced_spans: list[tuple[Span, str]]
 
 
+# ASCII shape mask for str.translate: digits->0, lowercase->x, uppercase->X
+_MASK_TABLE: dict[int, int] = {
+    **{c: ord("0") for c in range(ord("0"), ord("9") + 1)},
+    **{c: ord("x") for c in range(ord("a"), ord("z") + 1)},
+    **{c: ord("X") for c in range(ord("A"), ord("Z") + 1)},
+}
+
+
+# Pure str -> str; the same PII value is typically masked many times per scan and log
+@lru_cache(maxsize=4096)
 def mask_token(token: str) -> str:
     # Preserve shape: digits->0, lowercase->x, uppercase->X, others unchanged
+    if token.isascii():
+        return token.translate(_MASK_TABLE)
     out = []
     for ch in token:
         if ch.isdigit():
@@ -57,16 +70,15 @@ def assert_no_raw_pii_to_models(original: str, redacted: str, spans: Iterable[Sp
 def contexts_for_candidates(
     text: str, candidates: list[Candidate], window: int = 32
 ) -> dict[int, str]:
-    # Build small context windows around each candidate, redacting the candidate itself
-    result: dict[int, str] = {}
+    # Build small context windows around each candidate, redacting the candidate itself.
+    # One redaction pass covers all candidates, so each window is a plain slice: O(N + len(text)).
     spans = [c.span for c in candidates]
     red = redact_text(text, spans)
     assert_no_raw_pii_to_models(text, red.redacted_text, spans)
-    for idx, c in enumerate(candidates):
-        s = c.span
-        left = max(0, s.start - window)
-        right = min(len(text), s.end + window)
-        # Use the already-redacted text to avoid raw PII
-        context = red.redacted_text[left:right]
-        result[idx] = context
-    return result
+    # Use the already-redacted text to avoid raw PII
+    redacted = red.redacted_text
+    n = len(text)
+    return {
+        idx: redacted[max(0, s.start - window) : min(n, s.end + window)]
+        for idx, s in enumerate(spans)
+    }
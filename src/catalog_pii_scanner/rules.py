@@ -28,11 +28,34 @@ PAN_RE = re.compile(r"\b([A-Z]{5}[0-9]{4}[A-Z])\b", flags=re.IGNORECASE)
 # Basic person name (very weak)
 PERSON_RE = re.compile(r"\b([A-Z][a-z]+\s[A-Z][a-z]+)\b")
 
+_HAS_DIGIT = re.compile(r"\d").search
+
 
 # ---------------- Checksums/validators ----------------
 
 
+# Luhn over ASCII bytes: drop non-digits, then map each digit to its value (kept
+# positions) or its doubled-and-reduced value (doubled positions) and sum in C
+_NON_DIGIT_BYTES = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+_LUHN_PLAIN = bytes.maketrans(b"0123456789", bytes(range(10)))
+_LUHN_DOUBLED = bytes.maketrans(b"0123456789", bytes((0, 2, 4, 6, 8, 1, 3, 5, 7, 9)))
+
+
 def luhn_check(number: str) -> bool:
+    if not number.isascii():
+        # Other Unicode digits also count as digits; take the generic path
+        return _luhn_check_unicode(number)
+    b = number.encode("ascii").translate(None, _NON_DIGIT_BYTES)
+    if not (13 <= len(b) <= 19):
+        return False
+    parity = len(b) % 2
+    total = sum(b[parity::2].translate(_LUHN_DOUBLED)) + sum(
+        b[1 - parity :: 2].translate(_LUHN_PLAIN)
+    )
+    return total % 10 == 0
+
+
+def _luhn_check_unicode(number: str) -> bool:
     digits = [int(ch) for ch in re.sub(r"\D", "", number)]
     if not (13 <= len(digits) <= 19):
         return False
@@ -105,17 +128,21 @@ def _enabled(t: PIIType, cfg: RulesConfig | None) -> bool:
 
 def propose_candidates(text: str, cfg: RulesConfig | None = None) -> list[Candidate]:
     cands: list[Candidate] = []
+    # Patterns may overlap across types, so each keeps its own pass; cheap substring
+    # checks skip the passes that cannot match (most patterns need a digit)
+    digits = _HAS_DIGIT(text) is not None
+    dash = "-" in text
     # Order matters a bit; add specific patterns first
-    if _enabled(PIIType.EMAIL, cfg):
+    if "@" in text and _enabled(PIIType.EMAIL, cfg):
         for span in find_regex(text, EMAIL_RE):
             cands.append(Candidate(span=span, rule_label=PIIType.EMAIL, rule_confidence=0.95))
-    if _enabled(PIIType.PHONE_NUMBER, cfg):
+    if digits and _enabled(PIIType.PHONE_NUMBER, cfg):
         for span in find_regex(text, PHONE_US_RE):
             cands.append(
                 Candidate(span=span, rule_label=PIIType.PHONE_NUMBER, rule_confidence=0.85)
             )
     # Credit cards: validate with Luhn
-    if _enabled(PIIType.CREDIT_CARD, cfg):
+    if digits and _enabled(PIIType.CREDIT_CARD, cfg):
         for span in find_regex(text, CC_RE):
             cc_ok = luhn_check(span.text)
             if cc_ok:
@@ -127,16 +154,16 @@ def propose_candidates(text: str, cfg: RulesConfig | None = None) -> list[Candid
                         validations={PIIType.CREDIT_CARD: True},
                     )
                 )
-    if _enabled(PIIType.SSN, cfg):
+    if digits and dash and _enabled(PIIType.SSN, cfg):
         for span in find_regex(text, SSN_RE):
             cands.append(Candidate(span=span, rule_label=PIIType.SSN, rule_confidence=0.9))
-    if _enabled(PIIType.IP_ADDRESS, cfg):
+    if digits and "." in text and _enabled(PIIType.IP_ADDRESS, cfg):
         for span in find_regex(text, IPV4_RE):
             cands.append(Candidate(span=span, rule_label=PIIType.IP_ADDRESS, rule_confidence=0.9))
-    if _enabled(PIIType.MAC_ADDRESS, cfg):
+    if (dash or ":" in text) and _enabled(PIIType.MAC_ADDRESS, cfg):
         for span in find_regex(text, MAC_RE):
             cands.append(Candidate(span=span, rule_label=PIIType.MAC_ADDRESS, rule_confidence=0.9))
-    if _enabled(PIIType.AADHAAR, cfg):
+    if digits and _enabled(PIIType.AADHAAR, cfg):
         for span in find_regex(text, AADHAAR_RE):
             if verhoeff_check(span.text):
                 cands.append(
@@ -147,11 +174,11 @@ def propose_candidates(text: str, cfg: RulesConfig | None = None) -> list[Candid
                         validations={PIIType.AADHAAR: True},
                     )
                 )
-    if _enabled(PIIType.PAN, cfg):
+    if digits and _enabled(PIIType.PAN, cfg):
         for span in find_regex(text, PAN_RE):
             # Compiled regex is already strict; set label
             cands.append(Candidate(span=span, rule_label=PIIType.PAN, rule_confidence=0.9))
-    if _enabled(PIIType.DATE, cfg):
+    if digits and (dash or "/" in text) and _enabled(PIIType.DATE, cfg):
         for span in find_regex(text, DATE_RE):
             # Boost if near DOB keywords
             left = max(0, span.start - 8)
@@ -9,3 +9,10 @@ def test_healthz() -> None:
     assert resp.status_code == 200
     data = resp.json()
     assert data["status"] == "ok"
+
+
+def test_create_app_factory() -> None:
+    from catalog_pii_scanner.api import create_app
+
+    resp = TestClient(create_app()).get("/healthz")
+    assert resp.status_code == 200 and resp.json()["status"] == "ok"
@@ -66,7 +66,8 @@ def test_athena_sampler_samples_with_not_ready_then_success() -> None:
         {"QueryExecutionId": "q-123"},
         expected_params={
             "QueryString": (
-                "SELECT email FROM users WHERE email IS NOT NULL ORDER BY rand() LIMIT 2"
+                "SELECT email FROM (SELECT email FROM users TABLESAMPLE BERNOULLI(1)"
+                " WHERE email IS NOT NULL LIMIT 8) ORDER BY rand() LIMIT 2"
             ),
             "WorkGroup": ANY,
             "QueryExecutionContext": {"Database": "demo"},
@@ -129,3 +130,79 @@ def test_athena_sampler_samples_with_not_ready_then_success() -> None:
         sampler.close()
         s_ath.deactivate()
         s_glu.deactivate()
+
+
+class _PagedAthena:
+    def __init__(self) -> None:
+        self.tokens: list[str | None] = []
+
+    def get_query_results(self, **kw: Any) -> dict[str, Any]:
+        token = kw.get("NextToken")
+        self.tokens.append(token)
+        if token is None:
+            rows = [{"Data": [{"VarCharValue": "email"}]}, {"Data": [{"VarCharValue": "a"}]}]
+            return {"ResultSet": {"Rows": rows}, "NextToken": "t2"}
+        return {"ResultSet": {"Rows": [{"Data": [{"VarCharValue": "b"}]}]}}
+
+
+def test_collect_results_follows_prefetched_pages() -> None:
+    fake = _PagedAthena()
+    cfg = AthenaConfig(s3_output="s3://bucket/results/", workgroup="wg")
+    sampler = AthenaSampler(config=cfg, athena_client=fake, glue_client=object())  # type: ignore[arg-type]
+    assert sampler._collect_results("q-1") == [["a"], ["b"]]
+    assert fake.tokens == [None, "t2"]
+
+
+class _ShortSampleAthena:
+    def __init__(self) -> None:
+        self.sql: list[str] = []
+
+    def start_query_execution(self, **kw: Any) -> dict[str, Any]:
+        self.sql.append(kw["QueryString"])
+        return {"QueryExecutionId": f"q-{len(self.sql)}"}
+
+    def get_query_execution(self, **_: Any) -> dict[str, Any]:
+        return _mk_status("SUCCEEDED")
+
+    def get_query_results(self, **kw: Any) -> dict[str, Any]:
+        vals = ["a"] if kw["QueryExecutionId"] == "q-1" else ["a", "b"]
+        rows = [{"Data": [{"VarCharValue": v}]} for v in ["email", *vals]]
+        return {"ResultSet": {"Rows": rows}}
+
+
+def test_sample_column_falls_back_to_full_shuffle_when_sample_is_short() -> None:
+    fake = _ShortSampleAthena()
+    cfg = AthenaConfig(s3_output="s3://bucket/results/", workgroup="wg")
+    sampler = AthenaSampler(config=cfg, athena_client=fake, glue_client=object())  # type: ignore[arg-type]
+    assert sampler.sample_column(database="demo", table="users", column="email", n=2) == [
+        "a",
+        "b",
+    ]
+    assert "TABLESAMPLE BERNOULLI(1)" in fake.sql[0]
+    assert fake.sql[1] == "SELECT email FROM users WHERE email IS NOT NULL ORDER BY rand() LIMIT 2"
+
+
+def test_sample_column_keeps_full_sample_of_duplicates_without_fallback() -> None:
+    class _LowCardinalityAthena(_ShortSampleAthena):
+        def get_query_results(self, **_: Any) -> dict[str, Any]:
+            rows = [{"Data": [{"VarCharValue": v}]} for v in ["status", *["active"] * 5]]
+            return {"ResultSet": {"Rows": rows}}
+
+    fake = _LowCardinalityAthena()
+    cfg = AthenaConfig(s3_output="s3://bucket/results/", workgroup="wg")
+    sampler = AthenaSampler(config=cfg, athena_client=fake, glue_client=object())  # type: ignore[arg-type]
+    got = sampler.sample_column(database="demo", table="users", column="status", n=5)
+    assert got == ["active"]
+    assert len(fake.sql) == 1 and "TABLESAMPLE BERNOULLI" in fake.sql[0]
+
+
+def test_iter_results_maps_null_cells_to_none() -> None:
+    class _NullAthena:
+        def get_query_results(self, **_: Any) -> dict[str, Any]:
+            rows = [{"Data": [{"VarCharValue": "a"}, {"VarCharValue": "b"}]}]
+            rows.append({"Data": [{"VarCharValue": "x"}, {}]})
+            return {"ResultSet": {"Rows": rows}}
+
+    cfg = AthenaConfig(s3_output="s3://bucket/results/", workgroup="wg")
+    sampler = AthenaSampler(config=cfg, athena_client=_NullAthena(), glue_client=object())  # type: ignore[arg-type]
+    assert list(sampler._iter_results("q")) == [["x", None]]
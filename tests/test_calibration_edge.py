@@ -1,3 +1,7 @@
+from pathlib import Path
+
+import numpy as np
+
 from catalog_pii_scanner.ensemble import fit_calibrator
 from catalog_pii_scanner.pii_types import ALL_PII_TYPES, PIIType
 
@@ -11,3 +15,39 @@ def test_fit_calibrator_all_positive_class_guard() -> None:
     assert PIIType.EMAIL in calib.models
     a, b = calib.models[PIIType.EMAIL]
     assert (a, b) == (1.0, 0.0)
+
+
+def test_fit_calibrator_accepts_score_matrix() -> None:
+    rng = np.random.default_rng(0)
+    M = rng.random((40, len(ALL_PII_TYPES)))
+    labels: list[PIIType | None] = [
+        PIIType.EMAIL if i % 3 == 0 else None if i % 3 == 1 else PIIType.SSN for i in range(40)
+    ]
+    dicts = [dict(zip(ALL_PII_TYPES, row, strict=True)) for row in M.tolist()]
+    assert fit_calibrator(M, labels).models == fit_calibrator(dicts, labels).models
+
+
+def test_calibrator_call_matches_matrix_and_logistic() -> None:
+    import math
+
+    from catalog_pii_scanner.ensemble import Calibrator
+
+    calib = Calibrator(models={PIIType.EMAIL: (2.0, -1.0), PIIType.SSN: (-50.0, 3.0)})
+    out = calib({PIIType.SSN: 40.0, PIIType.EMAIL: 0.25, PIIType.PAN: 0.5})
+    assert list(out) == [PIIType.SSN, PIIType.EMAIL, PIIType.PAN]
+    assert out[PIIType.SSN] == 0.0  # saturates instead of overflowing
+    assert math.isclose(out[PIIType.EMAIL], 1 / (1 + math.exp(0.5)))
+    assert math.isclose(out[PIIType.PAN], 1 / (1 + math.exp(-0.5)))
+    row = calib.matrix(np.full((1, len(ALL_PII_TYPES)), 0.25))[0]
+    assert math.isclose(row[ALL_PII_TYPES.index(PIIType.EMAIL)], out[PIIType.EMAIL])
+
+
+def test_calibrator_npz_round_trip_and_legacy_joblib(tmp_path: Path) -> None:
+    from catalog_pii_scanner.ensemble import Calibrator
+
+    calib = Calibrator(models={t: (float(i), -0.5 * i) for i, t in enumerate(ALL_PII_TYPES)})
+    calib.save(str(tmp_path / "calibrator.npz"))
+    calib.save(str(tmp_path / "calibrator.joblib"))
+    assert Calibrator.load(str(tmp_path / "calibrator.npz")).models == calib.models
+    assert Calibrator.load(str(tmp_path / "calibrator.joblib")).models == calib.models
+    assert Calibrator.load(str(tmp_path / "missing.npz")) == Calibrator.identity()
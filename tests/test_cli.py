@@ -1,3 +1,4 @@
+import pytest
 from typer.testing import CliRunner
 
 from catalog_pii_scanner.cli import app
@@ -10,3 +11,106 @@ def test_cli_help() -> None:
     assert "Catalog PII Scanner CLI" in result.stdout
     assert "scan" in result.stdout
     assert "serve" in result.stdout
+
+
+def test_apply_tags_parallel_serializes_within_table() -> None:
+    import threading
+    import time
+
+    from catalog_pii_scanner.cli import _apply_tags_parallel
+
+    lock = threading.Lock()
+    active: dict[str, int] = {}
+    overlaps: list[str] = []
+    seen: list[tuple[str, int]] = []
+
+    def apply_one(item: tuple[str, int]) -> None:
+        tbl = item[0]
+        with lock:
+            active[tbl] = active.get(tbl, 0) + 1
+            if active[tbl] > 1:
+                overlaps.append(tbl)
+        time.sleep(0.005)
+        with lock:
+            active[tbl] -= 1
+            seen.append(item)
+
+    items = [(t, i) for t in ("a", "b", "c") for i in range(4)]
+
+    def apply_batch(group: list[tuple[str, int]]) -> None:
+        assert len({t for t, _ in group}) == 1
+        for item in group:
+            apply_one(item)
+
+    _apply_tags_parallel(apply_batch, items, table_key=lambda it: it[0], max_in_flight=3)
+    assert sorted(seen) == sorted(items)
+    assert not overlaps
+    # Per-table order is preserved
+    assert [i for t, i in seen if t == "b"] == [0, 1, 2, 3]
+
+
+def test_apply_tags_parallel_serializes_split_table_runs() -> None:
+    import threading
+    import time
+
+    from catalog_pii_scanner.cli import _apply_tags_parallel
+
+    lock = threading.Lock()
+    active: dict[str, int] = {}
+    overlaps: list[str] = []
+    batches: list[list[tuple[str, int]]] = []
+
+    def apply_batch(group: list[tuple[str, int]]) -> None:
+        tbl = group[0][0]
+        with lock:
+            active[tbl] = active.get(tbl, 0) + 1
+            if active[tbl] > 1:
+                overlaps.append(tbl)
+        time.sleep(0.01)
+        with lock:
+            active[tbl] -= 1
+            batches.append(group)
+
+    # No row-order guarantee: each table shows up in several runs
+    items = [(t, i) for i in range(3) for t in ("a", "b")]
+    _apply_tags_parallel(apply_batch, items, table_key=lambda it: it[0], max_in_flight=4)
+    assert len(batches) == 6
+    assert not overlaps
+
+
+def test_parse_target_patterns() -> None:
+    from catalog_pii_scanner.cli import _parse_target
+
+    assert _parse_target("*", 2) == (("*",), ("*",))
+    assert _parse_target("sales/", 2) == (("sales",), ("*",))
+    assert _parse_target(" demo/*/users ", 3) == (("demo",), ("*",), ("users",))
+    assert _parse_target("a/b/c/d", 2) == (("a",), ("b",))
+
+
+def test_serve_uses_app_factory(monkeypatch: pytest.MonkeyPatch) -> None:
+    import uvicorn
+
+    calls: list[tuple[str, dict]] = []
+    monkeypatch.setattr(uvicorn, "run", lambda app_path, **kw: calls.append((app_path, kw)))
+    runner = CliRunner()
+    assert runner.invoke(app, ["serve", "--workers", "3"]).exit_code == 0
+    assert runner.invoke(app, ["serve", "--reload"]).exit_code == 0
+    (path, kw), (_, kw_reload) = calls
+    assert path == "catalog_pii_scanner.api:create_app" and kw["factory"] is True
+    assert kw["workers"] == 3 and kw_reload["workers"] is None and kw_reload["reload"] is True
+    assert kw["loop"] in {"uvloop", "auto"} and kw["http"] in {"httptools", "auto"}
+
+
+def test_apply_tags_single_writer_stays_on_calling_thread() -> None:
+    import threading
+
+    from catalog_pii_scanner.cli import _apply_tags_parallel
+
+    threads: set[int] = set()
+
+    def apply_batch(group: list[tuple[str, int]]) -> None:
+        threads.add(threading.get_ident())
+
+    items = [("a", 0), ("a", 1), ("b", 0)]
+    _apply_tags_parallel(apply_batch, items, table_key=lambda it: it[0], max_in_flight=1)
+    assert threads == {threading.get_ident()}
@@ -38,3 +38,53 @@ def test_cli_train_calibrate_eval(tmp_path: Path) -> None:
     r4 = runner.invoke(app, ["eval", str(synth), "--model-dir", str(models)])
     assert r4.exit_code == 0
     assert "Micro:" in r4.stdout and "Macro:" in r4.stdout
+
+
+def test_scan_text_impl_matches_command() -> None:
+    from catalog_pii_scanner.cli import scan_text_impl
+
+    os.environ["CPS_OFFLINE"] = "1"
+    text = "Call (415) 555-1212 or mail jane@example.org"
+    result = CliRunner().invoke(app, ["scan-text", text])
+    assert result.exit_code == 0
+    assert scan_text_impl(text) == json.loads(result.stdout)
+
+
+def test_cli_scan_texts_ndjson(tmp_path: Path) -> None:
+    from catalog_pii_scanner.cli import scan_text_impl
+
+    os.environ["CPS_OFFLINE"] = "1"
+    texts = ["Reach me at john.doe@example.com", "SSN 123-45-6789", "nothing here"]
+    src = tmp_path / "in.ndjson"
+    src.write_text(
+        "\n".join(json.dumps({"id": i, "text": t}) for i, t in enumerate(texts)) + "\n\n",
+        encoding="utf-8",
+    )
+    result = CliRunner().invoke(app, ["scan-texts", str(src)])
+    assert result.exit_code == 0, result.output
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["id"] for r in rows] == [0, 1, 2]
+    assert [r["predictions"] for r in rows] == [scan_text_impl(t) for t in texts]
+
+    # stdin input works too
+    piped = CliRunner().invoke(app, ["scan-texts"], input=json.dumps({"text": texts[1]}) + "\n")
+    assert piped.exit_code == 0
+    assert json.loads(piped.stdout) == {"predictions": scan_text_impl(texts[1])}
+
+
+def test_scan_text_probs_list_and_minimal() -> None:
+    from catalog_pii_scanner.cli import _TYPE_ORDER, scan_text_impl
+
+    os.environ["CPS_OFFLINE"] = "1"
+    text = "Reach me at john.doe@example.com"
+    preds = scan_text_impl(text)
+    assert preds
+    for p in preds:
+        assert len(p["probs"]) == len(_TYPE_ORDER)
+        assert _TYPE_ORDER[p["probs"].index(max(p["probs"]))] == p["label"]
+
+    result = CliRunner().invoke(app, ["scan-text", "--minimal", text])
+    assert result.exit_code == 0
+    minimal = json.loads(result.stdout)
+    assert all("probs" not in p for p in minimal)
+    assert [p["label"] for p in minimal] == [p["label"] for p in preds]
@@ -99,3 +99,63 @@ def test_env_overrides_loader(
     assert cfg.ai.mode == "ensemble+llm"
     assert cfg.ai.ner.enabled is False
     assert cfg.ai.llm.provider == "openai"
+
+
+def test_load_config_cache_tracks_file_and_env(
+    tmp_path: Path, valid_config_yaml: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    cfg_path = _write(tmp_path / "config.yaml", valid_config_yaml)
+    first = load_config_from_file(cfg_path)
+    assert load_config_from_file(cfg_path) is first
+
+    monkeypatch.setenv("CPS_AI__MODE", "rules")
+    assert load_config_from_file(cfg_path).ai.mode == "rules"
+    monkeypatch.delenv("CPS_AI__MODE")
+
+    _write(cfg_path, valid_config_yaml.replace("mode: ensemble", "mode: ensemble+llm"))
+    st = cfg_path.stat()
+    os.utime(cfg_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_config_from_file(cfg_path).ai.mode == "ensemble+llm"
+
+
+def test_deep_update_merges_nested_mappings() -> None:
+    from catalog_pii_scanner.config import _deep_update
+
+    dst = {"ai": {"ner": {"enabled": True, "language": "en"}, "mode": "rules"}}
+    _deep_update(dst, {"ai": {"ner": {"enabled": False}, "llm": {"enabled": True}}})
+    assert dst == {
+        "ai": {
+            "ner": {"enabled": False, "language": "en"},
+            "mode": "rules",
+            "llm": {"enabled": True},
+        }
+    }
+
+
+def test_env_override_value_coercion() -> None:
+    from catalog_pii_scanner.config import _parse_env_overrides
+
+    env = [
+        ("CPS_A__T", "Yes"),
+        ("CPS_A__F", "off"),
+        ("CPS_A__I", " -42 "),
+        ("CPS_A__X", "0.5"),
+        ("CPS_A__S", "1.2.3"),
+        ("CPS_A__E", "1e3"),
+    ]
+    assert _parse_env_overrides("CPS_", env) == {
+        "a": {"t": True, "f": False, "i": -42, "x": 0.5, "s": "1.2.3", "e": "1e3"}
+    }
+
+
+def test_default_sections_are_independent_copies() -> None:
+    from catalog_pii_scanner.config import AIConfig
+
+    a, b = AIConfig(), AIConfig()
+    a.ner.enabled = False
+    a.embeddings.features.from_samples = False
+    assert b.ner.enabled is True
+    assert b.embeddings.features.from_samples is True
+    assert b.ensemble.weights.rules == 0.4
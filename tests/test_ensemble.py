@@ -1,4 +1,7 @@
 import os
+from pathlib import Path
+
+import pytest
 
 from catalog_pii_scanner.embeddings import EmbedModel
 from catalog_pii_scanner.ensemble import Calibrator, Ensemble
@@ -19,3 +22,117 @@ def test_ensemble_predict_per_type_probs_and_labels() -> None:
         # If rule_label is given, it should dominate in this simple case
         if c.rule_label is not None:
             assert p.label == c.rule_label
+
+
+def test_offline_embeddings_are_deterministic_text_features() -> None:
+    os.environ["CPS_OFFLINE"] = "1"
+    model = EmbedModel()
+    X = model.encode(["john.doe@example.com", "john.doe@example.com", "123-45-6789"])
+    assert X.shape == (3, 32)
+    assert (X[0] == X[1]).all() and not (X[0] == X[2]).all()
+    assert model.encode([]).shape == (0, 32)
+
+
+def test_folded_linear_predict_matches_per_class_pipelines() -> None:
+    import numpy as np
+
+    from catalog_pii_scanner.datasets import generate_synthetic
+    from catalog_pii_scanner.embeddings import _class_proba
+
+    os.environ["CPS_OFFLINE"] = "1"
+    ds = generate_synthetic(n=60, seed=5)
+    texts = [s.text for ex in ds for s, _ in ex.labels]
+    labels = [t for ex in ds for _, t in ex.labels]
+    model = EmbedModel()
+    model.fit(texts, labels)
+    probs = model.predict_proba(texts[:20])
+    assert model._clf is not None and model._linear is not None
+    X = model.encode(texts[:20])
+    expected = np.column_stack([_class_proba(est, X) for est in model._clf])
+    got = np.array([list(probs[i].values()) for i in range(20)])
+    assert np.allclose(got, expected, atol=1e-6)
+
+
+def test_npz_classifier_round_trips_and_legacy_joblib_still_loads(tmp_path: Path) -> None:
+    import numpy as np
+
+    from catalog_pii_scanner.datasets import generate_synthetic
+
+    os.environ["CPS_OFFLINE"] = "1"
+    ds = generate_synthetic(n=60, seed=5)
+    texts = [s.text for ex in ds for s, _ in ex.labels]
+    labels = [t for ex in ds for _, t in ex.labels]
+    model = EmbedModel()
+    model.fit(texts, labels)
+    expected = model.predict_proba_matrix(texts[:20])
+    model.save(str(tmp_path / "embed.npz"))
+    model.save(str(tmp_path / "embed.joblib"))
+
+    npz = EmbedModel(clf_path=str(tmp_path / "embed.npz"))
+    assert np.allclose(npz.predict_proba_matrix(texts[:20]), expected, atol=1e-5)
+    assert npz._clf is None and npz._linear is not None
+    assert npz._linear[0].dtype == np.float32
+    legacy = EmbedModel(clf_path=str(tmp_path / "embed.joblib"))
+    assert np.allclose(legacy.predict_proba_matrix(texts[:20]), expected, atol=1e-6)
+
+
+def test_sbert_encodings_are_deduplicated_and_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    import numpy as np
+
+    calls: list[list[str]] = []
+
+    class _FakeSBERT:
+        def encode(self, texts: list[str], **_: object) -> np.ndarray:
+            calls.append(list(texts))
+            return np.array([[float(len(t)), 1.0] for t in texts])
+
+    monkeypatch.delenv("CPS_OFFLINE", raising=False)
+    model = EmbedModel(cache_size=2)
+    model._sbert = _FakeSBERT()
+    X = model.encode(["a", "bb", "a", "a"])
+    assert X[:, 0].tolist() == [1.0, 2.0, 1.0, 1.0]
+    model.encode(["bb", "ccc"])
+    assert calls == [["a", "bb"], ["ccc"]]
+    assert list(model._emb_cache) == ["bb", "ccc"]  # LRU bound evicted "a"
+
+
+def test_ensemble_skips_all_work_without_candidates() -> None:
+    class _NoEmbed(EmbedModel):
+        def predict_proba_matrix(self, texts):  # type: ignore[no-untyped-def]
+            raise AssertionError("no candidates: nothing to embed")
+
+    ens = Ensemble(embed=_NoEmbed(), calibrator=Calibrator.identity())
+    assert ens.predict("no pii here", []) == []
+    assert ens.raw_scores("no pii here", []) == ([], {}, {})
+
+
+def test_predict_batch_embeds_once_and_matches_predict() -> None:
+    os.environ["CPS_OFFLINE"] = "1"
+    calls: list[int] = []
+
+    class _CountingEmbed(EmbedModel):
+        def predict_proba_matrix(self, texts):  # type: ignore[no-untyped-def]
+            calls.append(len(texts))
+            return super().predict_proba_matrix(texts)
+
+    texts = ["mail a@b.com now", "no pii", "call (415) 555-1212 or x@y.org"]
+    items = [(t, propose_candidates(t)) for t in texts]
+    ens = Ensemble(embed=_CountingEmbed(), calibrator=Calibrator.identity())
+    batch = ens.predict_batch(items)
+    assert calls == [sum(len(c) for _, c in items)]
+    assert batch == [ens.predict(t, c) for t, c in items]
+
+
+def test_validation_boosts_come_from_bitmask() -> None:
+    import numpy as np
+
+    from catalog_pii_scanner.pii_types import ALL_PII_TYPES, Candidate, PIIType, Span
+
+    span = Span(start=0, end=4, text="4111")
+    checked = Candidate(span=span, validations={PIIType.CREDIT_CARD: True, PIIType.SSN: False})
+    assert checked.validations_mask == 1 << ALL_PII_TYPES.index(PIIType.CREDIT_CARD)
+    ens = Ensemble(embed=EmbedModel(), calibrator=Calibrator.identity())
+    zeros = np.zeros((2, len(ALL_PII_TYPES)))
+    S = ens._score_matrix([Candidate(span=span), checked], {}, zeros)
+    assert S[0].tolist() == [0.0] * len(ALL_PII_TYPES)
+    assert S[1, ALL_PII_TYPES.index(PIIType.CREDIT_CARD)] == 0.2 and S[1].sum() == 0.2
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Any
+
+from catalog_pii_scanner.datasets import LabeledExample
+from catalog_pii_scanner.eval import _match, run_eval
+from catalog_pii_scanner.pii_types import PIIType, Prediction, Span
+
+
+def _pred(start: int, end: int, label: PIIType) -> Prediction:
+    return Prediction(span=Span(start=start, end=end, text=""), probs={}, label=label, score=1.0)
+
+
+def test_match_takes_first_unused_overlapping_gold_of_same_type() -> None:
+    gold = [
+        (Span(start=0, end=10, text=""), PIIType.EMAIL),
+        (Span(start=5, end=8, text=""), PIIType.PHONE_NUMBER),
+        (Span(start=2, end=4, text=""), PIIType.EMAIL),
+    ]
+    preds = [_pred(3, 6, PIIType.EMAIL), _pred(3, 6, PIIType.EMAIL), _pred(7, 9, PIIType.SSN)]
+    tp, fp, fn, per_type = _match(preds, gold)
+    assert (tp, fp, fn) == (2, 1, 1)
+    assert per_type[PIIType.EMAIL] == (2, 0, 0)
+    assert per_type[PIIType.PHONE_NUMBER] == (0, 0, 1)
+
+
+def test_run_eval_matches_spans_within_each_example() -> None:
+    class _Echo:
+        """Predicts an EMAIL at 0..5 in every text."""
+
+        def predict_batch(self, items: Any) -> list[list[Prediction]]:
+            return [[_pred(0, 5, PIIType.EMAIL)] for _ in items]
+
+    examples = [
+        LabeledExample(text="aaaaa", labels=[]),
+        LabeledExample(text="bbbbb", labels=[(Span(start=0, end=5, text=""), PIIType.EMAIL)]),
+    ]
+    rep = run_eval(examples, _Echo())  # type: ignore[arg-type]
+    # The first example's prediction cannot claim the second example's gold span
+    assert rep.per_type[PIIType.EMAIL]["precision"] == 0.5
+    assert rep.per_type[PIIType.EMAIL]["recall"] == 1.0
+
+
+def test_run_eval_parallel_matches_serial() -> None:
+    import os
+
+    from catalog_pii_scanner.datasets import generate_synthetic
+    from catalog_pii_scanner.embeddings import EmbedModel
+    from catalog_pii_scanner.ensemble import Calibrator, Ensemble
+
+    os.environ["CPS_OFFLINE"] = "1"
+    ds = generate_synthetic(n=150, seed=3)
+    ens = Ensemble(embed=EmbedModel(), calibrator=Calibrator.identity())
+    serial = run_eval(ds, ens)
+    parallel = run_eval(iter(ds), ens, n_jobs=2)
+    assert parallel == serial
@@ -38,3 +38,64 @@ def test_backoff_succeeds_after_throttle_retries(monkeypatch: pytest.MonkeyPatch
     cli = GlueCatalogClient(boto3_client=flaky, max_retries=3, base_delay=0.01)
     dbs = cli.list_databases()
     assert dbs == ["demo"]
+
+
+class _PagedGlue:
+    def __init__(self) -> None:
+        self.pages: list[str | None] = []
+
+    def get_databases(self, **kw: Any) -> dict:
+        token = kw.get("NextToken")
+        self.pages.append(token)
+        if token is None:
+            return {"DatabaseList": [{"Name": "a"}], "NextToken": "p2"}
+        return {"DatabaseList": [{"Name": "b"}]}
+
+
+def test_iter_databases_is_lazy_across_pages() -> None:
+    fake = _PagedGlue()
+    cli = GlueCatalogClient(boto3_client=fake)
+    it = cli.iter_databases()
+    assert next(it) == "a"
+    assert fake.pages == [None]
+    assert list(it) == ["b"]
+    assert fake.pages == [None, "p2"]
+
+
+def test_compile_patterns_matches_like_fnmatch() -> None:
+    from catalog_pii_scanner.connectors._common import compile_patterns
+
+    assert compile_patterns(None) is None
+    assert compile_patterns(["sales", "*"]) is None
+    match = compile_patterns(["sales", "hr_*"])
+    assert match is not None
+    assert [n for n in ("sales", "sales2", "hr_x", "hr") if match(n)] == ["sales", "hr_x"]
+
+
+def test_boto3_clients_are_shared_per_key() -> None:
+    pytest.importorskip("boto3")
+    from catalog_pii_scanner.connectors._common import cached_boto3_client
+
+    a = cached_boto3_client("glue", region_name="us-east-1")
+    assert cached_boto3_client("glue", region_name="us-east-1") is a
+    assert cached_boto3_client("glue", region_name="eu-west-1") is not a
+
+
+class _CatalogGlue:
+    def get_databases(self, **_: Any) -> dict:
+        return {"DatabaseList": [{"Name": f"db{i}"} for i in range(5)]}
+
+    def get_tables(self, *, DatabaseName: str, **_: Any) -> dict:  # noqa: N803
+        cols = [{"Name": "id"}, {"Name": "email"}]
+        return {
+            "TableList": [
+                {"Name": f"t{j}", "StorageDescriptor": {"Columns": cols}} for j in range(2)
+            ]
+        }
+
+
+def test_iter_columns_concurrent_matches_serial_order() -> None:
+    cli = GlueCatalogClient(boto3_client=_CatalogGlue())
+    serial = [c.ref for c in cli.iter_columns(["db*"], ["t1"])]
+    assert len(serial) == 10
+    assert [c.ref for c in cli.iter_columns_concurrent(["db*"], ["t1"], workers=2)] == serial
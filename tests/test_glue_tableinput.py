@@ -72,3 +72,58 @@ def test_table_to_input_strips_read_only_and_unknown_keys() -> None:
         "SkewedColumnValues",
         "SkewedColumnValueLocationMaps",
     }
+
+
+class _TableGlue:
+    def __init__(self) -> None:
+        self.updates: list[dict[str, Any]] = []
+        self.kwargs: list[dict[str, Any]] = []
+        cols = [{"Name": n, "Type": "string"} for n in ("email", "phone", "id")]
+        self.table: dict[str, Any] = {"Name": "users", "StorageDescriptor": {"Columns": cols}}
+
+    def get_table(self, **_: Any) -> dict[str, Any]:
+        return {"Table": self.table}
+
+    def update_table(self, **kw: Any) -> dict[str, Any]:
+        self.kwargs.append(kw)
+        self.updates.append(kw["TableInput"])
+        return {}
+
+
+def test_update_column_tags_batch_issues_single_update() -> None:
+    from catalog_pii_scanner.connectors.glue import GlueCatalogClient
+
+    fake = _TableGlue()
+    client = GlueCatalogClient(boto3_client=fake)
+    changed = client.update_column_tags_batch(
+        database="demo",
+        table="users",
+        updates={
+            "email": (True, ["EMAIL"], None),
+            "phone": (True, ["PHONE"], "pii"),
+            "x": (True, None, None),
+        },
+    )
+    assert changed == ["email", "phone"]
+    assert len(fake.updates) == 1
+    assert fake.kwargs[0]["SkipArchive"] is True
+    cols = {c["Name"]: c for c in fake.updates[0]["StorageDescriptor"]["Columns"]}
+    assert cols["email"]["Parameters"] == {"pii": "true", "pii_types": "EMAIL"}
+    assert cols["phone"]["Comment"] == "pii"
+    assert "Parameters" not in cols["id"]
+    # Source table is left untouched
+    assert "Parameters" not in fake.table["StorageDescriptor"]["Columns"][0]
+
+
+def test_update_column_tags_skips_write_when_payload_is_unchanged() -> None:
+    from catalog_pii_scanner.connectors.glue import GlueCatalogClient
+
+    fake = _TableGlue()
+    full = "x" * 255
+    fake.table["StorageDescriptor"]["Columns"][0].update(Parameters={"pii": "true"}, Comment=full)
+    client = GlueCatalogClient(boto3_client=fake, skip_archive=False)
+    # The appended comment is truncated away, leaving the table as it was
+    assert not client.update_column_tags(
+        database="demo", table="users", column="email", pii=True, append_comment="pii"
+    )
+    assert fake.updates == []
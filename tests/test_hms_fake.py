@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import json
-from time import time
+import threading
+from time import sleep, time
 from typing import Any, cast
 
 import pytest
@@ -138,3 +139,134 @@ def test_hms_enumerate_and_writeback_fake(monkeypatch: Any) -> None:
     tbl2 = fake.get_table("demo", "users")
     col2 = next(c for c in getattr(tbl2.sd, "cols", []) if c.name == "email")
     assert (col2.comment or "").count("PII detected") == 1
+
+
+class _SingleSocketFakeHMS(_FakeHMS):
+    """Records any overlap between calls, as they would interleave on one Thrift socket."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._guard = threading.Lock()
+        self._active = 0
+        self.overlaps = 0
+
+    def _enter(self) -> None:
+        with self._guard:
+            self._active += 1
+            if self._active > 1:
+                self.overlaps += 1
+
+    def _leave(self) -> None:
+        with self._guard:
+            self._active -= 1
+
+    def get_table(self, db: str, name: str) -> Any:
+        self._enter()
+        try:
+            sleep(0.005)
+            return super().get_table(db, name)
+        finally:
+            self._leave()
+
+    def alter_table(self, db: str, name: str, new_table: Any) -> None:
+        self._enter()
+        try:
+            sleep(0.005)
+            super().alter_table(db, name, new_table)
+        finally:
+            self._leave()
+
+
+def test_hms_writeback_never_shares_the_socket_across_threads(monkeypatch: Any) -> None:
+    fake = _SingleSocketFakeHMS()
+    fake.create_database("demo")
+    for name in ("a", "b", "c", "d"):
+        fake.create_simple_table("demo", name)
+    client = HiveMetastoreClient(raw_client=fake)  # type: ignore[arg-type]
+    monkeypatch.setattr("catalog_pii_scanner.cli.HiveMetastoreClient", lambda: client)
+    res = CliRunner().invoke(app, ["scan", "--target", "hms://*", "--apply", "--type", "EMAIL"])
+    assert res.exit_code == 0, res.output
+    assert fake.overlaps == 0
+    assert all(
+        fake.get_table("demo", n).parameters.get("cps.pii.col.email") == "true"
+        for n in ("a", "b", "c", "d")
+    )
+
+
+class _BulkFakeHMS(_FakeHMS):
+    def __init__(self) -> None:
+        super().__init__()
+        self.bulk_calls: list[list[str]] = []
+
+    def get_table(self, db: str, name: str) -> Any:
+        raise AssertionError("per-table get_table should not be used")
+
+    def get_table_objects_by_name(self, db: str, names: list[str]) -> list[Any]:
+        self.bulk_calls.append(list(names))
+        # Out of order, as a real metastore may return them
+        return [self._dbs[db][n] for n in reversed(names) if n in self._dbs[db]]
+
+
+def test_hms_iter_columns_fetches_tables_in_batches() -> None:
+    fake = _BulkFakeHMS()
+    fake.create_database("demo")
+    for name in ("a", "b", "c"):
+        fake.create_simple_table("demo", name)
+    client = HiveMetastoreClient(raw_client=fake, batch_size=2)  # type: ignore[arg-type]
+    refs = [c.ref for c in client.iter_columns()]
+    assert fake.bulk_calls == [["a", "b"], ["c"]]
+    assert refs[:2] == ["hms://demo/a/id", "hms://demo/a/email"]
+    assert len(refs) == 6
+
+
+def test_hms_writeback_after_scan_reuses_fetched_table() -> None:
+    fake = _BulkFakeHMS()
+    fake.create_database("demo")
+    fake.create_simple_table("demo", "a")
+    client = HiveMetastoreClient(raw_client=fake)  # type: ignore[arg-type]
+    list(client.iter_columns())
+
+    def _no_get(db: str, name: str) -> Any:
+        raise AssertionError("table was already fetched by the scan")
+
+    fake.get_table = _no_get  # type: ignore[method-assign]
+    alters: list[str] = []
+    real_alter = fake.alter_table
+
+    def _alter(db: str, name: str, new_table: Any) -> None:
+        alters.append(name)
+        real_alter(db, name, new_table)
+
+    fake.alter_table = _alter  # type: ignore[method-assign]
+    changed = client.update_column_tags_batch(
+        database="demo",
+        table="a",
+        updates={c: (True, ["EMAIL"], "PII detected") for c in ("id", "email")},
+    )
+    assert changed == ["id", "email"]
+    assert alters == ["a"]
+    props = fake._dbs["demo"]["a"].parameters
+    assert props["cps.pii.col.id"] == props["cps.pii.col.email"] == "true"
+
+
+def test_hms_iter_columns_pushes_simple_patterns_to_metastore() -> None:
+    fake = _BulkFakeHMS()
+    for db in ("demo_a", "other"):
+        fake.create_database(db)
+        fake.create_simple_table(db, "users")
+    seen: list[tuple[str, ...]] = []
+
+    def get_databases(pattern: str) -> list[str]:
+        seen.append(("db", pattern))
+        return [d for d in fake.get_all_databases() if d.startswith("demo_")]
+
+    def get_tables(db: str, pattern: str) -> list[str]:
+        seen.append(("tbl", db, pattern))
+        return fake.get_all_tables(db)
+
+    fake.get_databases = get_databases  # type: ignore[attr-defined]
+    fake.get_tables = get_tables  # type: ignore[attr-defined]
+    client = HiveMetastoreClient(raw_client=fake)  # type: ignore[arg-type]
+    refs = {c.ref for c in client.iter_columns(["demo_*"], ["users"])}
+    assert refs == {"hms://demo_a/users/id", "hms://demo_a/users/email"}
+    assert seen == [("db", "demo_*"), ("tbl", "demo_a", "users")]
@@ -66,3 +66,77 @@ def test_logs_are_json_and_redacted(caplog: pytest.LogCaptureFixture) -> None:
         flat = json.dumps(obj)
         for pii in raw_pii:
             assert pii not in flat
+
+
+def test_formatter_stringifies_unserializable_extras() -> None:
+    rec = logging.LogRecord("x", logging.INFO, __file__, 1, {"event": "é"}, None, None)
+    rec.obj = object()
+    rec.items = {1: "a"}
+    s = JsonFormatter().format(rec)
+    assert "é" in s  # non-ASCII is not escaped
+    obj = json.loads(s)
+    assert obj["event"] == "é" and obj["obj"].startswith("<object object")
+    assert obj["items"] == {"1": "a"}
+
+
+def test_buffered_handler_writes_on_error_or_full_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    import io
+
+    from catalog_pii_scanner.logging_utils import _BufferedStderrHandler
+
+    err = io.StringIO()
+    monkeypatch.setattr("sys.stderr", err)
+    handler = _BufferedStderrHandler(buffer_size=200)
+    handler.setFormatter(JsonFormatter())
+
+    def emit(level: int, event: str) -> None:
+        handler.handle(logging.LogRecord("x", level, __file__, 1, {"event": event}, None, None))
+
+    emit(logging.INFO, "one")
+    assert err.getvalue() == ""
+    emit(logging.ERROR, "two")
+    assert [json.loads(line)["event"] for line in err.getvalue().splitlines()] == ["one", "two"]
+    for i in range(5):
+        emit(logging.INFO, f"n{i}")
+    assert 2 < len(err.getvalue().splitlines()) < 7  # flushed once the buffer filled
+    handler.flush()
+    assert len(err.getvalue().splitlines()) == 7
+
+
+def test_get_logger_configures_once() -> None:
+    from catalog_pii_scanner.logging_utils import _reset_logger_for_tests
+
+    logger = get_logger()
+    extra = logging.StreamHandler()
+    logger.addHandler(extra)
+    try:
+        assert get_logger() is logger and extra in logger.handlers  # cached: no reconfigure
+        _reset_logger_for_tests()
+        assert get_logger() is logger and extra not in logger.handlers
+    finally:
+        logger.removeHandler(extra)
+
+
+def test_scrub_string_masks_all_spans_in_one_pass() -> None:
+    from catalog_pii_scanner.logging_utils import _scrub_string
+    from catalog_pii_scanner.pii_types import Span
+
+    spans = [Span(0, 0, "0a"), Span(0, 0, "a0a"), Span(0, 0, ""), Span(0, 0, "Bob")]
+    # The longer span wins where both match, so no raw character is left behind
+    assert _scrub_string("a0a and Bob.", spans) == "x0x and Xxx."
+    assert _scrub_string("nothing here", spans) == "nothing here"
+    assert _scrub_string("x", []) == "x"
+
+
+def test_scrub_obj_skips_walk_only_when_no_span_occurs() -> None:
+    from catalog_pii_scanner.logging_utils import _scrub_obj
+    from catalog_pii_scanner.pii_types import Span
+
+    clean = {"n": 3, "examples": ["x0x", {"k": "ok"}]}
+    assert _scrub_obj(clean, [Span(0, 3, "Bob")]) is clean
+    assert _scrub_obj({"ex": ["hi Bob"], "n": 3}, [Span(0, 3, "Bob")]) == {
+        "ex": ["hi Xxx"],
+        "n": 3,
+    }
+    # Span texts that JSON escapes are never trusted to the serialized search
+    assert _scrub_obj({"q": 'say "hi"'}, [Span(0, 4, '"hi"')]) == {"q": 'say "xx"'}
@@ -78,3 +78,26 @@ def test_spacy_smoke_email_phone_detection() -> None:
     assert PIIType.EMAIL in labs
     assert PIIType.PHONE_NUMBER in labs
     # PERSON may be present if spaCy model available; don't assert
+
+
+def test_context_signals_are_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    from types import SimpleNamespace
+
+    from catalog_pii_scanner import ner
+
+    piped: list[str] = []
+
+    class _FakeNLP:
+        def pipe(self, texts: Sequence[str], **_kw: object) -> list[SimpleNamespace]:
+            piped.extend(texts)
+            return [SimpleNamespace(ents=[SimpleNamespace(label_="PERSON")]) for _ in texts]
+
+    monkeypatch.setattr(ner, "_load_spacy", lambda model, language="en": _FakeNLP())
+    ner.clear_ner_cache()
+    first = ner.ner_context_signals({0: "call [REDACTED]", 1: "call [REDACTED]", 2: "on [DATE]"})
+    assert piped == ["call [REDACTED]", "on [DATE]"]
+    first[0][PIIType.PERSON.value] = 0.0
+    again = ner.ner_context_signals({5: "call [REDACTED]"})
+    assert piped == ["call [REDACTED]", "on [DATE]"]
+    assert again == {5: {"PERSON": 1.0, "DATE": 0.0, "EMAIL": 0.0}}
+    ner.clear_ner_cache()
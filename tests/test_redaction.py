@@ -1,3 +1,4 @@
+from catalog_pii_scanner.pii_types import Span
 from catalog_pii_scanner.redaction import contexts_for_candidates, redact_text
 from catalog_pii_scanner.rules import propose_candidates
 
@@ -23,3 +24,20 @@ def test_contexts_are_sanitized() -> None:
     ctxs = contexts_for_candidates(text, cands)
     for i, c in enumerate(cands):
         assert c.span.text not in ctxs[i]
+
+
+def test_mask_token_ascii_and_unicode_shapes() -> None:
+    from catalog_pii_scanner.redaction import mask_token
+
+    assert mask_token("Jo.Doe+42@x.io") == "Xx.Xxx+00@x.xx"
+    assert mask_token("José ٣") == "Xxxx 0"  # non-ASCII letters and digits are masked too
+
+
+def test_mask_token_is_memoized() -> None:
+    from catalog_pii_scanner.redaction import mask_token
+
+    mask_token.cache_clear()
+    redact_text("a@b.co or a@b.co", [Span(0, 6, "a@b.co"), Span(10, 16, "a@b.co")])
+    info = mask_token.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    mask_token.cache_clear()
@@ -20,3 +20,7 @@ def test_propose_candidates_basic() -> None:
 def test_luhn_check_valid_and_invalid() -> None:
     assert luhn_check("4111 1111 1111 1111")
     assert not luhn_check("4111 1111 1111 1112")
+    assert luhn_check("378282246310005") and not luhn_check(
+        "4111-1111-1111"
+    )  # odd length; too short
+    assert luhn_check("٤١١١ ١١١١ ١١١١ ١١١١")  # non-ASCII digits take the generic path
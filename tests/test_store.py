@@ -95,6 +95,54 @@ def test_crud_and_cli_export(tmp_path: Path) -> None:
         "scanned_at",
         "source",
     }
+    assert "Wrote 2 findings" in rj.stdout
+    assert len(out_csv.read_text().strip().splitlines()) == 3
+
+    # Streaming JSON to stdout stays a valid document
+    rs = runner.invoke(app, ["export", "--format", "json", "--db", db_url])
+    assert rs.exit_code == 0
+    assert [d["id"] for d in json.loads(rs.stdout)] == [d["id"] for d in data]
+
+
+def test_export_empty_store(tmp_path: Path) -> None:
+    runner = CliRunner()
+    r = runner.invoke(app, ["export", "--format", "json", "--db", _sqlite_url(tmp_path)])
+    assert r.exit_code == 0
+    assert json.loads(r.stdout) == []
+
+
+def test_sqlite_file_engine_uses_wal(tmp_path: Path) -> None:
+    from sqlalchemy import text
+
+    from catalog_pii_scanner.db import create_engine_for_url
+
+    engine = create_engine_for_url(_sqlite_url(tmp_path))
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+
+def test_in_memory_store_is_shared_across_sessions_and_threads() -> None:
+    import threading
+
+    from sqlalchemy import func, select
+
+    from catalog_pii_scanner.db import Column
+
+    Session = init_db("sqlite:///:memory:")
+    with session_scope(Session) as s:
+        upsert_column(s, "c", "s", "t", "a")
+    counts: list[int] = []
+
+    def count() -> None:
+        with session_scope(Session) as s:
+            counts.append(s.scalar(select(func.count()).select_from(Column)) or 0)
+
+    worker = threading.Thread(target=count)
+    worker.start()
+    worker.join()
+    count()
+    assert counts == [1, 1]
 
 
 def test_postgres_ddl_smoke() -> None:
@@ -108,3 +156,199 @@ def test_postgres_ddl_smoke() -> None:
         sql = str(CreateTable(table).compile(dialect=dialect))
         # Basic sanity: CREATE TABLE and table name appear
         assert sql.startswith("\nCREATE TABLE") and table.name in sql
+
+
+def test_add_findings_bulk_upserts_columns(tmp_path: Path) -> None:
+    from sqlalchemy import func, select
+
+    from catalog_pii_scanner.db import Column, Finding, add_findings_bulk
+
+    Session = init_db(_sqlite_url(tmp_path))
+    rows = [
+        ("glue", "db1", "users", "email", "string"),
+        ("glue", "db1", "users", "phone", "string"),
+        ("glue", "db2", "events", "ip", None),
+    ]
+    with session_scope(Session) as s:
+        n = add_findings_bulk(
+            s, rows, types=["PII"], confidence=0.9, hit_rate=0.5, model_version="v1", source="t"
+        )
+        assert n == 3
+    with session_scope(Session) as s:
+        # Re-run updates column metadata in place and appends new findings
+        add_findings_bulk(
+            s,
+            [("glue", "db2", "events", "ip", "string")],
+            types=["IP_ADDRESS"],
+            confidence=0.8,
+            hit_rate=0.1,
+            model_version="v2",
+            source="t",
+        )
+    with session_scope(Session) as s:
+        assert s.execute(select(func.count()).select_from(Column)).scalar_one() == 3
+        assert s.execute(select(func.count()).select_from(Finding)).scalar_one() == 4
+        ip = s.execute(select(Column).where(Column.name == "ip")).scalar_one()
+        assert ip.data_type == "string" and ip.ref == "glue.db2.events.ip"
+        refs = set(s.execute(select(Finding.column_ref)).scalars())
+        assert refs == {"glue.db1.users.email", "glue.db1.users.phone", "glue.db2.events.ip"}
+
+
+def test_upsert_columns_batches_parents_and_keeps_metadata(tmp_path: Path) -> None:
+    from sqlalchemy import event
+
+    from catalog_pii_scanner.db import Column, upsert_columns
+
+    Session = init_db(_sqlite_url(tmp_path))
+    rows = [("c", "s", f"t{i % 3}", f"col{i}", "string", f"d{i}") for i in range(9)]
+    statements: list[str] = []
+    with session_scope(Session) as s:
+        event.listen(s.get_bind(), "before_cursor_execute", lambda *a: statements.append(a[2]))
+        ids = upsert_columns(s, rows)
+    assert len(set(ids.values())) == 9
+    # catalog, schema and table levels: select + insert + re-select each; one column upsert
+    assert len(statements) == 10
+
+    with session_scope(Session) as s:
+        again = upsert_columns(
+            s, [("c", "s", "t0", "col0", None, None), ("c", "s", "t0", "new", "int", None)]
+        )
+        assert again[("c", "s", "t0", "col0")] == ids[("c", "s", "t0", "col0")]
+        col0 = s.get(Column, again[("c", "s", "t0", "col0")])
+        assert col0 is not None and (col0.data_type, col0.description) == ("string", "d0")
+        assert upsert_column(s, "c", "s", "t0", "col0", description="x").description == "x"
+
+
+def test_add_findings_inserts_resolved_rows(tmp_path: Path) -> None:
+    from sqlalchemy import select
+
+    from catalog_pii_scanner.db import add_findings, upsert_columns
+
+    Session = init_db(_sqlite_url(tmp_path))
+    with session_scope(Session) as s:
+        ids = upsert_columns(
+            s, [("c", "s", "t", "a", None, None), ("c", "s", "t", "b", None, None)]
+        )
+        rows = [(cid, ".".join(k), ["EMAIL"], 0.5, 0.25) for k, cid in ids.items()]
+        assert add_findings(s, rows, model_version="v", source="t") == 2
+        assert add_findings(s, [], model_version="v", source="t") == 0
+    with session_scope(Session) as s:
+        found = s.execute(select(Finding.column_ref, Finding.types)).all()
+        assert sorted(found) == [("c.s.t.a", ["EMAIL"]), ("c.s.t.b", ["EMAIL"])]
+
+
+def test_iter_findings_flat_builds_no_orm_objects(tmp_path: Path) -> None:
+    from catalog_pii_scanner.db import add_findings, iter_findings_flat, upsert_columns
+
+    Session = init_db(_sqlite_url(tmp_path))
+    with session_scope(Session) as s:
+        ids = upsert_columns(s, [("c", "s", "t", f"c{i}", None, None) for i in range(5)])
+        rows = [(cid, ".".join(k), ["EMAIL"], 0.5, 0.25) for k, cid in ids.items()]
+        add_findings(s, rows, model_version="v", source="t")
+    with session_scope(Session) as s:
+        flat = list(iter_findings_flat(s, batch_size=2))
+        assert len(s.identity_map) == 0
+    assert sorted(r.column_ref for r in flat) == [f"c.s.t.c{i}" for i in range(5)]
+    assert all(r.types == ["EMAIL"] and r.model_version == "v" for r in flat)
+
+
+def test_findings_with_refs_preloads_column_path(tmp_path: Path) -> None:
+    from sqlalchemy import event
+
+    from catalog_pii_scanner.db import add_findings_bulk, findings_with_refs
+
+    Session = init_db(_sqlite_url(tmp_path))
+    with session_scope(Session) as s:
+        cols = [("c", "s", f"t{i % 3}", f"col{i}", None) for i in range(9)]
+        add_findings_bulk(
+            s, cols, types=["EMAIL"], confidence=0.5, hit_rate=0.1, model_version="v", source="t"
+        )
+    statements: list[str] = []
+    with session_scope(Session) as s:
+        event.listen(s.get_bind(), "before_cursor_execute", lambda *a: statements.append(a[2]))
+        refs = sorted(f.column.ref for f in s.execute(findings_with_refs()).scalars())
+    # One query for findings plus one per relationship level, independent of row count
+    assert len(statements) == 5
+    assert refs[0] == "c.s.t0.col0" and len(refs) == 9
+
+
+def test_filter_by_type_uses_types_mask(tmp_path: Path) -> None:
+    from sqlalchemy import select
+
+    from catalog_pii_scanner.db import add_findings, filter_by_type, upsert_columns
+    from catalog_pii_scanner.pii_types import PIIType
+
+    Session = init_db(_sqlite_url(tmp_path))
+    with session_scope(Session) as s:
+        ids = upsert_columns(s, [("c", "s", "t", n, None, None) for n in ("a", "b", "c")])
+        types = {"a": ["EMAIL"], "b": ["EMAIL", "SSN"], "c": ["SSN"]}
+        rows = [(cid, k[3], types[k[3]], 0.5, 0.1) for k, cid in ids.items()]
+        add_findings(s, rows, model_version="v", source="t")
+    with session_scope(Session) as s:
+        stmt = select(Finding.column_ref)
+        assert sorted(s.scalars(filter_by_type(stmt, PIIType.SSN))) == ["b", "c"]
+        assert sorted(s.scalars(filter_by_type(stmt, "EMAIL"))) == ["a", "b"]
+        assert list(s.scalars(filter_by_type(stmt, PIIType.PAN))) == []
+
+
+def test_init_db_backfills_types_mask_on_old_store(tmp_path: Path) -> None:
+    import sqlite3
+
+    from sqlalchemy import select
+
+    from catalog_pii_scanner.db import filter_by_type
+
+    path = tmp_path / "old.db"
+    con = sqlite3.connect(path)
+    con.executescript("""
+        CREATE TABLE findings (id INTEGER PRIMARY KEY, column_id INTEGER, types JSON,
+            confidence FLOAT, hit_rate FLOAT, model_version VARCHAR(64),
+            scanned_at DATETIME, source VARCHAR(64), column_ref VARCHAR(1024));
+        INSERT INTO findings VALUES (1, 1, '["EMAIL"]', 0.5, 0.1, 'v', '2024-01-01', 't', 'x');
+        INSERT INTO findings VALUES (2, 1, '["SSN"]', 0.5, 0.1, 'v', '2024-01-01', 't', 'y');
+        """)
+    con.close()
+    Session = init_db(f"sqlite:///{path}")
+    init_db(f"sqlite:///{path}")  # second run finds the column and does nothing
+    with session_scope(Session) as s:
+        assert list(s.scalars(filter_by_type(select(Finding.column_ref), "SSN"))) == ["y"]
+
+
+def test_upsert_column_caches_parent_ids_per_session(tmp_path: Path) -> None:
+    from sqlalchemy import event
+
+    Session = init_db(_sqlite_url(tmp_path))
+    statements: list[str] = []
+    with session_scope(Session) as s:
+        upsert_column(s, "c", "s", "t", "a")
+        event.listen(s.get_bind(), "before_cursor_execute", lambda *a: statements.append(a[2]))
+        upsert_column(s, "c", "s", "t", "b")
+    # Only the column upsert (and the identity-map refresh) reached the database
+    assert statements and all(" catalogs" not in q and " schemas" not in q for q in statements)
+    assert all("tables" not in q for q in statements)
+    with Session() as s:
+        upsert_column(s, "c", "s", "t2", "x")
+        s.rollback()
+        upsert_column(s, "c", "s", "t2", "x")  # cached ids of rolled-back rows are dropped
+        s.commit()
+        assert upsert_column(s, "c", "s", "t2", "x").ref == "c.s.t2.x"
+
+
+def test_cli_repl_runs_commands_in_one_process(tmp_path: Path) -> None:
+    db_url = _sqlite_url(tmp_path)
+    script = "\n".join(
+        [
+            "# seed two findings then export",
+            f"scan --dry-run --db {db_url} --column a --type EMAIL",
+            f"scan --dry-run --db {db_url} --column b --type SSN",
+            "export --format bogus",
+            f"export --format csv --db {db_url}",
+            "exit",
+            f"scan --dry-run --db {db_url} --column never",
+        ]
+    )
+    r = CliRunner().invoke(app, ["repl"], input=script + "\n")
+    assert r.exit_code == 0, r.output
+    assert "--format must be 'json' or 'csv'" in r.output
+    csv_lines = [ln for ln in r.stdout.splitlines() if ln.startswith(("id,", "1,", "2,", "3,"))]
+    assert len(csv_lines) == 3  # header + two findings; nothing after "exit"
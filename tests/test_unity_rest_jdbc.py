@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Generator
 from typing import Any, cast
 
+import pytest
 from typer.testing import CliRunner
 
 from catalog_pii_scanner.cli import app
-from catalog_pii_scanner.connectors.unity import UnityCatalogClient
+from catalog_pii_scanner.connectors.unity import UnityCatalogClient, UnityColumn
 
 
 class _FakeResp:
@@ -62,7 +64,10 @@ class _FakeSession:
 
     def patch(self, url: str, json: dict[str, Any]) -> _FakeResp:  # type: ignore[override]
         # apply minimal updates to in-memory registry
-        assert url.endswith("/api/2.1/unity-catalog/tables/demo.public.users")
+        # demob.public.users shares this registry; tables may be patched concurrently
+        assert url.endswith(
+            ("/api/2.1/unity-catalog/tables/demo.public.users", "/tables/demob.public.users")
+        )
         self._patches.append({"url": url, "json": json})
         props = json.get("properties") or {}
         cols = json.get("columns") or []
@@ -168,6 +173,13 @@ class _FakeCursor:
             return (self._comments.get(key),)
         return None
 
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        # Batched comment lookup: (catalog, schema, table, *columns)
+        _, params = self._executed[-1]
+        assert params is not None and "SELECT column_name, comment" in self._last_query
+        cat, sch, tbl, *names = params
+        return [(n, self._comments.get((cat, sch, tbl, n))) for n in names]
+
 
 class _FakeSQLConn:
     def __init__(self, rows: list[tuple[str, str, str, str, str, str | None]]) -> None:
@@ -204,3 +216,281 @@ def test_unity_jdbc_pagination_and_writeback() -> None:
     executed = [q for q, _ in sql.cur._executed]
     assert any(q.startswith("ALTER TABLE demo.public.users SET TBLPROPERTIES") for q in executed)
     assert any(q.startswith("COMMENT ON COLUMN demo.public.users.email IS") for q in executed)
+    # The listing already supplied the comment: no lookup before writing it
+    assert not any(q.startswith("SELECT column_name, comment") for q in executed)
+
+
+def test_unity_invalidate_drops_listed_comments() -> None:
+    rows: list[tuple[str, str, str, str, str, str | None]] = [
+        ("demo", "public", "users", "email", "string", "user email"),
+    ]
+    sql = _FakeSQLConn(rows)
+    client = UnityCatalogClient(sql_conn=sql)
+    list(client.iter_columns(["demo"]))
+    # Edited outside the tool after the listing
+    sql.cur._comments[("demo", "public", "users", "email")] = "contact address"
+    client.invalidate("demo.public.users")
+    client.update_column_tags(
+        catalog="demo",
+        schema="public",
+        table="users",
+        column="email",
+        pii=True,
+        append_comment="PII detected",
+    )
+    comments = [p for q, p in sql.cur._executed if q.startswith("COMMENT ON COLUMN")]
+    assert comments == [("contact address PII detected",)]
+
+
+def test_unity_jdbc_scan_apply_lists_everything_before_writing(monkeypatch: Any) -> None:
+    rows: list[tuple[str, str, str, str, str, str | None]] = [
+        ("demo", "public", "users", "id", "int", None),
+        ("demo", "public", "users", "email", "string", "user email"),
+        ("demo", "public", "orders", "order_id", "int", None),
+        ("demo", "public", "orders", "buyer", "string", None),
+    ]
+    sql = _FakeSQLConn(rows)
+    # One row per fetch: a write landing mid-listing would reset the shared cursor
+    client = UnityCatalogClient(sql_conn=sql, fetch_size=1)
+    monkeypatch.setattr("catalog_pii_scanner.cli.UnityCatalogClient", lambda: client)
+    res = CliRunner().invoke(app, ["scan", "--target", "unity://demo", "--apply"])
+    assert res.exit_code == 0, res.output
+    assert json.loads(res.stdout)["count"] == 4
+    executed = [q for q, _ in sql.cur._executed]
+    assert "FROM system.information_schema.columns" in executed[0]
+    alters = [q for q in executed if q.startswith("ALTER TABLE")]
+    assert [a.split()[2] for a in alters] == ["demo.public.users", "demo.public.orders"]
+
+
+def test_unity_jdbc_batch_writeback_coalesces_properties() -> None:
+    sql = _FakeSQLConn([])
+    client = UnityCatalogClient(sql_conn=sql)
+    changed = client.update_column_tags_batch(
+        catalog="demo",
+        schema="public",
+        table="users",
+        updates={
+            "email": (True, ["EMAIL"], "PII detected"),
+            "phone": (True, ["PHONE_NUMBER"], "PII detected"),
+        },
+    )
+    assert changed == ["email", "phone"]
+    executed = [q for q, _ in sql.cur._executed]
+    alters = [q for q in executed if q.startswith("ALTER TABLE")]
+    assert len(alters) == 1
+    assert "'cps.pii.col.email'='true'" in alters[0]
+    assert "'cps.pii_types.col.phone'='PHONE_NUMBER'" in alters[0]
+    assert sum("information_schema" in q for q in executed) == 1
+    assert sum(q.startswith("COMMENT ON COLUMN") for q in executed) == 2
+
+
+def test_unity_scan_dry_run_persists_findings(monkeypatch: Any, tmp_path: Any) -> None:
+    from catalog_pii_scanner.db import Finding, init_db, session_scope
+
+    client = UnityCatalogClient(host="https://example", token="t", session=_FakeSession())
+    monkeypatch.setattr("catalog_pii_scanner.cli.UnityCatalogClient", lambda: client)
+    db_url = f"sqlite:///{tmp_path / 'cps.db'}"
+    res = CliRunner().invoke(
+        app, ["scan", "--target", "unity://demo", "--dry-run", "--db", db_url, "--type", "EMAIL"]
+    )
+    assert res.exit_code == 0, res.output
+    data = json.loads(res.stdout)
+    with session_scope(init_db(db_url)) as s:
+        refs = sorted(f.column_ref for f in s.query(Finding))
+    assert refs == sorted(f"{c['catalog']}.public.users.{c['column']}" for c in data["columns"])
+
+
+def test_unity_scan_listing_cache(monkeypatch: Any, tmp_path: Any) -> None:
+    client = UnityCatalogClient(host="https://example", token="t", session=_FakeSession())
+    monkeypatch.setattr("catalog_pii_scanner.cli.UnityCatalogClient", lambda: client)
+    args = ["scan", "--target", "unity://demo", "--cache-ttl", "60", "--cache-dir", str(tmp_path)]
+    runner = CliRunner()
+    first = runner.invoke(app, args)
+    assert first.exit_code == 0, first.output
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def _no_client() -> Any:
+        raise AssertionError("listing should be served from the cache")
+
+    monkeypatch.setattr("catalog_pii_scanner.cli.UnityCatalogClient", _no_client)
+    second = runner.invoke(app, args)
+    assert second.exit_code == 0, second.output
+    assert json.loads(second.stdout) == json.loads(first.stdout)
+
+
+def test_unity_rest_concurrent_get_table_keeps_listing_order() -> None:
+    serial = UnityCatalogClient(host="https://example", session=_FakeSession(), rest_workers=1)
+    parallel = UnityCatalogClient(host="https://example", session=_FakeSession(), rest_workers=4)
+    refs = [c.ref for c in serial.iter_columns()]
+    assert refs == [c.ref for c in parallel.iter_columns()]
+    assert refs[0] == "unity://demo/public/users/id"
+
+
+def test_unity_iter_columns_fast_yields_tuples() -> None:
+    from catalog_pii_scanner.connectors.unity import UnityColumn, UnityColumnTuple
+
+    client = UnityCatalogClient(host="https://example", session=_FakeSession())
+    rows = list(client.iter_columns_fast(["demo"]))
+    assert all(isinstance(r, UnityColumnTuple) for r in rows)
+    assert [r.name for r in rows] == ["id", "email"]
+    assert [UnityColumn(*r) for r in rows] == list(client.iter_columns(["demo"]))
+
+
+class _StatementSession:
+    def __init__(self) -> None:
+        self.headers: dict[str, str] = {"Authorization": "Bearer t"}
+        self.posts: list[dict[str, Any]] = []
+        self.link_headers: list[Any] = []
+        self.cancels: list[str] = []
+
+    def post(self, url: str, json: dict[str, Any]) -> _FakeResp:  # type: ignore[override]
+        if url.endswith("/cancel"):
+            self.cancels.append(url)
+            return _FakeResp({})
+        assert url.endswith("/api/2.0/sql/statements")
+        self.posts.append(json)
+        return _FakeResp({"statement_id": "s1", "status": {"state": "PENDING"}})
+
+    def get(self, url: str, params: Any = None, headers: Any = None) -> Any:
+        if url.endswith("/api/2.0/sql/statements/s1"):
+            link = {"external_link": "https://bucket/c0", "next_chunk_internal_link": "/c/1"}
+            return _FakeResp(
+                {"status": {"state": "SUCCEEDED"}, "result": {"external_links": [link]}}
+            )
+        if url.endswith("/c/1"):
+            return _FakeResp({"external_links": [{"external_link": "https://bucket/c1"}]})
+        self.link_headers.append(headers)
+        rows = {
+            "https://bucket/c0": [["demo", "public", "users", "email", "string", None]],
+            "https://bucket/c1": [["other", "public", "users", "id", "int", "pk"]],
+        }[url]
+        return _FakeResp(rows)  # type: ignore[arg-type]
+
+
+def test_unity_statement_api_lists_columns_in_one_query(monkeypatch: Any) -> None:
+    import catalog_pii_scanner.connectors.unity as unity_mod
+
+    monkeypatch.setattr(unity_mod.time, "sleep", lambda _: None)
+    fake = _StatementSession()
+    client = UnityCatalogClient(host="https://example", session=fake, warehouse_id="wh")
+    cols = list(client.iter_columns(["demo"]))
+    assert [c.ref for c in cols] == ["unity://demo/public/users/email"]
+    assert fake.posts[0]["warehouse_id"] == "wh"
+    assert "information_schema.columns" in fake.posts[0]["statement"]
+    # Both chunks were read, without forwarding the bearer token to storage
+    assert fake.link_headers == [{"Authorization": None}] * 2
+    assert fake.cancels == []
+
+
+def test_unity_statement_api_cancels_on_timeout_and_early_stop(monkeypatch: Any) -> None:
+    import catalog_pii_scanner.connectors.unity as unity_mod
+
+    class _StuckSession(_StatementSession):
+        def get(self, url: str, params: Any = None, headers: Any = None) -> Any:
+            return _FakeResp({"status": {"state": "RUNNING"}})
+
+    clock = [0.0]
+
+    def _sleep(s: float) -> None:
+        clock[0] += s
+
+    monkeypatch.setattr(unity_mod.time, "sleep", _sleep)
+    monkeypatch.setattr(unity_mod.time, "monotonic", lambda: clock[0])
+    stuck = _StuckSession()
+    client = UnityCatalogClient(
+        host="https://example", session=stuck, warehouse_id="wh", statement_max_wait_seconds=20
+    )
+    with pytest.raises(TimeoutError):
+        list(client.iter_columns())
+    assert clock[0] == 20
+    assert stuck.cancels == ["https://example/api/2.0/sql/statements/s1/cancel"]
+
+    fake = _StatementSession()
+    client = UnityCatalogClient(host="https://example", session=fake, warehouse_id="wh")
+    # iter_columns hands back the listing generator itself, so closing it reaches the
+    # statement's cleanup right away rather than whenever the garbage collector runs
+    cols = cast(Generator[UnityColumn, None, None], client.iter_columns())
+    next(cols)
+    cols.close()
+    assert fake.cancels == ["https://example/api/2.0/sql/statements/s1/cancel"]
+
+
+def test_unity_get_table_is_cached_until_written() -> None:
+    fake = _FakeSession()
+    gets: list[str] = []
+    orig_get = fake.get
+
+    def counting_get(url: str, params: dict[str, Any] | None = None) -> _FakeResp:
+        gets.append(url)
+        return orig_get(url, params)
+
+    fake.get = counting_get  # type: ignore[method-assign]
+    client = UnityCatalogClient(host="https://example", session=fake)
+    list(client.iter_columns(["demo"]))
+    n = len(gets)
+    # Scan then write: the write reuses the listed table, then drops it from the cache
+    assert client.update_column_tags(
+        catalog="demo", schema="public", table="users", column="email", pii=True
+    )
+    assert len(gets) == n
+    client.get_table("demo.public.users")
+    assert len(gets) == n + 1
+
+    client._cache.ttl = 0  # disabled: every call goes to the server
+    client.get_table("demo.public.users")
+    client.get_table("demo.public.users")
+    assert len(gets) == n + 3
+
+
+def test_unity_rest_columns_share_read_only_properties() -> None:
+    import pytest
+
+    fake = _FakeSession()
+    fake._table["properties"] = {"owner": "data"}
+    client = UnityCatalogClient(host="https://example", session=fake)
+    id_col, email_col = client.iter_columns(["demo"])
+    assert id_col.properties is email_col.properties
+    with pytest.raises(TypeError):
+        id_col.properties["owner"] = "x"  # type: ignore[index]
+
+
+def test_unity_iter_tables_prefetches_pages_and_fills_cache() -> None:
+    fake = _FakeSession()
+    gets: list[Any] = []
+    orig_get = fake.get
+
+    def counting_get(url: str, params: dict[str, Any] | None = None) -> _FakeResp:
+        gets.append(dict(params or {}))
+        return orig_get(url, params)
+
+    fake.get = counting_get  # type: ignore[method-assign]
+    client = UnityCatalogClient(host="https://example", session=fake)
+    it = client.iter_tables("demo", "public")
+    assert next(it) == "users"
+    # Page 2 is requested in the background before page 1 is consumed
+    import time
+
+    deadline = time.monotonic() + 5
+    while len(gets) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [p.get("page_token") for p in gets] == [None, "t2"]
+    assert list(it) == ["users2"]
+    assert client.list_tables("demo", "public") == ["users", "users2"]
+    assert len(gets) == 2
+
+
+def test_unity_rest_decodes_raw_content() -> None:
+    class _BytesResp(_FakeResp):
+        content = b'{"catalogs": [{"name": "raw"}]}'
+
+        def json(self) -> dict[str, Any]:
+            raise AssertionError("raw content should be decoded directly")
+
+    class _Session:
+        headers: dict[str, str] = {}
+
+        def get(self, url: str, params: Any = None) -> _FakeResp:
+            return _BytesResp({})
+
+    client = UnityCatalogClient(host="https://example", session=_Session())
+    assert client.list_catalogs() == ["raw"]